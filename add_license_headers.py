@@ -4,7 +4,10 @@ Script to add Apache 2.0 license headers to Python files.
 """
 
 import os
-from pathlib import Path
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 LICENSE_HEADER = '''# Copyright 2025 MonitorX Team
 #
@@ -22,67 +25,113 @@ LICENSE_HEADER = '''# Copyright 2025 MonitorX Team
 
 '''
 
-def should_add_header(file_path: Path) -> bool:
+_LICENSE_BYTES = LICENSE_HEADER.encode('utf-8')
+
+# License markers always sit at the top of a file, so only the head is scanned
+HEAD_SIZE = 2048
+
+# Either marker means the file already carries a license header
+_MARKER_RE = re.compile(rb'Apache License|Copyright 2025 MonitorX Team')
+
+def _read_head(path: str) -> bytes:
+    """Read the first HEAD_SIZE bytes of a file."""
+    with open(path, 'rb') as f:
+        return f.read(HEAD_SIZE)
+
+def _has_substantial(head: bytes, limit: int = 5) -> bool:
+    """Check for at least `limit` non-blank, non-comment lines, stopping once found."""
+    n = 0
+    for raw in head.splitlines():
+        s = raw.strip()
+        if not s or s.startswith(b'#'):
+            continue
+        n += 1
+        if n >= limit:
+            return True
+    return False
+
+def should_add_header(path: str) -> bool:
     """Check if file should have a license header added."""
+    head = _read_head(path)
+
     # Skip __init__.py files that are just imports
-    if file_path.name == '__init__.py':
-        content = file_path.read_text()
+    if os.path.basename(path) == '__init__.py':
         # Only add if file has substantial content
-        lines = [l for l in content.split('\n') if l.strip() and not l.strip().startswith('#')]
-        if len(lines) < 5:
+        if not _has_substantial(head):
             return False
 
     # Check if header already exists
-    content = file_path.read_text()
-    if 'Apache License' in content or 'Copyright 2025 MonitorX Team' in content:
+    if _MARKER_RE.search(head):
         return False
 
     return True
 
-def add_header(file_path: Path):
+def add_header(path: str):
     """Add license header to a Python file."""
-    content = file_path.read_text()
+    with open(path, 'rb') as f:
+        content = f.read()
 
     # Handle files with shebang
-    if content.startswith('#!'):
-        lines = content.split('\n', 1)
-        new_content = lines[0] + '\n' + LICENSE_HEADER + (lines[1] if len(lines) > 1 else '')
+    if content.startswith(b'#!'):
+        first, _, rest = content.partition(b'\n')
+        new_content = first + b'\n' + _LICENSE_BYTES + rest
     else:
-        # Handle files with docstrings
-        if content.startswith('"""') or content.startswith("'''"):
-            # Find end of docstring
-            quote = '"""' if content.startswith('"""') else "'''"
-            end_idx = content.find(quote, 3)
-            if end_idx != -1:
-                end_idx += 3
-                new_content = LICENSE_HEADER + content
-            else:
-                new_content = LICENSE_HEADER + content
-        else:
-            new_content = LICENSE_HEADER + content
-
-    file_path.write_text(new_content)
-    print(f"✅ Added header to: {file_path}")
+        # The header goes above everything else, module docstrings included
+        new_content = _LICENSE_BYTES + content
+
+    # Write a uniquely named sibling file and swap it in so a failure never
+    # leaves a half-written file; it keeps the original's permission bits
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(new_content)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def iter_py_files(root: str):
+    """Yield paths of .py files under root using os.scandir's cached entry types."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+def process_file(path: str) -> bool:
+    """Add a header to a single file if needed. Returns True if one was added."""
+    if should_add_header(path):
+        add_header(path)
+        return True
+    return False
 
 def main():
     """Add license headers to all Python files."""
-    src_dir = Path('src/monitorx')
-    test_dir = Path('tests')
+    src_dir = 'src/monitorx'
+    test_dir = 'tests'
 
     py_files = []
 
-    # Collect Python files
+    # Collect Python files as plain path strings straight from scandir
     for directory in [src_dir, test_dir]:
-        if directory.exists():
-            py_files.extend(directory.rglob('*.py'))
+        if os.path.isdir(directory):
+            py_files.extend(iter_py_files(directory))
+
+    # Files are independent, so read/write them concurrently; I/O releases the GIL
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        results = list(executor.map(process_file, py_files))
 
-    # Filter and process
+    # Report in collection order once all workers are done
     added = 0
     skipped = 0
 
-    for py_file in py_files:
-        if should_add_header(py_file):
-            add_header(py_file)
+    for py_file, was_added in zip(py_files, results):
+        if was_added:
+            print(f"✅ Added header to: {py_file}")
             added += 1
         else:
             print(f"⏭️  Skipped: {py_file}")
@@ -1,6 +1,8 @@
 """Example: Setting up alert channels for MonitorX."""
 import asyncio
 import os
+from dataclasses import dataclass, field
+from typing import List, Optional
 from dotenv import load_dotenv
 
 from monitorx.services.alerting import (
@@ -13,46 +15,100 @@ from monitorx.types import ModelConfig, Thresholds, InferenceMetric
 load_dotenv()
 
 
+@dataclass(frozen=True)
+class AlertEnv:
+    """Alert channel settings read once from the environment."""
+    enable_email: bool = False
+    smtp_server: str = "smtp.gmail.com"
+    smtp_port: int = 587
+    smtp_username: Optional[str] = None
+    smtp_password: Optional[str] = None
+    from_email: Optional[str] = None
+    to_emails: List[str] = field(default_factory=list)
+
+    enable_slack: bool = False
+    slack_webhook_url: Optional[str] = None
+    slack_channel: str = "#ml-alerts"
+
+    enable_webhook: bool = False
+    webhook_url: Optional[str] = None
+    webhook_api_key: Optional[str] = None
+
+
+def load_env() -> AlertEnv:
+    """Read alert settings, skipping those of disabled channels."""
+    env = os.environ.get
+    settings = {}
+
+    if env("ENABLE_EMAIL_ALERTS") == "true":
+        settings.update(
+            enable_email=True,
+            smtp_server=env("SMTP_SERVER", "smtp.gmail.com"),
+            smtp_port=int(env("SMTP_PORT", "587")),
+            smtp_username=env("SMTP_USERNAME"),
+            smtp_password=env("SMTP_PASSWORD"),
+            from_email=env("ALERT_FROM_EMAIL"),
+            to_emails=env("ALERT_TO_EMAILS", "").split(","),
+        )
+
+    if env("ENABLE_SLACK_ALERTS") == "true":
+        settings.update(
+            enable_slack=True,
+            slack_webhook_url=env("SLACK_WEBHOOK_URL"),
+            slack_channel=env("SLACK_CHANNEL", "#ml-alerts"),
+        )
+
+    if env("ENABLE_WEBHOOK_ALERTS") == "true":
+        settings.update(
+            enable_webhook=True,
+            webhook_url=env("WEBHOOK_URL"),
+            webhook_api_key=env("WEBHOOK_API_KEY"),
+        )
+
+    return AlertEnv(**settings)
+
+
 async def main():
     """Demonstrate alert channel configuration."""
+    cfg = load_env()
 
     # 1. Create alerting service
     alerting = AlertingService()
 
     # 2. Configure Email Alerts
-    if os.getenv("ENABLE_EMAIL_ALERTS") == "true":
+    if cfg.enable_email:
         email_channel = EmailChannel(
             name="email-alerts",
-            smtp_server=os.getenv("SMTP_SERVER", "smtp.gmail.com"),
-            smtp_port=int(os.getenv("SMTP_PORT", "587")),
-            username=os.getenv("SMTP_USERNAME"),
-            password=os.getenv("SMTP_PASSWORD"),
-            from_email=os.getenv("ALERT_FROM_EMAIL"),
-            to_emails=os.getenv("ALERT_TO_EMAILS", "").split(","),
+            smtp_server=cfg.smtp_server,
+            smtp_port=cfg.smtp_port,
+            username=cfg.smtp_username,
+            password=cfg.smtp_password,
+            from_email=cfg.from_email,
+            to_emails=cfg.to_emails,
             use_tls=True
         )
         alerting.add_channel(email_channel)
         print("✓ Email alerts configured")
 
     # 3. Configure Slack Alerts
-    if os.getenv("ENABLE_SLACK_ALERTS") == "true":
+    if cfg.enable_slack:
         slack_channel = SlackChannel(
             name="slack-alerts",
-            webhook_url=os.getenv("SLACK_WEBHOOK_URL"),
-            channel=os.getenv("SLACK_CHANNEL", "#ml-alerts"),
+            webhook_url=cfg.slack_webhook_url,
+            channel=cfg.slack_channel,
             username="MonitorX Bot"
         )
         alerting.add_channel(slack_channel)
         print("✓ Slack alerts configured")
 
     # 4. Configure Custom Webhook
-    if os.getenv("ENABLE_WEBHOOK_ALERTS") == "true":
+    if cfg.enable_webhook:
         webhook_channel = WebhookChannel(
             name="custom-webhook",
-            url=os.getenv("WEBHOOK_URL"),
+            url=cfg.webhook_url,
             method="POST",
             headers={
-                "Authorization": f"Bearer {os.getenv('WEBHOOK_API_KEY')}",
+                "Authorization": f"Bearer {cfg.webhook_api_key}",
                 "Content-Type": "application/json"
             },
             timeout=30
@@ -79,11 +135,8 @@ async def main():
     # 7. Integrate with metrics collector
     metrics_collector = MetricsCollector()
 
-    # Register alerting callback
-    async def alert_callback(alert):
-        await alerting.send_alert(alert)
-
-    metrics_collector.add_alert_callback(lambda alert: asyncio.create_task(alert_callback(alert)))
+    # Register alerting callback; the collector awaits coroutine callbacks
+    metrics_collector.add_alert_callback(alerting.send_alert)
 
     # 8. Register a model
     model_config = ModelConfig(
@@ -113,11 +166,9 @@ async def main():
         tags={"test": "true"}
     )
 
+    # Alerts are sent before this returns
     await metrics_collector.collect_inference_metric(high_latency_metric)
 
-    # Wait for async alert sending
-    await asyncio.sleep(1)
-
     print("\n✓ Alert demonstration complete!")
     print("\nCheck your configured channels for the test alerts.")
 
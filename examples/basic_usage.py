@@ -7,14 +7,13 @@ This example demonstrates how to use MonitorX to monitor a simple ML model.
 import asyncio
 import random
 import time
+import numpy as np
 from monitorx.sdk import MonitorXClient, MonitorXContext, monitor_inference
 from monitorx.types import ModelConfig, Thresholds, ResourceUsage
 
 
-async def setup_model():
+async def setup_model(client: MonitorXClient) -> bool:
     """Set up and register a model with MonitorX."""
-    client = MonitorXClient("http://localhost:8000")
-
     # Define model configuration
     config = ModelConfig(
         id="sentiment-analysis-v1",
@@ -37,26 +36,38 @@ async def setup_model():
         print("✅ Model registered successfully!")
     else:
         print("❌ Failed to register model")
-        return None
 
-    return client
+    return success
+
+
+SENTIMENTS = np.array(["positive", "negative", "neutral"])
+
 
+class SimulatedDraws:
+    """Random draws for n simulated inferences, generated up front with numpy."""
 
-def simulate_ml_inference(text: str) -> dict:
+    def __init__(self, n: int, seed=None):
+        rng = np.random.default_rng(seed)
+        self.processing_times = rng.uniform(0.1, 2.0, n)
+        self.errors = rng.random(n) < 0.05  # 5% chance
+        self.sentiments = rng.choice(SENTIMENTS, n)
+        self.confidences = rng.uniform(0.7, 0.99, n)
+
+
+async def simulate_ml_inference(text: str, draws: SimulatedDraws, i: int) -> dict:
     """Simulate ML model inference with random latency and occasional errors."""
-    # Simulate processing time
-    processing_time = random.uniform(0.1, 2.0)
-    time.sleep(processing_time)
+    # Simulate processing time without blocking the event loop
+    await asyncio.sleep(float(draws.processing_times[i]))
 
-    # Simulate occasional errors (5% chance)
-    if random.random() < 0.05:
+    # Simulate occasional errors
+    if draws.errors[i]:
         raise Exception("Model inference failed")
 
     # Return mock result
     return {
         "text": text,
-        "sentiment": random.choice(["positive", "negative", "neutral"]),
-        "confidence": random.uniform(0.7, 0.99)
+        "sentiment": str(draws.sentiments[i]),
+        "confidence": float(draws.confidences[i])
     }
 
 
@@ -65,84 +76,86 @@ def simulate_ml_inference(text: str) -> dict:
     model_type="llm",
     tags={"version": "1.0.0", "endpoint": "/analyze"}
 )
-async def analyze_sentiment(text: str) -> dict:
+async def analyze_sentiment(text: str, draws: SimulatedDraws, i: int) -> dict:
     """Analyze sentiment with automatic monitoring."""
-    return simulate_ml_inference(text)
+    return await simulate_ml_inference(text, draws, i)
 
 
-async def manual_monitoring_example():
+async def manual_monitoring_example(client: MonitorXClient):
     """Example of manual metrics collection."""
-    client = MonitorXClient("http://localhost:8000")
+    num_requests = 10
+    draws = SimulatedDraws(num_requests)
 
-    for i in range(10):
+    async def run_request(i: int) -> dict:
         start_time = time.time()
         error_occurred = False
 
         try:
             # Simulate model inference
-            result = simulate_ml_inference(f"Sample text {i}")
+            result = await simulate_ml_inference(f"Sample text {i}", draws, i)
 
         except Exception as e:
             print(f"❌ Error in inference {i}: {e}")
             error_occurred = True
 
-        finally:
-            end_time = time.time()
-            latency = (end_time - start_time) * 1000  # Convert to milliseconds
+        end_time = time.time()
+        latency = (end_time - start_time) * 1000  # Convert to milliseconds
 
-            # Collect metrics manually
-            await client.collect_inference_metric(
-                model_id="sentiment-analysis-v1",
-                model_type="llm",
-                latency=latency,
-                request_id=f"req-{i}",
-                error_rate=1.0 if error_occurred else 0.0,
-                resource_usage=ResourceUsage(
-                    gpu_memory=random.uniform(0.3, 0.9),
-                    cpu_usage=random.uniform(0.2, 0.8),
-                    memory_usage=random.uniform(0.4, 0.7)
-                ),
-                tags={"batch": "manual-example"}
-            )
+        print(f"📊 Measured request {i} (latency: {latency:.1f}ms)")
 
-            print(f"📊 Collected metrics for request {i} (latency: {latency:.1f}ms)")
+        return {
+            "model_id": "sentiment-analysis-v1",
+            "model_type": "llm",
+            "latency": latency,
+            "request_id": f"req-{i}",
+            "error_rate": 1.0 if error_occurred else 0.0,
+            "resource_usage": ResourceUsage(
+                gpu_memory=random.uniform(0.3, 0.9),
+                cpu_usage=random.uniform(0.2, 0.8),
+                memory_usage=random.uniform(0.4, 0.7)
+            ),
+            "tags": {"batch": "manual-example"}
+        }
 
-        await asyncio.sleep(0.5)  # Brief pause between requests
+    # Run the requests concurrently, as a real service would handle them
+    metrics = await asyncio.gather(*(run_request(i) for i in range(num_requests)))
 
+    # Collect all metrics manually in a single batch
+    result = await client.collect_inference_metrics_batch(list(metrics))
+    print(f"📊 Collected metrics: {result['success']} succeeded, {result['failed']} failed")
 
-async def decorator_monitoring_example():
-    """Example of automatic monitoring using decorators."""
-    client = MonitorXClient("http://localhost:8000")
 
+async def decorator_monitoring_example(client: MonitorXClient):
+    """Example of automatic monitoring using decorators."""
     # Use context manager to set up the client for decorators
-    async with client:
-        with MonitorXContext(client):
-            print("\n🎯 Running decorator monitoring example...")
-
-            # Process multiple requests
-            sample_texts = [
-                "I love this product!",
-                "This is terrible.",
-                "Not sure how I feel about this.",
-                "Amazing quality and fast delivery!",
-                "Could be better."
-            ]
-
-            for i, text in enumerate(sample_texts):
-                try:
-                    result = await analyze_sentiment(text)
-                    print(f"✅ Request {i+1}: {text[:30]}... -> {result['sentiment']}")
-
-                except Exception as e:
-                    print(f"❌ Request {i+1} failed: {e}")
+    with MonitorXContext(client):
+        print("\n🎯 Running decorator monitoring example...")
+
+        # Process multiple requests
+        sample_texts = [
+            "I love this product!",
+            "This is terrible.",
+            "Not sure how I feel about this.",
+            "Amazing quality and fast delivery!",
+            "Could be better."
+        ]
+        draws = SimulatedDraws(len(sample_texts))
+
+        # Inference calls overlap instead of running one after another
+        results = await asyncio.gather(
+            *(analyze_sentiment(text, draws, i) for i, text in enumerate(sample_texts)),
+            return_exceptions=True
+        )
 
-                await asyncio.sleep(0.3)  # Brief pause between requests
+        for i, (text, result) in enumerate(zip(sample_texts, results)):
+            if isinstance(result, Exception):
+                print(f"❌ Request {i+1} failed: {result}")
+            else:
+                print(f"✅ Request {i+1}: {text[:30]}... -> {result['sentiment']}")
 
 
-async def drift_detection_example():
+async def drift_detection_example(client: MonitorXClient):
     """Example of drift detection."""
-    client = MonitorXClient("http://localhost:8000")
-
     # Simulate drift detection results
     drift_scenarios = [
         {"confidence": 0.92, "severity": "critical", "type": "data"},
@@ -150,25 +163,25 @@ async def drift_detection_example():
         {"confidence": 0.65, "severity": "medium", "type": "data"},
     ]
 
-    for i, scenario in enumerate(drift_scenarios):
-        await client.collect_drift_metric(
+    # Report all scenarios concurrently; they are independent requests
+    await asyncio.gather(*(
+        client.collect_drift_metric(
             model_id="sentiment-analysis-v1",
             drift_type=scenario["type"],
             severity=scenario["severity"],
             confidence=scenario["confidence"],
             tags={"detection_method": "statistical_test", "batch_id": f"batch-{i}"}
         )
+        for i, scenario in enumerate(drift_scenarios)
+    ))
 
+    for scenario in drift_scenarios:
         print(f"🚨 Drift detected: {scenario['type']} drift with "
               f"{scenario['severity']} severity (confidence: {scenario['confidence']:.1%})")
 
-        await asyncio.sleep(1)
-
 
-async def get_statistics_example():
+async def get_statistics_example(client: MonitorXClient):
     """Example of retrieving statistics."""
-    client = MonitorXClient("http://localhost:8000")
-
     # Get summary statistics
     stats = await client.get_summary_stats("sentiment-analysis-v1", since_hours=1)
 
@@ -191,10 +204,8 @@ async def get_statistics_example():
         print("\n✅ No active alerts")
 
 
-async def health_check_example():
+async def health_check_example(client: MonitorXClient):
     """Example of health check."""
-    client = MonitorXClient("http://localhost:8000")
-
     health = await client.health_check()
 
     print(f"\n🏥 Health Check:")
@@ -207,25 +218,26 @@ async def main():
     print("🎯 MonitorX Basic Usage Example")
     print("=" * 40)
 
-    # Set up model
-    client = await setup_model()
-    if not client:
-        return
+    # One client (and its connection pool) is shared by every example
+    async with MonitorXClient("http://localhost:8000") as client:
+        # Set up model
+        if not await setup_model(client):
+            return
 
-    print("\n1. Manual monitoring example")
-    await manual_monitoring_example()
+        print("\n1. Manual monitoring example")
+        await manual_monitoring_example(client)
 
-    print("\n2. Decorator monitoring example")
-    await decorator_monitoring_example()
+        print("\n2. Decorator monitoring example")
+        await decorator_monitoring_example(client)
 
-    print("\n3. Drift detection example")
-    await drift_detection_example()
+        print("\n3. Drift detection example")
+        await drift_detection_example(client)
 
-    print("\n4. Statistics retrieval example")
-    await get_statistics_example()
+        print("\n4. Statistics retrieval example")
+        await get_statistics_example(client)
 
-    print("\n5. Health check example")
-    await health_check_example()
+        print("\n5. Health check example")
+        await health_check_example(client)
 
     print("\n✅ Example completed!")
     print("\n💡 Visit http://localhost:8501 to see the dashboard")
@@ -102,13 +102,14 @@ async def example_buffering_offline():
         buffer_size=1000
     )
 
-    # Enable buffering (e.g., when you detect API is down)
-    client.enable_buffering()
+    # Enable buffering (e.g., when you detect API is down); buffered metrics
+    # are retried in the background every 5 seconds until they go through
+    client.enable_buffering(auto_flush_interval=5.0)
     print("Buffering enabled - metrics will be stored locally")
 
-    # These metrics will be buffered instead of sent
+    # These metrics are appended to the local buffer without awaiting anything
     for i in range(5):
-        await client.collect_inference_metric(
+        client.buffer_inference_metric(
             model_id="vgg16",
             model_type="cv",
             latency=78.3 + i * 10
@@ -131,18 +132,19 @@ async def example_connection_pooling():
 
     # Using async context manager keeps connection alive across multiple requests
     async with MonitorXClient(base_url="http://localhost:8000") as client:
-        # All these requests reuse the same HTTP connection
-        tasks = []
-        for i in range(20):
-            task = client.collect_inference_metric(
-                model_id="efficientnet",
-                model_type="cv",
-                latency=23.4 + i
-            )
-            tasks.append(task)
-
-        # Execute all requests concurrently
-        results = await asyncio.gather(*tasks)
+        # Cap in-flight requests so large batches don't exhaust the connection pool
+        sem = asyncio.Semaphore(32)
+
+        async def one(i: int) -> bool:
+            async with sem:
+                return await client.collect_inference_metric(
+                    model_id="efficientnet",
+                    model_type="cv",
+                    latency=23.4 + i
+                )
+
+        # All these requests reuse the same pooled HTTP connections
+        results = await asyncio.gather(*(one(i) for i in range(20)))
         successes = sum(1 for r in results if r)
         print(f"Collected {successes}/20 metrics using connection pool")
 
@@ -205,16 +207,20 @@ async def example_production_usage():
 
     try:
         async with client:
-            # Your application logic
-            for request_id in range(100):
-                # Collect metrics during inference
-                await client.collect_inference_metric(
-                    model_id="production-model",
-                    model_type="llm",
-                    latency=123.4,
-                    request_id=f"req-{request_id}",
-                    tags={"env": "production", "region": "us-west-2"}
-                )
+            # Your application logic: gather metrics during inference...
+            metrics = [
+                {
+                    "model_id": "production-model",
+                    "model_type": "llm",
+                    "latency": 123.4,
+                    "request_id": f"req-{request_id}",
+                    "tags": {"env": "production", "region": "us-west-2"}
+                }
+                for request_id in range(100)
+            ]
+
+            # ...and send them as one batch instead of one call per metric
+            await client.collect_inference_metrics_batch(metrics)
 
             # Periodically flush buffer
             if client.get_buffer_size() > 100:
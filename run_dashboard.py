@@ -5,7 +5,6 @@ MonitorX Dashboard Runner
 Simple script to run the Streamlit dashboard.
 """
 
-import subprocess
 import sys
 import os
 
@@ -24,21 +23,24 @@ def main():
     print()
 
     try:
-        subprocess.run([
-            "streamlit", "run", dashboard_path,
-            "--server.port", "8501",
-            "--server.address", "0.0.0.0",
-            "--browser.gatherUsageStats", "false"
-        ], check=True)
-    except KeyboardInterrupt:
-        print("\n👋 Dashboard stopped")
-    except FileNotFoundError:
+        from streamlit.web import cli as stcli
+    except ImportError:
         print("❌ Streamlit not found! Please install it with:")
         print("   pip install streamlit")
         sys.exit(1)
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error running dashboard: {e}")
-        sys.exit(1)
+
+    # Run the streamlit CLI in-process instead of spawning a separate interpreter
+    sys.argv = [
+        "streamlit", "run", dashboard_path,
+        "--server.port", "8501",
+        "--server.address", "0.0.0.0",
+        "--browser.gatherUsageStats", "false"
+    ]
+
+    try:
+        sys.exit(stcli.main())
+    except KeyboardInterrupt:
+        print("\n👋 Dashboard stopped")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,9 +5,7 @@ MonitorX API Server Runner
 Simple script to run the FastAPI server.
 """
 
-import subprocess
 import sys
-import os
 
 def main():
     """Run the MonitorX API server."""
@@ -20,22 +18,23 @@ def main():
     print()
 
     try:
-        subprocess.run([
-            "uvicorn", server_module,
-            "--host", "0.0.0.0",
-            "--port", "8000",
-            "--reload",
-            "--log-level", "info"
-        ], check=True)
-    except KeyboardInterrupt:
-        print("\n👋 Server stopped")
-    except FileNotFoundError:
+        import uvicorn
+    except ImportError:
         print("❌ Uvicorn not found! Please install it with:")
         print("   pip install uvicorn")
         sys.exit(1)
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error running server: {e}")
-        sys.exit(1)
+
+    try:
+        # Run in-process instead of spawning a separate uvicorn interpreter
+        uvicorn.run(
+            server_module,
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,37 @@
+# Copyright 2025 MonitorX Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Build hook for optional mypyc compilation; metadata lives in pyproject.toml.
+
+Set MONITORX_MYPYC=1 (with mypy installed) to compile the modules listed in
+MYPYC_MODULES into C extensions. Without it the package builds as pure Python.
+"""
+import os
+
+from setuptools import setup
+
+# Per-call SDK code that is fully annotated and never monkeypatched. The client
+# itself stays interpreted so tests and users can patch its methods.
+MYPYC_MODULES = [
+    "src/monitorx/sdk/circuit_breaker.py",
+]
+
+ext_modules = []
+if os.environ.get("MONITORX_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Type-check only what gets compiled; imported modules are just read for types
+    ext_modules = mypycify(["--follow-imports=silent", *MYPYC_MODULES], opt_level="3")
+
+setup(ext_modules=ext_modules)
@@ -18,17 +18,8 @@ MonitorX: ML/AI Infrastructure Observability Platform
 The missing piece between ML model deployment and production reliability.
 """
 
-from .types import (
-    InferenceMetric,
-    DriftMetric,
-    Alert,
-    ModelConfig,
-    Thresholds,
-    ResourceUsage,
-    SummaryStats
-)
-from .sdk import MonitorXClient, MonitorXContext, monitor_inference, monitor_drift
-from .services import MetricsCollector, AlertingService, EmailChannel, SlackChannel
+import importlib
+from typing import Any, List
 
 __version__ = "0.1.0"
 __author__ = "MonitorX Team"
@@ -54,4 +45,43 @@ __all__ = [
     "AlertingService",
     "EmailChannel",
     "SlackChannel",
-]
\ No newline at end of file
+]
+
+# Public symbols are imported on first access (PEP 562) so that
+# ``import monitorx`` does not pull in the SDK and alerting dependencies.
+_LAZY_IMPORTS = {
+    # Types
+    "InferenceMetric": ".types",
+    "DriftMetric": ".types",
+    "Alert": ".types",
+    "ModelConfig": ".types",
+    "Thresholds": ".types",
+    "ResourceUsage": ".types",
+    "SummaryStats": ".types",
+
+    # SDK
+    "MonitorXClient": ".sdk",
+    "MonitorXContext": ".sdk",
+    "monitor_inference": ".sdk",
+    "monitor_drift": ".sdk",
+
+    # Services
+    "MetricsCollector": ".services",
+    "AlertingService": ".services",
+    "EmailChannel": ".services",
+    "SlackChannel": ".services",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
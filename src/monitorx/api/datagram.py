@@ -0,0 +1,119 @@
+# Copyright 2025 MonitorX Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fire-and-forget ingestion of inference metrics over UDP or a Unix socket."""
+import asyncio
+import ipaddress
+import os
+import socket
+import stat
+from typing import List, Optional, Set
+
+import msgspec
+from loguru import logger
+
+from .routes import (
+    _inference_metric_decoder, _persist, _to_inference_metric, metrics_collector, storage
+)
+from ..types import InferenceMetric
+
+
+async def _ingest(metric: InferenceMetric) -> None:
+    """Collect and store a metric received in a datagram."""
+    try:
+        await metrics_collector.collect_inference_metric(metric)
+    except Exception as e:
+        logger.error(f"Failed to collect metric datagram for model {metric.model_id}: {e}")
+        return
+    await _persist(storage.write_inference_metric, metric)
+
+
+class MetricDatagramProtocol(asyncio.DatagramProtocol):
+    """Collect one JSON-encoded inference metric per datagram; nothing is sent back."""
+
+    def __init__(self):
+        # Strong references so pending ingest tasks aren't garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            metric = _to_inference_metric(_inference_metric_decoder.decode(data))
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            logger.warning(f"Dropped invalid metric datagram: {e}")
+            return
+
+        task = asyncio.get_running_loop().create_task(_ingest(metric))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _is_loopback(host: str) -> bool:
+    """Whether host only accepts connections from this machine."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _remove_stale_socket(path: str) -> bool:
+    """Remove a socket file left at path by a previous run; False if path is another file."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return True
+    if not stat.S_ISSOCK(mode):
+        logger.error(f"Not listening for metric datagrams on {path}: it exists and is not a socket")
+        return False
+    os.unlink(path)
+    return True
+
+
+async def start_datagram_listeners(
+    host: str,
+    udp_port: int,
+    unix_socket: Optional[str],
+    api_key_enabled: bool = False
+) -> List[asyncio.DatagramTransport]:
+    """Listen for metric datagrams on a UDP port and/or a Unix socket path.
+
+    Datagrams carry no API key, so with API keys enabled the UDP listener is
+    bound to loopback only.
+    """
+    loop = asyncio.get_running_loop()
+    transports = []
+
+    if udp_port:
+        if api_key_enabled and not _is_loopback(host):
+            loopback = "::1" if ":" in host else "127.0.0.1"
+            logger.warning(
+                f"API keys are enabled but metric datagrams are unauthenticated; "
+                f"listening on {loopback} instead of {host}"
+            )
+            host = loopback
+        transport, _ = await loop.create_datagram_endpoint(
+            MetricDatagramProtocol, local_addr=(host, udp_port)
+        )
+        transports.append(transport)
+        logger.info(f"Listening for metric datagrams on udp://{host}:{udp_port}")
+
+    if unix_socket and _remove_stale_socket(unix_socket):
+        transport, _ = await loop.create_datagram_endpoint(
+            MetricDatagramProtocol, local_addr=unix_socket, family=socket.AF_UNIX
+        )
+        transports.append(transport)
+        logger.info(f"Listening for metric datagrams on unix://{unix_socket}")
+
+    return transports
@@ -12,12 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, List, Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Optional, Dict, List, Literal
 from datetime import datetime
+import msgspec
+
+# Shared enumerations; pydantic-core validates each Literal with a single set lookup
+ModelType = Literal["llm", "cv", "tabular"]
+Environment = Literal["dev", "staging", "prod"]
+DriftType = Literal["data", "concept"]
+Severity = Literal["low", "medium", "high", "critical"]
+AlertType = Literal["latency", "error_rate", "drift", "resource_usage"]
 
 
 class ResourceUsageModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     gpu_memory: Optional[float] = Field(None, ge=0.0, le=1.0, description="GPU memory usage (0-1)")
     cpu_usage: Optional[float] = Field(None, ge=0.0, le=1.0, description="CPU usage (0-1)")
     memory_usage: Optional[float] = Field(None, ge=0.0, le=1.0, description="Memory usage (0-1)")
@@ -25,7 +35,7 @@ class ResourceUsageModel(BaseModel):
 
 class InferenceMetricRequest(BaseModel):
     model_id: str = Field(..., description="Unique identifier for the model")
-    model_type: Literal["llm", "cv", "tabular"] = Field(..., description="Type of ML model")
+    model_type: ModelType = Field(..., description="Type of ML model")
     request_id: str = Field(..., description="Unique identifier for the request")
     latency: float = Field(..., gt=0, description="Request latency in milliseconds")
     throughput: Optional[float] = Field(None, gt=0, description="Requests per second")
@@ -34,15 +44,25 @@ class InferenceMetricRequest(BaseModel):
     tags: Dict[str, str] = Field(default_factory=dict, description="Custom tags")
 
 
+class InferenceMetricBatchRequest(BaseModel):
+    metrics: List[InferenceMetricRequest] = Field(..., description="Inference metrics to collect")
+
+
 class DriftMetricRequest(BaseModel):
     model_id: str = Field(..., description="Unique identifier for the model")
-    drift_type: Literal["data", "concept"] = Field(..., description="Type of drift detected")
-    severity: Literal["low", "medium", "high", "critical"] = Field(..., description="Drift severity")
+    drift_type: DriftType = Field(..., description="Type of drift detected")
+    severity: Severity = Field(..., description="Drift severity")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score (0-1)")
     tags: Dict[str, str] = Field(default_factory=dict, description="Custom tags")
 
 
+class DriftMetricBatchRequest(BaseModel):
+    metrics: List[DriftMetricRequest] = Field(..., description="Drift metrics to collect")
+
+
 class ThresholdsModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     latency: float = Field(1000.0, gt=0, description="Latency threshold in milliseconds")
     error_rate: float = Field(0.05, ge=0.0, le=1.0, description="Error rate threshold (0-1)")
     gpu_memory: float = Field(0.8, ge=0.0, le=1.0, description="GPU memory threshold (0-1)")
@@ -53,17 +73,19 @@ class ThresholdsModel(BaseModel):
 class ModelConfigRequest(BaseModel):
     id: str = Field(..., description="Unique identifier for the model")
     name: str = Field(..., description="Human-readable model name")
-    model_type: Literal["llm", "cv", "tabular"] = Field(..., description="Type of ML model")
+    model_type: ModelType = Field(..., description="Type of ML model")
     version: str = Field(..., description="Model version")
-    environment: Literal["dev", "staging", "prod"] = Field(..., description="Deployment environment")
+    environment: Environment = Field(..., description="Deployment environment")
     thresholds: ThresholdsModel = Field(default_factory=ThresholdsModel, description="Alert thresholds")
 
 
 class AlertResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     model_id: str
-    alert_type: Literal["latency", "error_rate", "drift", "resource_usage"]
-    severity: Literal["low", "medium", "high", "critical"]
+    alert_type: AlertType
+    severity: Severity
     message: str
     timestamp: datetime
     resolved: bool
@@ -71,6 +93,8 @@ class AlertResponse(BaseModel):
 
 
 class SummaryStatsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     total_requests: int
     average_latency: float
     error_rate: float
@@ -79,18 +103,55 @@ class SummaryStatsResponse(BaseModel):
     active_alerts: int
 
 
-class MetricsQueryParams(BaseModel):
-    model_id: Optional[str] = None
-    since_hours: int = Field(24, gt=0, le=168, description="Hours to look back (max 7 days)")
-    limit: int = Field(1000, gt=0, le=10000, description="Maximum number of results")
-
-
 class AlertResolveRequest(BaseModel):
     alert_id: str = Field(..., description="ID of the alert to resolve")
 
 
 class HealthResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     status: str
     timestamp: datetime
     version: str
-    services: Dict[str, str]
\ No newline at end of file
+    services: Dict[str, str]
+
+
+# msgspec mirrors of the ingestion request models. The POST handlers decode
+# bodies straight into these; the pydantic models above still document them.
+Ratio = Annotated[float, msgspec.Meta(ge=0.0, le=1.0)]
+
+
+# Only scalar fields, so instances can never be part of a reference cycle
+class ResourceUsageStruct(msgspec.Struct, frozen=True, gc=False):
+    gpu_memory: Optional[Ratio] = None
+    cpu_usage: Optional[Ratio] = None
+    memory_usage: Optional[Ratio] = None
+
+
+class InferenceMetricStruct(msgspec.Struct):
+    model_id: str
+    model_type: ModelType
+    request_id: str
+    latency: Annotated[float, msgspec.Meta(gt=0)]
+    throughput: Optional[Annotated[float, msgspec.Meta(gt=0)]] = None
+    error_rate: Optional[Ratio] = None
+    resource_usage: Optional[ResourceUsageStruct] = None
+    tags: Dict[str, str] = {}
+
+
+# Items stay raw so each metric is validated on its own and a bad one is
+# rejected without failing the rest of the batch
+class InferenceMetricBatchStruct(msgspec.Struct):
+    metrics: List[msgspec.Raw]
+
+
+class DriftMetricStruct(msgspec.Struct):
+    model_id: str
+    drift_type: DriftType
+    severity: Severity
+    confidence: Ratio
+    tags: Dict[str, str] = {}
+
+
+class DriftMetricBatchStruct(msgspec.Struct):
+    metrics: List[msgspec.Raw]
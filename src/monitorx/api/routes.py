@@ -12,291 +12,433 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query, Request
+import asyncio
+import re
+import time
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from loguru import logger
+import msgspec
 
+from .responses import ORJSONResponse
 from .models import (
-    InferenceMetricRequest, DriftMetricRequest, ModelConfigRequest,
-    AlertResponse, SummaryStatsResponse, MetricsQueryParams,
-    AlertResolveRequest, HealthResponse
+    InferenceMetricRequest, InferenceMetricBatchRequest, DriftMetricRequest,
+    DriftMetricBatchRequest, ModelConfigRequest, AlertResponse, SummaryStatsResponse,
+    AlertResolveRequest, HealthResponse,
+    InferenceMetricStruct, InferenceMetricBatchStruct, DriftMetricStruct,
+    DriftMetricBatchStruct
 )
 from ..services.metrics_collector import MetricsCollector
 from ..services.storage import InfluxDBStorage
 from ..types import InferenceMetric, DriftMetric, ModelConfig, ResourceUsage, Thresholds
+from ..config import config
+from ..auth import api_key_dependencies
 
 # Global instances (will be properly injected in production)
 metrics_collector = MetricsCollector()
-
-# Import storage from server to use the connected instance
-def get_storage():
-    from ..server import storage
-    return storage
+# The server connects/disconnects this instance in its lifespan handler
+storage = InfluxDBStorage()
 
 router = APIRouter(prefix="/api/v1")
 
+# Query parameters shared across the read endpoints
+ModelIdQuery = Annotated[Optional[str], Query()]
+SinceHours = Annotated[int, Query(gt=0, le=168, description="Hours to look back (max 7 days)")]
 
-@router.post("/metrics/inference", status_code=201)
-async def collect_inference_metric(metric_data: InferenceMetricRequest):
-    """Collect an inference metric."""
-    try:
-        # Convert request model to internal model
-        resource_usage = None
-        if metric_data.resource_usage:
-            resource_usage = ResourceUsage(
-                gpu_memory=metric_data.resource_usage.gpu_memory,
-                cpu_usage=metric_data.resource_usage.cpu_usage,
-                memory_usage=metric_data.resource_usage.memory_usage
-            )
-
-        metric = InferenceMetric(
-            model_id=metric_data.model_id,
-            model_type=metric_data.model_type,
-            request_id=metric_data.request_id,
-            latency=metric_data.latency,
-            throughput=metric_data.throughput,
-            error_rate=metric_data.error_rate,
-            resource_usage=resource_usage,
-            tags=metric_data.tags
-        )
+# Aggregation window such as "30s", "5m" or "1h"
+_WINDOW_RE = re.compile(r"^[0-9]+[smh]$")
 
-        # Collect metric
-        await metrics_collector.collect_inference_metric(metric)
+# InfluxDB health is probed at most once per TTL; the probe runs off the event loop
+HEALTH_CACHE_TTL = 5.0
+HEALTH_PROBE_TIMEOUT = 0.5
+_influxdb_health = (float("-inf"), "unknown")  # (monotonic time, status)
 
-        # Store in InfluxDB
-        await get_storage().write_inference_metric(metric)
 
-        return {"status": "success", "message": "Metric collected successfully"}
+def _response_model(model):
+    """Only let FastAPI re-validate responses when VALIDATE_API_RESPONSE is set."""
+    return model if config.VALIDATE_API_RESPONSE else None
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to collect metric: {str(e)}")
 
+def _json_body(model) -> dict:
+    """OpenAPI requestBody for a route that decodes its body with msgspec."""
+    schema = model.model_json_schema(ref_template="{model}")
+    defs = schema.pop("$defs", {})
 
-@router.post("/metrics/drift", status_code=201)
-async def collect_drift_metric(drift_data: DriftMetricRequest):
-    """Collect a drift detection metric."""
-    try:
-        drift_metric = DriftMetric(
-            model_id=drift_data.model_id,
-            drift_type=drift_data.drift_type,
-            severity=drift_data.severity,
-            confidence=drift_data.confidence,
-            tags=drift_data.tags
-        )
+    def inline(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(defs[node["$ref"]])
+            return {k: inline(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [inline(v) for v in node]
+        return node
 
-        # Collect drift metric
-        await metrics_collector.collect_drift_metric(drift_metric)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}}
+        }
+    }
 
-        # Store in InfluxDB
-        await get_storage().write_drift_metric(drift_metric)
 
-        return {"status": "success", "message": "Drift metric collected successfully"}
+# msgspec reports where validation failed as e.g. "... - at `$.resource_usage.gpu_memory`"
+_ERROR_PATH_RE = re.compile(r"^(.*) - at `\$(.*)`$")
+_PATH_PART_RE = re.compile(r"\.([^.\[]+)|\[(\d+|\.\.\.)\]")
+_MISSING_FIELD_RE = re.compile(r"^Object missing required field `(.+)`$")
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to collect drift metric: {str(e)}")
 
+def _error_detail(error: msgspec.MsgspecError) -> List[Dict[str, Any]]:
+    """Describe a msgspec decoding error in the {loc, msg, type} form pydantic uses."""
+    message = str(error)
+    if not isinstance(error, msgspec.ValidationError):
+        return [{"loc": ["body"], "msg": message, "type": "json_invalid"}]
 
-@router.post("/models", status_code=201)
-async def register_model(model_data: ModelConfigRequest):
-    """Register a new model configuration."""
-    try:
-        thresholds = Thresholds(
-            latency=model_data.thresholds.latency,
-            error_rate=model_data.thresholds.error_rate,
-            gpu_memory=model_data.thresholds.gpu_memory,
-            cpu_usage=model_data.thresholds.cpu_usage,
-            memory_usage=model_data.thresholds.memory_usage
-        )
+    loc: List[Any] = ["body"]
+    match = _ERROR_PATH_RE.match(message)
+    if match:
+        message = match.group(1)
+        for name, index in _PATH_PART_RE.findall(match.group(2)):
+            loc.append(name if name else int(index) if index.isdigit() else index)
 
-        model_config = ModelConfig(
-            id=model_data.id,
-            name=model_data.name,
-            model_type=model_data.model_type,
-            version=model_data.version,
-            environment=model_data.environment,
-            thresholds=thresholds
+    missing = _MISSING_FIELD_RE.match(message)
+    if missing:
+        loc.append(missing.group(1))
+        return [{"loc": loc, "msg": "Field required", "type": "missing"}]
+    return [{"loc": loc, "msg": message, "type": "value_error"}]
+
+
+def _decoder(struct):
+    """Build a dependency that decodes and validates the JSON body into `struct`."""
+    # Lax like pydantic's default mode, e.g. "12.5" is accepted for a float
+    decoder = msgspec.json.Decoder(struct, strict=False)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            raise HTTPException(status_code=422, detail=_error_detail(e))
+
+    return decode
+
+
+async def _influxdb_status() -> str:
+    """Return the InfluxDB health status, reusing a recent probe result."""
+    global _influxdb_health
+
+    if not storage.client:
+        return "not_connected"
+
+    checked_at, status = _influxdb_health
+    now = time.monotonic()
+    if now - checked_at < HEALTH_CACHE_TTL:
+        return status
+
+    try:
+        health = await asyncio.wait_for(
+            asyncio.to_thread(storage.client.health), HEALTH_PROBE_TIMEOUT
         )
+        status = "healthy" if health.status == "pass" else "unhealthy"
+    except asyncio.TimeoutError:
+        status = "timeout"
+    except Exception:
+        status = "unhealthy"
 
-        metrics_collector.register_model(model_config)
+    _influxdb_health = (now, status)
+    return status
 
-        return {"status": "success", "message": "Model registered successfully"}
 
+async def _persist(write, metric) -> None:
+    """Write a metric to storage after the response has been sent."""
+    try:
+        await write(metric)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to register model: {str(e)}")
+        logger.error(f"Failed to store metric for model {metric.model_id}: {e}")
 
 
-@router.get("/models")
-async def get_models():
-    """Get all registered models."""
+async def _persist_batch(write, metrics) -> None:
+    """Write a batch of metrics to storage after the response has been sent."""
     try:
-        models = metrics_collector.get_model_configs()
-        return {"models": models}
-
+        await write(metrics)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get models: {str(e)}")
+        logger.error(f"Failed to store batch of {len(metrics)} metrics: {e}")
 
 
-@router.get("/metrics/inference")
-async def get_inference_metrics(
-    model_id: Optional[str] = Query(None),
-    since_hours: int = Query(24, gt=0, le=168),
-    limit: int = Query(1000, gt=0, le=10000)
+_inference_metric_decoder = msgspec.json.Decoder(InferenceMetricStruct, strict=False)
+_drift_metric_decoder = msgspec.json.Decoder(DriftMetricStruct, strict=False)
+
+
+def _to_inference_metric(metric_data: InferenceMetricStruct) -> InferenceMetric:
+    """Convert a decoded request struct to the internal model; the field names line up."""
+    fields = msgspec.structs.asdict(metric_data)
+    usage = metric_data.resource_usage
+    if usage:
+        fields["resource_usage"] = ResourceUsage(**msgspec.structs.asdict(usage))
+    return InferenceMetric(**fields)
+
+
+def _to_drift_metric(drift_data: DriftMetricStruct) -> DriftMetric:
+    """Convert a decoded request struct to the internal model."""
+    return DriftMetric(**msgspec.structs.asdict(drift_data))
+
+
+def _decode_batch(items: List[msgspec.Raw], decoder, convert) -> Tuple[list, int]:
+    """Decode each raw batch item on its own; returns (metrics, rejected count)."""
+    metrics = []
+    rejected = 0
+    for raw in items:
+        try:
+            metrics.append(convert(decoder.decode(raw)))
+        except msgspec.ValidationError as e:
+            rejected += 1
+            logger.warning(f"Rejected metric in batch: {e}")
+    return metrics, rejected
+
+
+@router.post(
+    "/metrics/inference",
+    status_code=202,
+    openapi_extra=_json_body(InferenceMetricRequest),
+    dependencies=api_key_dependencies
+)
+async def collect_inference_metric(
+    background_tasks: BackgroundTasks,
+    metric_data: InferenceMetricStruct = Depends(_decoder(InferenceMetricStruct))
 ):
-    """Get inference metrics."""
-    try:
-        since = datetime.now() - timedelta(hours=since_hours) if since_hours else None
-        metrics = metrics_collector.get_metrics(model_id=model_id, since=since)
+    """Collect an inference metric."""
+    metric = _to_inference_metric(metric_data)
 
-        # Limit results
-        metrics = metrics[:limit]
+    # Collect metric
+    await metrics_collector.collect_inference_metric(metric)
 
-        return {"metrics": metrics}
+    # Store in InfluxDB once the response is out
+    background_tasks.add_task(_persist, storage.write_inference_metric, metric)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get metrics: {str(e)}")
+    return {"status": "success", "message": "Metric collected successfully"}
 
 
-@router.get("/metrics/drift")
-async def get_drift_metrics(
-    model_id: Optional[str] = Query(None),
-    since_hours: int = Query(168, gt=0, le=168),  # Default 7 days
-    limit: int = Query(100, gt=0, le=1000)
+@router.post(
+    "/metrics/inference/batch",
+    status_code=202,
+    openapi_extra=_json_body(InferenceMetricBatchRequest),
+    dependencies=api_key_dependencies
+)
+async def collect_inference_metrics_batch(
+    background_tasks: BackgroundTasks,
+    batch: InferenceMetricBatchStruct = Depends(_decoder(InferenceMetricBatchStruct))
 ):
-    """Get drift detection metrics."""
-    try:
-        since = datetime.now() - timedelta(hours=since_hours)
-        drift_metrics = metrics_collector.get_drift_metrics(model_id=model_id, since=since)
+    """Collect several inference metrics in one request."""
+    metrics, rejected = _decode_batch(
+        batch.metrics, _inference_metric_decoder, _to_inference_metric
+    )
 
-        # Limit results
-        drift_metrics = drift_metrics[:limit]
+    for metric in metrics:
+        await metrics_collector.collect_inference_metric(metric)
 
-        return {"drift_metrics": drift_metrics}
+    # Store the whole batch in InfluxDB with one write once the response is out
+    if metrics:
+        background_tasks.add_task(_persist_batch, storage.write_inference_metrics, metrics)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get drift metrics: {str(e)}")
+    return {"status": "success", "accepted": len(metrics), "rejected": rejected}
 
 
-@router.get("/alerts", response_model=List[AlertResponse])
-async def get_alerts(
-    model_id: Optional[str] = Query(None),
-    since_hours: int = Query(168, gt=0, le=168),  # Default 7 days
-    resolved: Optional[bool] = Query(None),
-    limit: int = Query(100, gt=0, le=1000)
+@router.post(
+    "/metrics/drift",
+    status_code=202,
+    openapi_extra=_json_body(DriftMetricRequest),
+    dependencies=api_key_dependencies
+)
+async def collect_drift_metric(
+    background_tasks: BackgroundTasks,
+    drift_data: DriftMetricStruct = Depends(_decoder(DriftMetricStruct))
 ):
-    """Get alerts."""
-    try:
-        since = datetime.now() - timedelta(hours=since_hours)
-        alerts = metrics_collector.get_alerts(
-            model_id=model_id,
-            since=since,
-            resolved=resolved
-        )
+    """Collect a drift detection metric."""
+    drift_metric = _to_drift_metric(drift_data)
 
-        # Limit results and convert to response model
-        alerts = alerts[:limit]
-        return [
-            AlertResponse(
-                id=alert.id,
-                model_id=alert.model_id,
-                alert_type=alert.alert_type,
-                severity=alert.severity,
-                message=alert.message,
-                timestamp=alert.timestamp,
-                resolved=alert.resolved,
-                resolved_at=alert.resolved_at
-            ) for alert in alerts
-        ]
+    # Collect drift metric
+    await metrics_collector.collect_drift_metric(drift_metric)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get alerts: {str(e)}")
+    # Store in InfluxDB once the response is out
+    background_tasks.add_task(_persist, storage.write_drift_metric, drift_metric)
+
+    return {"status": "success", "message": "Drift metric collected successfully"}
+
+
+@router.post(
+    "/metrics/drift/batch",
+    status_code=202,
+    openapi_extra=_json_body(DriftMetricBatchRequest),
+    dependencies=api_key_dependencies
+)
+async def collect_drift_metrics_batch(
+    background_tasks: BackgroundTasks,
+    batch: DriftMetricBatchStruct = Depends(_decoder(DriftMetricBatchStruct))
+):
+    """Collect several drift detection metrics in one request."""
+    metrics, rejected = _decode_batch(batch.metrics, _drift_metric_decoder, _to_drift_metric)
+
+    for metric in metrics:
+        await metrics_collector.collect_drift_metric(metric)
+
+    # Store the whole batch in InfluxDB with one write once the response is out
+    if metrics:
+        background_tasks.add_task(_persist_batch, storage.write_drift_metrics, metrics)
+
+    return {"status": "success", "accepted": len(metrics), "rejected": rejected}
+
+
+@router.post("/models", status_code=201, dependencies=api_key_dependencies)
+async def register_model(model_data: ModelConfigRequest):
+    """Register a new model configuration."""
+    model_config = ModelConfig(
+        **model_data.model_dump(exclude={"thresholds"}),
+        thresholds=Thresholds(**model_data.thresholds.model_dump())
+    )
+
+    metrics_collector.register_model(model_config)
+
+    return {"status": "success", "message": "Model registered successfully"}
+
+
+@router.get("/models", dependencies=api_key_dependencies)
+async def get_models():
+    """Get all registered models."""
+    models = metrics_collector.get_model_configs()
+    return {"models": models}
+
+
+@router.get("/metrics/inference", dependencies=api_key_dependencies)
+async def get_inference_metrics(
+    model_id: ModelIdQuery = None,
+    since_hours: SinceHours = 24,
+    limit: Annotated[int, Query(gt=0, le=10000)] = 1000
+):
+    """Get inference metrics."""
+    since = datetime.now() - timedelta(hours=since_hours) if since_hours else None
+    metrics = metrics_collector.get_metrics(model_id=model_id, since=since, limit=limit)
+
+    # Dataclasses go straight to orjson, skipping jsonable_encoder
+    return ORJSONResponse({"metrics": metrics})
 
 
-@router.post("/alerts/resolve")
+@router.get("/metrics/drift", dependencies=api_key_dependencies)
+async def get_drift_metrics(
+    model_id: ModelIdQuery = None,
+    since_hours: SinceHours = 168,  # Default 7 days
+    limit: Annotated[int, Query(gt=0, le=1000)] = 100
+):
+    """Get drift detection metrics."""
+    since = datetime.now() - timedelta(hours=since_hours)
+    drift_metrics = metrics_collector.get_drift_metrics(
+        model_id=model_id,
+        since=since,
+        limit=limit
+    )
+
+    return {"drift_metrics": drift_metrics}
+
+
+@router.get(
+    "/alerts",
+    response_model=_response_model(List[AlertResponse]),
+    dependencies=api_key_dependencies
+)
+async def get_alerts(
+    model_id: ModelIdQuery = None,
+    since_hours: SinceHours = 168,  # Default 7 days
+    resolved: Annotated[Optional[bool], Query()] = None,
+    limit: Annotated[int, Query(gt=0, le=1000)] = 100
+):
+    """Get alerts."""
+    since = datetime.now() - timedelta(hours=since_hours)
+    alerts = metrics_collector.get_alerts(
+        model_id=model_id,
+        since=since,
+        resolved=resolved,
+        limit=limit
+    )
+
+    # Convert to response model; alerts come from the collector already
+    # typed, so skip field validation
+    return [
+        AlertResponse.model_construct(
+            id=alert.id,
+            model_id=alert.model_id,
+            alert_type=alert.alert_type,
+            severity=alert.severity,
+            message=alert.message,
+            timestamp=alert.timestamp,
+            resolved=alert.resolved,
+            resolved_at=alert.resolved_at
+        ) for alert in alerts
+    ]
+
+
+@router.post("/alerts/resolve", dependencies=api_key_dependencies)
 async def resolve_alert(request: AlertResolveRequest):
     """Mark an alert as resolved."""
-    try:
-        success = await metrics_collector.resolve_alert(request.alert_id)
-        if not success:
-            raise HTTPException(status_code=404, detail="Alert not found")
-
-        return {"status": "success", "message": "Alert resolved successfully"}
+    success = await metrics_collector.resolve_alert(request.alert_id)
+    if not success:
+        raise HTTPException(status_code=404, detail="Alert not found")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to resolve alert: {str(e)}")
+    return {"status": "success", "message": "Alert resolved successfully"}
 
 
-@router.get("/summary", response_model=SummaryStatsResponse)
+@router.get(
+    "/summary",
+    response_model=_response_model(SummaryStatsResponse),
+    dependencies=api_key_dependencies
+)
 async def get_summary_stats(
-    model_id: Optional[str] = Query(None),
-    since_hours: int = Query(24, gt=0, le=168)
+    model_id: ModelIdQuery = None,
+    since_hours: SinceHours = 24
 ):
     """Get summary statistics."""
-    try:
-        since = datetime.now() - timedelta(hours=since_hours)
-        stats = metrics_collector.get_summary_stats(model_id=model_id, since=since)
-
-        return SummaryStatsResponse(
-            total_requests=stats.total_requests,
-            average_latency=stats.average_latency,
-            error_rate=stats.error_rate,
-            p95_latency=stats.p95_latency,
-            p99_latency=stats.p99_latency,
-            active_alerts=stats.active_alerts
-        )
+    since = datetime.now() - timedelta(hours=since_hours)
+    stats = metrics_collector.get_summary_stats(model_id=model_id, since=since)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get summary stats: {str(e)}")
+    return SummaryStatsResponse.model_construct(
+        total_requests=stats.total_requests,
+        average_latency=stats.average_latency,
+        error_rate=stats.error_rate,
+        p95_latency=stats.p95_latency,
+        p99_latency=stats.p99_latency,
+        active_alerts=stats.active_alerts
+    )
 
 
-@router.get("/health", response_model=HealthResponse)
+@router.get("/health", response_model=_response_model(HealthResponse))
 async def health_check():
     """Health check endpoint."""
-    try:
-        services = {"api": "healthy"}
+    services = {"api": "healthy", "influxdb": await _influxdb_status()}
 
-        # Check InfluxDB connection
-        try:
-            storage = get_storage()
-            if storage.client:
-                health = storage.client.health()
-                services["influxdb"] = "healthy" if health.status == "pass" else "unhealthy"
-            else:
-                services["influxdb"] = "not_connected"
-        except Exception:
-            services["influxdb"] = "unhealthy"
-
-        return HealthResponse(
-            status="healthy",
-            timestamp=datetime.now(),
-            version="0.1.0",
-            services=services
-        )
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
+    return HealthResponse.model_construct(
+        status="healthy",
+        timestamp=datetime.now(),
+        version="0.1.0",
+        services=services
+    )
 
 
-@router.get("/metrics/aggregated")
+@router.get("/metrics/aggregated", dependencies=api_key_dependencies)
 async def get_aggregated_metrics(
-    model_id: Optional[str] = Query(None),
-    since_hours: int = Query(6, gt=0, le=168),
-    window: str = Query("5m", regex="^[0-9]+[smh]$")
+    model_id: ModelIdQuery = None,
+    since_hours: SinceHours = 6,
+    window: Annotated[str, Query(description="Window size, e.g. 30s, 5m or 1h")] = "5m"
 ):
     """Get aggregated metrics over time windows."""
-    try:
-        since = datetime.now() - timedelta(hours=since_hours)
-        end_time = datetime.now()
-
-        aggregated = await get_storage().get_aggregated_metrics(
-            model_id=model_id,
-            start_time=since,
-            end_time=end_time,
-            window=window
-        )
+    if not _WINDOW_RE.match(window):
+        raise HTTPException(status_code=422, detail=f"Invalid window: {window}")
 
-        return {"aggregated_metrics": aggregated}
+    # One clock read gives a consistent [since, end_time] window
+    end_time = datetime.now()
+    since = end_time - timedelta(hours=since_hours)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get aggregated metrics: {str(e)}")
\ No newline at end of file
+    aggregated = await storage.get_aggregated_metrics(
+        model_id=model_id,
+        start_time=since,
+        end_time=end_time,
+        window=window
+    )
+
+    return ORJSONResponse({"aggregated_metrics": aggregated})
\ No newline at end of file
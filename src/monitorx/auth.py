@@ -13,7 +13,11 @@
 # limitations under the License.
 
 """Authentication and authorization for MonitorX API."""
+import asyncio
+import hashlib
 import os
+import time
+from collections import OrderedDict
 from typing import Optional
 from datetime import datetime, timedelta
 from fastapi import Security, HTTPException, status, Depends
@@ -52,13 +56,13 @@ class APIKeyAuth:
             )
 
         if api_key not in self.api_keys:
-            logger.warning(f"Invalid API key attempted: {api_key[:8]}...")
+            logger.opt(lazy=True).warning("Invalid API key attempted: {}...", lambda: api_key[:8])
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid API key"
             )
 
-        logger.debug(f"Authenticated with API key: {api_key[:8]}...")
+        logger.opt(lazy=True).debug("Authenticated with API key: {}...", lambda: api_key[:8])
         return api_key
 
 
@@ -66,8 +70,10 @@ class APIKeyAuth:
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "dev-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "30"))
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+TOKEN_CACHE_SIZE = 4096
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
@@ -98,6 +104,8 @@ class JWTAuth:
         self.enabled = os.getenv("JWT_ENABLED", "false").lower() == "true"
         self.secret_key = SECRET_KEY
         self.algorithm = ALGORITHM
+        # Verified payloads keyed by token digest, least recently used first
+        self._decode_cache: "OrderedDict[bytes, dict]" = OrderedDict()
 
     def create_access_token(
         self, data: dict, expires_delta: Optional[timedelta] = None
@@ -123,6 +131,34 @@ class JWTAuth:
         """Hash password."""
         return pwd_context.hash(password)
 
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password in a worker thread so bcrypt doesn't block the event loop."""
+        return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
+
+    async def get_password_hash_async(self, password: str) -> str:
+        """Hash password in a worker thread so bcrypt doesn't block the event loop."""
+        return await asyncio.to_thread(pwd_context.hash, password)
+
+    def _decode_token(self, token: str) -> dict:
+        """Decode a JWT, reusing the payload of an already verified, unexpired token."""
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        payload = self._decode_cache.get(key)
+        if payload is not None:
+            if payload["exp"] > time.time():
+                self._decode_cache.move_to_end(key)
+                return payload
+            del self._decode_cache[key]
+
+        payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+
+        # Only tokens that expire can be cached safely
+        if "exp" in payload:
+            self._decode_cache[key] = payload
+            if len(self._decode_cache) > TOKEN_CACHE_SIZE:
+                self._decode_cache.popitem(last=False)
+
+        return payload
+
     async def get_current_user(
         self, credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
     ) -> User:
@@ -138,9 +174,7 @@ class JWTAuth:
             )
 
         try:
-            payload = jwt.decode(
-                credentials.credentials, self.secret_key, algorithms=[self.algorithm]
-            )
+            payload = self._decode_token(credentials.credentials)
             username: str = payload.get("sub")
             scopes: list = payload.get("scopes", [])
 
@@ -179,9 +213,16 @@ jwt_auth = JWTAuth()
 
 
 # Dependency functions for FastAPI
-def get_api_key(api_key: Optional[str] = Security(API_KEY_HEADER)) -> str:
-    """FastAPI dependency for API key authentication."""
-    return api_key_auth.verify_api_key(api_key)
+if api_key_auth.enabled:
+    # The bound method declares the header itself, so no wrapper frame is needed
+    get_api_key = api_key_auth.verify_api_key
+else:
+    def get_api_key() -> str:
+        """FastAPI dependency for API key authentication (disabled)."""
+        return "anonymous"
+
+# Route dependencies; empty when API keys are disabled so no header is ever parsed
+api_key_dependencies = [Depends(get_api_key)] if api_key_auth.enabled else []
 
 
 async def get_current_user(
@@ -13,42 +13,74 @@
 # limitations under the License.
 
 import os
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+# Field factories: each setting is read from the environment when Config() is built
+def _str(name: str, default: Optional[str] = None) -> Any:
+    return field(default_factory=lambda: os.getenv(name, default))
+
+
+def _int(name: str, default: str) -> Any:
+    return field(default_factory=lambda: int(os.getenv(name, default)))
+
+
+def _bool(name: str, default: str) -> Any:
+    return field(default_factory=lambda: os.getenv(name, default).lower() == "true")
+
+
+def _tuple(name: str, default: str) -> Any:
+    return field(default_factory=lambda: tuple(
+        item.strip() for item in os.getenv(name, default).split(",") if item.strip()
+    ))
+
+
+@dataclass(frozen=True)
 class Config:
     # Server configuration
-    API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
-    API_PORT: int = int(os.getenv("API_PORT", "8000"))
-    DASHBOARD_PORT: int = int(os.getenv("DASHBOARD_PORT", "8501"))
+    API_HOST: str = _str("API_HOST", "0.0.0.0")
+    API_PORT: int = _int("API_PORT", "8000")
+    DASHBOARD_PORT: int = _int("DASHBOARD_PORT", "8501")
 
     # InfluxDB configuration
-    INFLUXDB_URL: str = os.getenv("INFLUXDB_URL", "http://localhost:8086")
-    INFLUXDB_TOKEN: Optional[str] = os.getenv("INFLUXDB_TOKEN")
-    INFLUXDB_ORG: str = os.getenv("INFLUXDB_ORG", "monitorx")
-    INFLUXDB_BUCKET: str = os.getenv("INFLUXDB_BUCKET", "metrics")
+    INFLUXDB_URL: str = _str("INFLUXDB_URL", "http://localhost:8086")
+    INFLUXDB_TOKEN: Optional[str] = _str("INFLUXDB_TOKEN")
+    INFLUXDB_ORG: str = _str("INFLUXDB_ORG", "monitorx")
+    INFLUXDB_BUCKET: str = _str("INFLUXDB_BUCKET", "metrics")
 
     # Logging configuration
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = _str("LOG_LEVEL", "INFO")
 
     # Security configuration
-    API_KEY_ENABLED: bool = os.getenv("API_KEY_ENABLED", "false").lower() == "true"
-    API_KEYS: str = os.getenv("API_KEYS", "")
-    JWT_ENABLED: bool = os.getenv("JWT_ENABLED", "false").lower() == "true"
-    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "dev-secret-key-change-in-production")
-    JWT_EXPIRE_MINUTES: int = int(os.getenv("JWT_EXPIRE_MINUTES", "30"))
+    API_KEY_ENABLED: bool = _bool("API_KEY_ENABLED", "false")
+    API_KEYS: Tuple[str, ...] = _tuple("API_KEYS", "")
+    # Sent by the dashboard as X-API-Key; needed when API_KEY_ENABLED is true
+    DASHBOARD_API_KEY: Optional[str] = _str("DASHBOARD_API_KEY")
+    JWT_ENABLED: bool = _bool("JWT_ENABLED", "false")
+    JWT_SECRET_KEY: str = _str("JWT_SECRET_KEY", "dev-secret-key-change-in-production")
+    JWT_EXPIRE_MINUTES: int = _int("JWT_EXPIRE_MINUTES", "30")
 
     # Rate limiting configuration
-    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true"
-    RATE_LIMIT_REQUESTS: int = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
-    RATE_LIMIT_WINDOW: int = int(os.getenv("RATE_LIMIT_WINDOW", "60"))
+    RATE_LIMIT_ENABLED: bool = _bool("RATE_LIMIT_ENABLED", "false")
+    RATE_LIMIT_REQUESTS: int = _int("RATE_LIMIT_REQUESTS", "100")
+    RATE_LIMIT_WINDOW: int = _int("RATE_LIMIT_WINDOW", "60")
+
+    # Fire-and-forget metric datagrams from the SDK's sink_url; unauthenticated,
+    # so both are off unless set
+    METRICS_UDP_PORT: int = _int("METRICS_UDP_PORT", "0")
+    METRICS_UNIX_SOCKET: Optional[str] = _str("METRICS_UNIX_SOCKET")
+
+    # Response validation (re-checks outgoing payloads against response models)
+    VALIDATE_API_RESPONSE: bool = _bool("VALIDATE_API_RESPONSE", "false")
 
     # CORS configuration
-    CORS_ORIGINS: list = os.getenv("CORS_ORIGINS", "*").split(",")
-    CORS_ALLOW_CREDENTIALS: bool = os.getenv("CORS_ALLOW_CREDENTIALS", "true").lower() == "true"
+    CORS_ORIGINS: Tuple[str, ...] = _tuple("CORS_ORIGINS", "*")
+    CORS_ALLOW_CREDENTIALS: bool = _bool("CORS_ALLOW_CREDENTIALS", "true")
 
     # Default thresholds
     DEFAULT_LATENCY_THRESHOLD: float = 1000.0  # ms
@@ -58,4 +90,10 @@ class Config:
     DEFAULT_MEMORY_USAGE_THRESHOLD: float = 0.8  # 80%
 
 
-config = Config()
\ No newline at end of file
+@cache
+def get_config() -> Config:
+    """Read the environment once and return the shared configuration."""
+    return Config()
+
+
+config = get_config()
@@ -14,14 +14,18 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from streamlit_autorefresh import st_autorefresh
 import httpx
 from datetime import datetime, timedelta
 import asyncio
-from typing import Dict, List, Any
-import json
+import threading
+from contextvars import ContextVar
+from typing import Dict, List, Any, Optional
+import orjson
 import io
 import time
 
@@ -32,227 +36,440 @@ except ImportError:
     from monitorx.config import config
 
 
+# Errors raised while a coroutine runs on the loop thread are collected here
+# and shown by run_async once it is back on the script thread
+_error_messages: ContextVar[Optional[List[str]]] = ContextVar("dashboard_error_messages", default=None)
+
+
+def _report_error(message: str) -> None:
+    """Show an API error, deferring it to run_async when called on the loop thread."""
+    errors = _error_messages.get()
+    if errors is None:
+        st.error(message)
+    else:
+        errors.append(message)
+
+
 class DashboardAPI:
     """API client for the dashboard."""
 
-    def __init__(self, base_url: str = f"http://{config.API_HOST}:{config.API_PORT}"):
+    def __init__(
+        self,
+        base_url: str = f"http://{config.API_HOST}:{config.API_PORT}",
+        api_key: Optional[str] = config.DASHBOARD_API_KEY
+    ):
         self.base_url = base_url
+        self._headers = {"X-API-Key": api_key} if api_key else {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first use.
+
+        Connections are bound to the loop that opened them, so a new client is
+        created when called from a different event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=httpx.Timeout(10.0)
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     async def get_models(self) -> List[Dict[str, Any]]:
         """Get registered models."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(f"{self.base_url}/api/v1/models")
-                response.raise_for_status()
-                return response.json().get("models", [])
-            except Exception as e:
-                st.error(f"Failed to fetch models: {e}")
-                return []
+        try:
+            client = await self._get_client()
+            response = await client.get("/api/v1/models")
+            response.raise_for_status()
+            return orjson.loads(response.content).get("models", [])
+        except Exception as e:
+            _report_error(f"Failed to fetch models: {e}")
+            return []
 
     async def get_summary_stats(self, model_id: str = None, since_hours: int = 24) -> Dict[str, Any]:
         """Get summary statistics."""
-        async with httpx.AsyncClient() as client:
-            try:
-                params = {"since_hours": since_hours}
-                if model_id:
-                    params["model_id"] = model_id
-
-                response = await client.get(f"{self.base_url}/api/v1/summary", params=params)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                st.error(f"Failed to fetch summary stats: {e}")
-                return {}
+        try:
+            client = await self._get_client()
+            params = {"since_hours": since_hours}
+            if model_id:
+                params["model_id"] = model_id
+
+            response = await client.get("/api/v1/summary", params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except Exception as e:
+            _report_error(f"Failed to fetch summary stats: {e}")
+            return {}
 
     async def get_metrics(self, model_id: str = None, since_hours: int = 24, limit: int = 1000) -> List[Dict[str, Any]]:
         """Get inference metrics."""
-        async with httpx.AsyncClient() as client:
-            try:
-                params = {"since_hours": since_hours, "limit": limit}
-                if model_id:
-                    params["model_id"] = model_id
-
-                response = await client.get(f"{self.base_url}/api/v1/metrics/inference", params=params)
-                response.raise_for_status()
-                return response.json().get("metrics", [])
-            except Exception as e:
-                st.error(f"Failed to fetch metrics: {e}")
-                return []
+        try:
+            client = await self._get_client()
+            params = {"since_hours": since_hours, "limit": limit}
+            if model_id:
+                params["model_id"] = model_id
+
+            response = await client.get("/api/v1/metrics/inference", params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content).get("metrics", [])
+        except Exception as e:
+            _report_error(f"Failed to fetch metrics: {e}")
+            return []
 
     async def get_alerts(self, model_id: str = None, since_hours: int = 168, resolved: bool = None) -> List[Dict[str, Any]]:
         """Get alerts."""
-        async with httpx.AsyncClient() as client:
-            try:
-                params = {"since_hours": since_hours}
-                if model_id:
-                    params["model_id"] = model_id
-                if resolved is not None:
-                    params["resolved"] = resolved
-
-                response = await client.get(f"{self.base_url}/api/v1/alerts", params=params)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                st.error(f"Failed to fetch alerts: {e}")
-                return []
+        try:
+            client = await self._get_client()
+            params = {"since_hours": since_hours}
+            if model_id:
+                params["model_id"] = model_id
+            if resolved is not None:
+                params["resolved"] = resolved
+
+            response = await client.get("/api/v1/alerts", params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except Exception as e:
+            _report_error(f"Failed to fetch alerts: {e}")
+            return []
 
     async def resolve_alert(self, alert_id: str) -> bool:
         """Resolve an alert."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/alerts/resolve",
-                    json={"alert_id": alert_id}
-                )
-                response.raise_for_status()
-                return True
-            except Exception as e:
-                st.error(f"Failed to resolve alert: {e}")
-                return False
+        try:
+            client = await self._get_client()
+            response = await client.post(
+                "/api/v1/alerts/resolve",
+                json={"alert_id": alert_id}
+            )
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            _report_error(f"Failed to resolve alert: {e}")
+            return False
 
     async def get_aggregated_metrics(self, model_id: str = None, since_hours: int = 6, window: str = "5m") -> Dict[str, Any]:
         """Get aggregated metrics."""
-        async with httpx.AsyncClient() as client:
-            try:
-                params = {"since_hours": since_hours, "window": window}
-                if model_id:
-                    params["model_id"] = model_id
+        try:
+            client = await self._get_client()
+            params = {"since_hours": since_hours, "window": window}
+            if model_id:
+                params["model_id"] = model_id
+
+            response = await client.get("/api/v1/metrics/aggregated", params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content).get("aggregated_metrics", {})
+        except Exception as e:
+            _report_error(f"Failed to fetch aggregated metrics: {e}")
+            return {}
+
 
-                response = await client.get(f"{self.base_url}/api/v1/metrics/aggregated", params=params)
-                response.raise_for_status()
-                return response.json().get("aggregated_metrics", {})
-            except Exception as e:
-                st.error(f"Failed to fetch aggregated metrics: {e}")
-                return {}
+@st.cache_resource
+def get_api() -> DashboardAPI:
+    """Share one API client (and its connection pool) across reruns and sessions."""
+    return DashboardAPI()
 
 
 # Initialize API client
-api = DashboardAPI()
+api = get_api()
+
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Start one long-lived event loop thread that all async API calls run on.
+
+    Keeping the loop alive across reruns keeps the pooled client's
+    connections open.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="dashboard-event-loop", daemon=True).start()
+    return loop
 
 
 def run_async(coro):
     """Helper to run async functions in Streamlit."""
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+    errors: List[str] = []
 
+    async def run():
+        # Tasks spawned by coro (e.g. asyncio.gather) inherit this context
+        _error_messages.set(errors)
+        return await coro
 
-def create_metric_charts(metrics_data: Dict[str, List[Dict[str, Any]]]):
-    """Create time-series charts for metrics."""
-    if not metrics_data:
-        st.warning("No aggregated metrics data available")
-        return
+    result = asyncio.run_coroutine_threadsafe(run(), get_event_loop()).result()
+
+    # Streamlit elements must be created from the script thread
+    for message in errors:
+        st.error(message)
+    return result
+
+
+# Recent metrics fetched for the metrics tab, and how many of them the table shows
+METRICS_FETCH_LIMIT = 500
+METRICS_PREVIEW_ROWS = 20
+
+
+async def fetch_dashboard_data(model_id: Optional[str], since_hours: int):
+    """Fetch the overview and metrics tab data concurrently."""
+    return await asyncio.gather(
+        api.get_summary_stats(model_id, since_hours),
+        api.get_aggregated_metrics(model_id, min(since_hours, 24), "5m"),
+        api.get_metrics(model_id, since_hours, METRICS_FETCH_LIMIT)
+    )
+
+
+# API responses are cached per argument tuple, so reruns that don't change the
+# filters (auto-refresh countdown, widget clicks) are served from memory
+CACHE_TTL = 30
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def cached_models() -> List[Dict[str, Any]]:
+    """Registered models, cached."""
+    return run_async(api.get_models())
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def cached_dashboard_data(model_id: Optional[str], since_hours: int):
+    """Overview and metrics tab data, cached."""
+    return run_async(fetch_dashboard_data(model_id, since_hours))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def cached_alerts(model_id: Optional[str], since_hours: int, resolved: Optional[bool]) -> List[Dict[str, Any]]:
+    """Alerts, cached."""
+    return run_async(api.get_alerts(model_id, since_hours, resolved))
+
+
+# Most points a chart trace is drawn with; roughly one per horizontal pixel
+MAX_CHART_POINTS = 1500
+
+# (metrics key, trace name, subplot row, subplot col)
+CHART_TRACES = (
+    ("latency", "Latency", 1, 1),
+    ("throughput", "Throughput", 1, 2),
+    ("error_rate", "Error Rate", 2, 1),
+    ("gpu_memory", "GPU Memory", 2, 2),
+)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        # Keep the point forming the largest triangle with the previous pick and
+        # the next bucket's average
+        area = np.abs(
+            (x[a] - next_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
 
-    # Create subplots
+    return indices
+
+
+@st.cache_resource
+def _perf_figure_template() -> go.Figure:
+    """Build the 2x2 performance chart layout, with one empty trace per metric, once."""
     fig = make_subplots(
         rows=2, cols=2,
         subplot_titles=('Latency (ms)', 'Throughput', 'Error Rate', 'GPU Memory Usage'),
         specs=[[{"secondary_y": False}, {"secondary_y": False}],
                [{"secondary_y": False}, {"secondary_y": False}]]
     )
+    for _, name, row, col in CHART_TRACES:
+        fig.add_trace(go.Scattergl(x=[], y=[], name=name, mode='lines'), row=row, col=col)
 
-    # Latency
-    if "latency" in metrics_data and metrics_data["latency"]:
-        df = pd.DataFrame(metrics_data["latency"])
-        if not df.empty:
-            df['time'] = pd.to_datetime(df['time'])
-            fig.add_trace(
-                go.Scatter(x=df['time'], y=df['value'], name='Latency', mode='lines'),
-                row=1, col=1
-            )
+    fig.update_layout(height=600, showlegend=False)
+    return fig
 
-    # Throughput
-    if "throughput" in metrics_data and metrics_data["throughput"]:
-        df = pd.DataFrame(metrics_data["throughput"])
-        if not df.empty:
-            df['time'] = pd.to_datetime(df['time'])
-            fig.add_trace(
-                go.Scatter(x=df['time'], y=df['value'], name='Throughput', mode='lines'),
-                row=1, col=2
-            )
 
-    # Error Rate
-    if "error_rate" in metrics_data and metrics_data["error_rate"]:
-        df = pd.DataFrame(metrics_data["error_rate"])
-        if not df.empty:
-            df['time'] = pd.to_datetime(df['time'])
-            fig.add_trace(
-                go.Scatter(x=df['time'], y=df['value'], name='Error Rate', mode='lines'),
-                row=2, col=1
-            )
+def create_metric_charts(metrics_data: Dict[str, Dict[str, List[Any]]]):
+    """Create time-series charts for metrics."""
+    if not metrics_data:
+        st.warning("No aggregated metrics data available")
+        return
 
-    # GPU Memory
-    if "gpu_memory" in metrics_data and metrics_data["gpu_memory"]:
-        df = pd.DataFrame(metrics_data["gpu_memory"])
-        if not df.empty:
-            df['time'] = pd.to_datetime(df['time'])
-            fig.add_trace(
-                go.Scatter(x=df['time'], y=df['value'], name='GPU Memory', mode='lines'),
-                row=2, col=2
-            )
+    # The cached template is shared between sessions, so fill in a copy
+    fig = go.Figure(_perf_figure_template())
+
+    for trace, (key, _, _, _) in zip(fig.data, CHART_TRACES):
+        # Series arrive column-wise, so they convert straight to arrays
+        series = metrics_data.get(key)
+        if not series or not series['time']:
+            continue
+
+        values = np.asarray(series['value'], dtype=float)  # null -> NaN
+        present = ~np.isnan(values)
+        if not present.any():
+            continue
+
+        times = pd.to_datetime(series['time'])[present]
+        values = values[present]
+
+        # Downsample long series so the browser only draws what fits on screen
+        keep = lttb_indices(times.asi8.astype(float), values, MAX_CHART_POINTS)
+
+        trace.update(x=times[keep], y=values[keep])
 
-    fig.update_layout(height=600, showlegend=False)
     st.plotly_chart(fig, use_container_width=True)
 
 
-def export_to_csv(data: pd.DataFrame, filename: str) -> bytes:
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def model_performance(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-model mean/median latency and mean error rate, computed on category codes."""
+    codes = df['model_id'].cat.codes.to_numpy()
+    n_models = len(df['model_id'].cat.categories)
+    counts = np.bincount(codes, minlength=n_models)
+    latency = df['latency'].to_numpy(dtype=float)
+
+    # Median: sort by (model, latency) once, then read the middle of each model's run
+    order = np.lexsort((latency, codes))
+    sorted_latency = latency[order]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    lower = sorted_latency[np.minimum(starts + (counts - 1) // 2, len(latency) - 1)]
+    upper = sorted_latency[np.minimum(starts + counts // 2, len(latency) - 1)]
+
+    # error_rate is optional per metric, so average only the reported values
+    error_rate = df['error_rate'].to_numpy(dtype=float)
+    reported = ~np.isnan(error_rate)
+    error_counts = np.bincount(codes[reported], minlength=n_models)
+    error_sums = np.bincount(codes[reported], weights=error_rate[reported], minlength=n_models)
+
+    observed = counts > 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stats = pd.DataFrame(
+            {
+                'Mean latency (ms)': np.bincount(codes, weights=latency, minlength=n_models) / counts,
+                'Median latency (ms)': (lower + upper) / 2,
+                'Mean error rate': error_sums / error_counts
+            },
+            index=pd.Index(df['model_id'].cat.categories, name='model_id')
+        )
+    return stats[observed].round(2)
+
+
+# Download buttons need their bytes at render time, so exports are cached by
+# content; the underscore filename is left out of the cache key
+@st.cache_data(ttl=60, show_spinner=False)
+def export_to_csv(data: pd.DataFrame, _filename: str) -> bytes:
     """Export DataFrame to CSV bytes."""
     return data.to_csv(index=False).encode('utf-8')
 
 
-def export_to_json(data: List[Dict[str, Any]], filename: str) -> bytes:
+@st.cache_data(ttl=60, show_spinner=False)
+def export_to_json(data: List[Dict[str, Any]], _filename: str) -> bytes:
     """Export data to JSON bytes."""
-    return json.dumps(data, indent=2, default=str).encode('utf-8')
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+# Low-cardinality string columns; as categoricals, grouping and counting work
+# on integer codes instead of hashing every string
+CATEGORICAL_COLUMNS = ('model_id', 'model_type', 'severity', 'alert_type', 'drift_type', 'environment')
+
 
+def as_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the repeated string columns of an API result to categoricals."""
+    columns = [col for col in CATEGORICAL_COLUMNS if col in df]
+    return df.astype(dict.fromkeys(columns, 'category')) if columns else df
 
-def display_alerts(alerts: List[Dict[str, Any]]):
+
+# Color code by severity
+SEVERITY_ICONS = {
+    'low': '🟢',
+    'medium': '🟡',
+    'high': '🟠',
+    'critical': '🔴'
+}
+
+
+def display_alerts(alerts: pd.DataFrame):
     """Display alerts in a formatted way with resolution capability."""
-    if not alerts:
+    if alerts.empty:
         st.success("No active alerts")
         return
 
-    # Convert to DataFrame for better display
-    df = pd.DataFrame(alerts)
-    df['timestamp'] = pd.to_datetime(df['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
-
-    # Color code by severity
-    severity_colors = {
-        'low': '🟢',
-        'medium': '🟡',
-        'high': '🟠',
-        'critical': '🔴'
-    }
-
-    for _, alert in df.iterrows():
-        severity_icon = severity_colors.get(alert['severity'], '⚪')
-        status_icon = '✅' if alert['resolved'] else '❌'
+    # Derive every display column once, column-wise, on a copy of the frame
+    df = alerts.assign(
+        timestamp=pd.to_datetime(alerts['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S'),
+        severity_icon=alerts['severity'].map(lambda severity: SEVERITY_ICONS.get(severity, '⚪')).astype(str),
+        severity_title=alerts['severity'].str.title(),
+        type_title=alerts['alert_type'].str.replace('_', ' ').str.title(),
+        model_id=alerts['model_id'].astype(str),
+        status=np.where(alerts['resolved'], 'Resolved ✅', 'Active ❌')
+    )
 
-        with st.expander(f"{severity_icon} {alert['alert_type'].title()} Alert - {alert['model_id']}"):
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.write(f"**Severity:** {alert['severity'].title()}")
-                st.write(f"**Type:** {alert['alert_type'].replace('_', ' ').title()}")
-            with col2:
-                st.write(f"**Status:** {'Resolved' if alert['resolved'] else 'Active'} {status_icon}")
-                st.write(f"**Timestamp:** {alert['timestamp']}")
-            with col3:
-                st.write(f"**Model:** {alert['model_id']}")
+    # One table for every alert instead of an expander and widgets per row
+    st.dataframe(
+        df[['severity_icon', 'severity_title', 'type_title', 'model_id', 'status', 'timestamp', 'message']],
+        column_config={
+            'severity_icon': st.column_config.TextColumn('', width='small'),
+            'severity_title': 'Severity',
+            'type_title': 'Type',
+            'model_id': 'Model',
+            'status': 'Status',
+            'timestamp': 'Timestamp',
+            'message': 'Message'
+        },
+        use_container_width=True,
+        hide_index=True
+    )
 
-            st.write(f"**Message:** {alert['message']}")
+    active = df[~df['resolved']]
+    if active.empty:
+        return
 
-            if not alert['resolved']:
-                if st.button(f"✓ Resolve Alert", key=f"resolve_{alert['id']}", type="primary"):
-                    # Resolve alert via API
-                    success = run_async(api.resolve_alert(alert['id']))
-                    if success:
-                        st.success(f"✅ Alert {alert['id']} resolved successfully!")
-                        time.sleep(1)
-                        st.rerun()
-                    else:
-                        st.error("Failed to resolve alert. Please try again.")
+    # A single resolve control for whichever active alert is selected
+    labels = dict(zip(
+        active['id'],
+        active['severity_icon'] + ' ' + active['type_title'] + ' - ' + active['model_id'] + ' (' + active['timestamp'] + ')'
+    ))
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        alert_id = st.selectbox("Resolve which?", list(labels), format_func=labels.get, key="resolve_alert_id")
+    with col2:
+        st.write("")
+        resolve_clicked = st.button("✓ Resolve Alert", key="resolve_alert", type="primary")
+
+    if resolve_clicked:
+        # Resolve alert via API
+        success = run_async(api.resolve_alert(alert_id))
+        if success:
+            # Drop cached alerts and summary so the resolution shows immediately
+            cached_alerts.clear()
+            cached_dashboard_data.clear()
+            st.success(f"✅ Alert {alert_id} resolved successfully!")
+            time.sleep(1)
+            st.rerun()
+        else:
+            st.error("Failed to resolve alert. Please try again.")
 
 
 def main():
@@ -271,7 +488,7 @@ def main():
     st.sidebar.header("Filters")
 
     # Get models
-    models = run_async(api.get_models())
+    models = cached_models()
     model_options = ["All Models"] + [f"{m['name']} ({m['id']})" for m in models]
     selected_model = st.sidebar.selectbox("Select Model", model_options)
 
@@ -295,22 +512,19 @@ def main():
     refresh_interval = st.sidebar.slider("Refresh Interval (seconds)", 5, 120, 30, 5, disabled=not auto_refresh)
 
     if auto_refresh:
-        # Use session state to track last refresh time
-        if 'last_refresh' not in st.session_state:
-            st.session_state.last_refresh = time.time()
+        # The browser triggers the rerun, so the script never sleeps or spins
+        refresh_count = st_autorefresh(interval=refresh_interval * 1000, key="dash_refresh")
+        if refresh_count != st.session_state.get("refresh_count", 0):
+            st.session_state.refresh_count = refresh_count
+            # A refresh tick should fetch fresh data rather than the cached copy
+            cached_dashboard_data.clear()
+            cached_alerts.clear()
 
-        current_time = time.time()
-        elapsed = current_time - st.session_state.last_refresh
+        st.sidebar.info(f"⏱️ Refreshing every {refresh_interval}s")
 
-        if elapsed >= refresh_interval:
-            st.session_state.last_refresh = current_time
-            st.rerun()
-
-        # Show countdown
-        remaining = int(refresh_interval - elapsed)
-        st.sidebar.info(f"⏱️ Next refresh in {remaining}s")
-        time.sleep(1)
-        st.rerun()
+    # Overview and metrics data only depend on the sidebar filters, so fetch
+    # them together; total wait is the slowest call rather than the sum
+    summary, aggregated_data, metrics = cached_dashboard_data(model_id, since_hours)
 
     # Main content tabs
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "📈 Metrics", "🚨 Alerts", "🔧 Models"])
@@ -318,9 +532,6 @@ def main():
     with tab1:
         st.header("System Overview")
 
-        # Get summary stats
-        summary = run_async(api.get_summary_stats(model_id, since_hours))
-
         if summary:
             # KPI metrics
             col1, col2, col3, col4, col5 = st.columns(5)
@@ -362,18 +573,13 @@ def main():
 
         # Time series charts
         st.subheader("Performance Trends")
-        aggregated_data = run_async(api.get_aggregated_metrics(model_id, min(since_hours, 24), "5m"))
         create_metric_charts(aggregated_data)
 
     with tab2:
         st.header("Detailed Metrics")
 
-        # Get recent metrics
-        metrics = run_async(api.get_metrics(model_id, since_hours, 500))
-
         if metrics:
-            df = pd.DataFrame(metrics)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            df = as_categories(pd.DataFrame(metrics))
 
             # Export buttons
             col1, col2, col3 = st.columns([6, 1, 1])
@@ -400,24 +606,27 @@ def main():
                     help="Download metrics as JSON"
                 )
 
-            # Latest metrics table
-            display_df = df[['timestamp', 'model_id', 'model_type', 'latency', 'error_rate']].head(20)
-            display_df['timestamp'] = display_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+            # Latest metrics table; the API returns newest first, so only the
+            # preview rows need their timestamps parsed and formatted
+            display_df = df[['timestamp', 'model_id', 'model_type', 'latency', 'error_rate']].head(METRICS_PREVIEW_ROWS)
+            display_df = display_df.assign(
+                timestamp=pd.to_datetime(display_df['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
+            )
             st.dataframe(display_df, use_container_width=True)
 
             # Latency distribution
             st.subheader("Latency Distribution")
-            fig = px.histogram(df, x='latency', nbins=30, title="Latency Distribution")
-            fig.update_layout(xaxis_title="Latency (ms)", yaxis_title="Count")
+            # Bin here so the chart receives 30 bars rather than every row
+            counts, edges = np.histogram(df['latency'].to_numpy(dtype=float), bins=30)
+            fig = px.bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, title="Latency Distribution")
+            fig.update_traces(width=np.diff(edges))
+            fig.update_layout(xaxis_title="Latency (ms)", yaxis_title="Count", bargap=0)
             st.plotly_chart(fig, use_container_width=True)
 
             # Model performance comparison (if multiple models)
-            if not model_id and len(df['model_id'].unique()) > 1:
+            if not model_id and df['model_id'].nunique() > 1:
                 st.subheader("Model Performance Comparison")
-                model_stats = df.groupby('model_id').agg({
-                    'latency': ['mean', 'median'],
-                    'error_rate': 'mean'
-                }).round(2)
+                model_stats = model_performance(df[['model_id', 'latency', 'error_rate']])
                 st.dataframe(model_stats)
 
         else:
@@ -443,8 +652,9 @@ def main():
 
         alert_hours = 24 if alert_time_range == "Last 24 Hours" else 168
 
-        # Get alerts
-        alerts = run_async(api.get_alerts(model_id, alert_hours, None if show_resolved else False))
+        # Get alerts; one DataFrame serves the export, table and summary below
+        alerts = cached_alerts(model_id, alert_hours, None if show_resolved else False)
+        alerts_df = as_categories(pd.DataFrame(alerts))
 
         # Enable export buttons if we have alerts
         if alerts:
@@ -456,7 +666,6 @@ def main():
                 pass
             with col3:
                 # CSV export
-                alerts_df = pd.DataFrame(alerts)
                 csv_data = export_to_csv(alerts_df, f"alerts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
                 st.download_button(
                     label="📥 CSV",
@@ -479,12 +688,12 @@ def main():
                 )
 
         # Display alerts
-        display_alerts(alerts)
+        display_alerts(alerts_df)
 
         # Alert statistics
         if alerts:
             st.subheader("Alert Summary")
-            df = pd.DataFrame(alerts)
+            df = alerts_df
 
             col1, col2 = st.columns(2)
             with col1:
@@ -13,10 +13,12 @@
 # limitations under the License.
 
 """Rate limiting middleware for MonitorX API."""
+import asyncio
+import hashlib
 import os
 import time
-from typing import Dict, Tuple
-from collections import defaultdict
+from typing import Deque, Dict, Optional, Tuple
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -29,32 +31,27 @@ class RateLimiter:
     def __init__(
         self,
         requests_per_window: int = 100,
-        window_seconds: int = 60
+        window_seconds: int = 60,
+        max_clients: int = 10000
     ):
         self.requests_per_window = requests_per_window
         self.window_seconds = window_seconds
-        # Store: {client_id: [(timestamp, request_count), ...]}
-        self.requests: Dict[str, list] = defaultdict(list)
-        self.last_cleanup = time.time()
-        self.cleanup_interval = 300  # Cleanup every 5 minutes
+        self.max_clients = max_clients
+        # Store: {client_id: deque of request timestamps, oldest first}, kept in
+        # least-recently-seen order so the table can be capped at max_clients
+        self.requests: OrderedDict[str, Deque[float]] = OrderedDict()
+        self.cleanup_interval = 300  # Cleanup every 5 minutes, off the request path
 
     def _cleanup_old_entries(self):
         """Remove old entries to prevent memory growth."""
         now = time.time()
-
-        if now - self.last_cleanup < self.cleanup_interval:
-            return
-
         cutoff = now - self.window_seconds
-        for client_id in list(self.requests.keys()):
-            self.requests[client_id] = [
-                (ts, count) for ts, count in self.requests[client_id]
-                if ts > cutoff
-            ]
-            if not self.requests[client_id]:
+        for client_id, timestamps in list(self.requests.items()):
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+            if not timestamps:
                 del self.requests[client_id]
 
-        self.last_cleanup = now
         logger.debug(f"Rate limiter cleanup completed. Active clients: {len(self.requests)}")
 
     def is_allowed(self, client_id: str) -> Tuple[bool, dict]:
@@ -64,19 +61,24 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, rate_limit_info)
         """
-        self._cleanup_old_entries()
-
         now = time.time()
         window_start = now - self.window_seconds
 
-        # Get requests in current window
-        current_requests = [
-            (ts, count) for ts, count in self.requests[client_id]
-            if ts > window_start
-        ]
+        # Drop requests that fell out of the window; timestamps are in arrival
+        # order, so expired ones are always at the left
+        timestamps = self.requests.get(client_id)
+        if timestamps is None:
+            timestamps = self.requests[client_id] = deque()
+            if len(self.requests) > self.max_clients:
+                # Forget the least recently seen client
+                self.requests.popitem(last=False)
+        else:
+            self.requests.move_to_end(client_id)
+
+        while timestamps and timestamps[0] <= window_start:
+            timestamps.popleft()
 
-        # Calculate total requests in window
-        total_requests = sum(count for _, count in current_requests)
+        total_requests = len(timestamps)
 
         # Rate limit info for headers
         info = {
@@ -89,13 +91,7 @@ class RateLimiter:
             return False, info
 
         # Add current request
-        self.requests[client_id].append((now, 1))
-
-        # Keep only recent entries
-        self.requests[client_id] = [
-            (ts, count) for ts, count in self.requests[client_id]
-            if ts > window_start
-        ]
+        timestamps.append(now)
 
         return True, info
 
@@ -122,26 +118,42 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             window_seconds=self.window_seconds
         )
 
+        # Periodic limiter cleanup; started on the first rate-limited request,
+        # since there may be no running event loop yet at construction time
+        self._cleanup_task: Optional[asyncio.Task] = None
+
         # Paths to exclude from rate limiting
-        self.excluded_paths = {"/docs", "/redoc", "/openapi.json", "/", "/api/v1/health"}
+        self.excluded_paths = frozenset({"/docs", "/redoc", "/openapi.json", "/", "/api/v1/health"})
 
         logger.info(
             f"Rate limiting {'enabled' if self.enabled else 'disabled'}: "
             f"{self.requests_per_minute} requests per {self.window_seconds}s"
         )
 
+    async def _background_cleanup(self):
+        """Periodically drop expired rate limiter entries."""
+        while True:
+            await asyncio.sleep(self.limiter.cleanup_interval)
+            self.limiter._cleanup_old_entries()
+
     def _get_client_id(self, request: Request) -> str:
         """Get unique client identifier (API key or IP)."""
+        # Raw ASGI headers: lower-cased (name, value) byte pairs, read in one pass
+        headers = dict(request.scope["headers"])
+
         # Prefer API key if present
-        api_key = request.headers.get("X-API-Key")
+        api_key = headers.get(b"x-api-key")
         if api_key:
-            return f"api_key:{api_key[:16]}"  # Use first 16 chars
+            # Short digest of the whole key: keys sharing a prefix stay distinct,
+            # and the key itself never ends up in limiter state or logs
+            digest = hashlib.blake2b(api_key, digest_size=8, usedforsecurity=False).hexdigest()
+            return f"api_key:{digest}"
 
         # Fall back to IP address
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = headers.get(b"x-forwarded-for")
         if forwarded_for:
             # Get first IP in chain
-            client_ip = forwarded_for.split(",")[0].strip()
+            client_ip = forwarded_for.partition(b",")[0].strip().decode("latin-1")
         else:
             client_ip = request.client.host if request.client else "unknown"
 
@@ -149,10 +161,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next):
         """Process request with rate limiting."""
-        # Skip if disabled or excluded path
-        if not self.enabled or request.url.path in self.excluded_paths:
+        # Skip excluded paths first; the raw ASGI path avoids building a URL object
+        if request.scope.get("path", "") in self.excluded_paths or not self.enabled:
             return await call_next(request)
 
+        if self._cleanup_task is None:
+            self._cleanup_task = asyncio.create_task(self._background_cleanup())
+
         # Get client identifier
         client_id = self._get_client_id(request)
 
@@ -210,19 +225,21 @@ class TokenBucketRateLimiter:
     ):
         self.rate = rate
         self.capacity = capacity
-        # Store: {client_id: (tokens, last_update)}
+        # Store: {client_id: (tokens, last_update)}, last_update from time.monotonic()
         self.buckets: Dict[str, Tuple[float, float]] = {}
 
     def is_allowed(self, client_id: str) -> bool:
         """Check if request is allowed using token bucket algorithm."""
-        now = time.time()
+        # Monotonic clock, so wall-clock adjustments can't produce a negative refill
+        now = time.monotonic()
 
-        if client_id not in self.buckets:
+        bucket = self.buckets.get(client_id)
+        if bucket is None:
             # New client, start with full bucket
             self.buckets[client_id] = (self.capacity - 1, now)
             return True
 
-        tokens, last_update = self.buckets[client_id]
+        tokens, last_update = bucket
 
         # Add tokens based on elapsed time
         elapsed = now - last_update
@@ -1,5 +1,9 @@
 from .client import MonitorXClient
 from .decorators import monitor_inference, monitor_drift
 from .context import MonitorXContext
+from .eventloop import install_event_loop_policy
 
-__all__ = ['MonitorXClient', 'monitor_inference', 'monitor_drift', 'MonitorXContext']
\ No newline at end of file
+__all__ = [
+    'MonitorXClient', 'monitor_inference', 'monitor_drift', 'MonitorXContext',
+    'install_event_loop_policy'
+]
\ No newline at end of file
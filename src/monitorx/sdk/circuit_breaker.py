@@ -0,0 +1,107 @@
+# Copyright 2025 MonitorX Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Circuit breaker for the SDK client.
+
+Kept free of dynamic features so it can be compiled with mypyc; see setup.py.
+"""
+import time
+from typing import Any, Callable, Optional, Type
+
+from loguru import logger
+
+# Circuit breaker states, compared as small ints on the request path
+CLOSED, OPEN, HALF_OPEN = 0, 1, 2
+_STATE_NAMES = ("closed", "open", "half_open")
+
+
+class CircuitBreaker:
+    """Circuit breaker implementation for fault tolerance."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 60,
+        expected_exception: Type[BaseException] = Exception
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.expected_exception = expected_exception
+
+        self.failure_count = 0
+        self.last_failure_time: Optional[float] = None  # time.monotonic()
+        self._open_until = 0.0
+        self._state = CLOSED
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        return _STATE_NAMES[self._state]
+
+    def _check_open(self) -> None:
+        """Reject the call while open; go half-open once the recovery timeout has passed."""
+        if self._state == OPEN:
+            if time.monotonic() < self._open_until:
+                raise Exception("Circuit breaker is OPEN - service unavailable")
+            self._state = HALF_OPEN
+            logger.info("Circuit breaker transitioning to half-open state")
+
+    def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Execute function with circuit breaker protection."""
+        # Closed is the common case and needs no clock read
+        if self._state != CLOSED:
+            self._check_open()
+
+        try:
+            result = func(*args, **kwargs)
+        except self.expected_exception:
+            self.record_failure()
+            raise
+
+        if self._state == HALF_OPEN:
+            self.reset()
+        return result
+
+    async def call_async(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Execute async function with circuit breaker protection."""
+        # Closed is the common case and needs no clock read
+        if self._state != CLOSED:
+            self._check_open()
+
+        try:
+            result = await func(*args, **kwargs)
+        except self.expected_exception:
+            self.record_failure()
+            raise
+
+        if self._state == HALF_OPEN:
+            self.reset()
+        return result
+
+    def record_failure(self) -> None:
+        """Record a failure."""
+        self.failure_count += 1
+        self.last_failure_time = time.monotonic()
+
+        if self.failure_count >= self.failure_threshold:
+            self._state = OPEN
+            self._open_until = self.last_failure_time + self.recovery_timeout
+            logger.warning(f"Circuit breaker OPEN after {self.failure_count} failures")
+
+    def reset(self) -> None:
+        """Reset circuit breaker to closed state."""
+        self.failure_count = 0
+        self.last_failure_time = None
+        self._state = CLOSED
+        logger.info("Circuit breaker reset to CLOSED state")
@@ -13,86 +13,67 @@
 # limitations under the License.
 
 import httpx
+import orjson
 import asyncio
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Deque, MutableMapping, Tuple
 from datetime import datetime
-import uuid
+import os
+import random
+import socket
+import threading
 import time
-from collections import deque
-from dataclasses import asdict
+import weakref
+from types import MappingProxyType
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit
 from loguru import logger
 
 from ..types import InferenceMetric, DriftMetric, ModelConfig, ResourceUsage
-
-
-class CircuitBreaker:
-    """Circuit breaker implementation for fault tolerance."""
-
-    def __init__(
-        self,
-        failure_threshold: int = 5,
-        recovery_timeout: int = 60,
-        expected_exception: type = Exception
-    ):
-        self.failure_threshold = failure_threshold
-        self.recovery_timeout = recovery_timeout
-        self.expected_exception = expected_exception
-
-        self.failure_count = 0
-        self.last_failure_time: Optional[float] = None
-        self.state = "closed"  # closed, open, half_open
-
-    def call(self, func: Callable, *args, **kwargs) -> Any:
-        """Execute function with circuit breaker protection."""
-        if self.state == "open":
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                self.state = "half_open"
-                logger.info("Circuit breaker transitioning to half-open state")
-            else:
-                raise Exception("Circuit breaker is OPEN - service unavailable")
-
-        try:
-            result = func(*args, **kwargs)
-            if self.state == "half_open":
-                self.reset()
-            return result
-        except self.expected_exception as e:
-            self.record_failure()
-            raise e
-
-    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
-        """Execute async function with circuit breaker protection."""
-        if self.state == "open":
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                self.state = "half_open"
-                logger.info("Circuit breaker transitioning to half-open state")
-            else:
-                raise Exception("Circuit breaker is OPEN - service unavailable")
-
-        try:
-            result = await func(*args, **kwargs)
-            if self.state == "half_open":
-                self.reset()
-            return result
-        except self.expected_exception as e:
-            self.record_failure()
-            raise e
-
-    def record_failure(self) -> None:
-        """Record a failure."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-
-        if self.failure_count >= self.failure_threshold:
-            self.state = "open"
-            logger.warning(f"Circuit breaker OPEN after {self.failure_count} failures")
-
-    def reset(self) -> None:
-        """Reset circuit breaker to closed state."""
-        self.failure_count = 0
-        self.last_failure_time = None
-        self.state = "closed"
-        logger.info("Circuit breaker reset to CLOSED state")
+from .circuit_breaker import CircuitBreaker, CLOSED
+
+# numpy scalars (e.g. a latency from np.mean) and non-string tag keys still encode
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Buffered metrics are flushed in chunks of at most this many per request
+FLUSH_CHUNK_SIZE = 256
+# Fraction of buffer_size at which the background flush runs early
+FLUSH_HIGH_WATERMARK = 0.8
+# Batches of at least this many metrics (roughly 4KB) are streamed to the
+# server ENCODE_CHUNK_SIZE metrics at a time instead of encoded in one piece
+STREAM_MIN_METRICS = 32
+ENCODE_CHUNK_SIZE = 64
+# Most query results (summary stats, alerts) kept by the client-side cache
+QUERY_CACHE_SIZE = 1024
+
+
+def new_request_id() -> str:
+    """Return a random 128-bit request ID as 32 hex characters."""
+    # About 5x cheaper than str(uuid.uuid4()) and just as unlikely to collide
+    return os.urandom(16).hex()
+
+
+def _parse_sink_url(sink_url: str) -> Tuple[int, Any]:
+    """Return the socket family and address for a udp://host:port or unix:///path URL."""
+    url = urlsplit(sink_url)
+    if url.scheme == "udp" and url.hostname and url.port:
+        family, _, _, _, address = socket.getaddrinfo(
+            url.hostname, url.port, type=socket.SOCK_DGRAM
+        )[0]
+        return family, address
+    if url.scheme == "unix" and url.path:
+        return socket.AF_UNIX, url.path
+    raise ValueError(f"Unsupported sink URL: {sink_url} (expected udp://host:port or unix:///path)")
+
+
+async def _encode_batch(metrics: List[Dict[str, Any]]):
+    """Yield a {"metrics": [...]} JSON body, encoding a chunk of metrics at a time."""
+    yield b'{"metrics":['
+    for start in range(0, len(metrics), ENCODE_CHUNK_SIZE):
+        if start:
+            yield b","
+        # Strip the brackets so the chunks join into one array
+        yield orjson.dumps(metrics[start:start + ENCODE_CHUNK_SIZE], option=JSON_OPTIONS)[1:-1]
+    yield b"]}"
 
 
 class MonitorXClient:
@@ -105,99 +86,410 @@ class MonitorXClient:
         timeout: int = 30,
         max_retries: int = 3,
         retry_backoff: float = 1.0,
+        max_backoff: float = 30.0,
         enable_circuit_breaker: bool = True,
-        buffer_size: int = 1000
+        buffer_size: int = 1000,
+        use_batch_endpoint: bool = True,
+        max_concurrency: int = 64,
+        sink_url: Optional[str] = None,
+        cache_ttl: float = 30.0,
+        http2: bool = False
     ):
         self.base_url = base_url.rstrip('/')
+        # Endpoint URLs are parsed once here rather than on every request
+        api_url = f"{self.base_url}/api/v1"
+        self._url_inference = httpx.URL(f"{api_url}/metrics/inference")
+        self._url_inference_batch = httpx.URL(f"{api_url}/metrics/inference/batch")
+        self._url_drift = httpx.URL(f"{api_url}/metrics/drift")
+        self._url_drift_batch = httpx.URL(f"{api_url}/metrics/drift/batch")
+        self._url_models = httpx.URL(f"{api_url}/models")
+        self._url_summary = httpx.URL(f"{api_url}/summary")
+        self._url_alerts = httpx.URL(f"{api_url}/alerts")
+        self._url_alerts_resolve = httpx.URL(f"{api_url}/alerts/resolve")
+        self._url_health = httpx.URL(f"{api_url}/health")
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
-        self.session = None
+        self.max_backoff = max_backoff
+        # Send metric batches as one request; when off (or the server lacks the
+        # batch endpoint) each metric is sent in its own request instead
+        self.use_batch_endpoint = use_batch_endpoint
+        # Turned off on its own if only the drift batch endpoint is missing
+        self._drift_batch_endpoint = True
+        # Cap on concurrent requests when metrics are sent one request each. A
+        # semaphore belongs to one event loop, so each loop gets its own
+        self.max_concurrency = max_concurrency
+        self._request_slots: MutableMapping[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        self._request_slots = weakref.WeakKeyDictionary()
+        # Summary stats and alerts results are reused for cache_ttl seconds (0
+        # disables it), least recently used first; concurrent identical queries
+        # on the same event loop share one in-flight request. The lock guards
+        # both maps, which every loop the client runs on shares
+        self.cache_ttl = cache_ttl
+        self._query_cache: "OrderedDict[Tuple, Tuple[float, bytes]]" = OrderedDict()
+        self._query_inflight: Dict[Tuple[asyncio.AbstractEventLoop, Tuple], asyncio.Task] = {}
+        self._query_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Built once; shared by every session the client creates
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+            headers["X-API-Key"] = api_key
+        self._headers = MappingProxyType(headers)
+
+        # Optional datagram sink for fire-and-forget inference metrics
+        self.sink_url = sink_url
+        self._sink: Optional[socket.socket] = None
+        self._sink_address: Any = None
+        if sink_url:
+            family, self._sink_address = _parse_sink_url(sink_url)
+            self._sink = self._open_sink(family)
+
+        # Multiplex concurrent requests over one connection; needs httpx[http2]
+        # and an HTTP/2 endpoint (e.g. a TLS-terminating proxy) in front of the API
+        self.http2 = http2
+
+        # One pooled client for the lifetime of the SDK client, so requests
+        # reuse keep-alive connections instead of reconnecting each time
+        self.session = self._create_session()
+        # Connections are bound to the event loop that opened them; the pool is
+        # claimed by the first loop that uses it
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Pools of other loops running at the same time, e.g. the background
+        # loop that sends metrics from decorated sync functions
+        self._loop_sessions: MutableMapping[asyncio.AbstractEventLoop, httpx.AsyncClient]
+        self._loop_sessions = weakref.WeakKeyDictionary()
 
         # Circuit breaker
         self.circuit_breaker = CircuitBreaker() if enable_circuit_breaker else None
 
-        # Metric buffering for offline scenarios
+        # Metric buffering for offline scenarios. The buffers hold the metric
+        # objects themselves; they are only serialized when flushed
         self.buffer_size = buffer_size
-        self.metric_buffer: deque = deque(maxlen=buffer_size)
+        self._inference_buffer: Deque[InferenceMetric] = deque(maxlen=buffer_size)
+        self._drift_buffer: Deque[DriftMetric] = deque(maxlen=buffer_size)
         self.buffer_enabled = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_inflight = False
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._flush_threshold = max(1, int(buffer_size * FLUSH_HIGH_WATERMARK))
+
+    def _create_session(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client."""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=100,
+                keepalive_expiry=30.0
+            ),
+            headers=self._headers,
+            http2=self.http2
+        )
+
+    def _get_session(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, replacing it first if it has been closed.
+
+        A new client is also created when called from a different event loop
+        than the one the pool was used on, e.g. a second asyncio.run(). While
+        that loop is still open, the calling loop gets a pool of its own instead.
+        """
+        loop = asyncio.get_running_loop()
+        home = self._session_loop
+        if home is not None and home is not loop and not home.is_closed():
+            session = self._loop_sessions.get(loop)
+            if session is None or session.is_closed:
+                session = self._loop_sessions[loop] = self._create_session()
+            return session
+        if self.session.is_closed or home not in (None, loop):
+            self.session = self._create_session()
+        self._session_loop = loop
+        return self.session
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = httpx.AsyncClient(timeout=self.timeout)
+        # A client closed by a previous context can be used again
+        self._get_session()
+        if self._sink is not None and self._sink.fileno() == -1:
+            self._sink = self._open_sink(self._sink.family)
+        # Open a pooled connection in the background so the first real request
+        # doesn't pay for the TCP/TLS handshake
+        if self._warmup_task is None or self._warmup_task.done():
+            self._warmup_task = asyncio.get_running_loop().create_task(self._warm_up())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        await self.close()
+
+    async def close(self) -> None:
+        """Send any buffered metrics, stop background flushing and close the HTTP client."""
+        flush_task = self._flush_task
+        self._stop_auto_flush()
+        if flush_task is not None:
+            # Let the cancelled task put back the metrics of a flush it was in the middle of
+            await asyncio.gather(flush_task, return_exceptions=True)
+        if self.get_buffer_size() and not self.session.is_closed:
+            await self.flush_buffer()
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        if self._sink is not None:
+            self._sink.close()
+        running = asyncio.get_running_loop()
+        pools = [*self._loop_sessions.items(), (self._session_loop, self.session)]
+        self._loop_sessions.clear()
+        for loop, session in pools:
+            if loop is None or loop is running:
+                await session.aclose()
+            elif not loop.is_closed():
+                # The pool belongs to a loop running in another thread; close it there
+                asyncio.run_coroutine_threadsafe(session.aclose(), loop)
+        if self._session_loop is not None and self._session_loop.is_closed():
+            # A pool left on a finished loop can't be closed from here; replace it
+            self.session = self._create_session()
+            self._session_loop = None
             await self.session.aclose()
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers."""
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
+    def _open_sink(self, family: int) -> socket.socket:
+        """Create the non-blocking datagram socket used for the metric sink."""
+        sink = socket.socket(family, socket.SOCK_DGRAM)
+        sink.setblocking(False)
+        return sink
+
+    def _send_to_sink(self, metric: InferenceMetric) -> bool:
+        """Send a metric as one datagram; delivery is not confirmed."""
+        try:
+            self._sink.sendto(
+                orjson.dumps(self._inference_payload(metric), option=JSON_OPTIONS),
+                self._sink_address
+            )
+            return True
+        except OSError as e:
+            # Includes a full socket buffer; the metric is dropped, as with any lost datagram
+            logger.debug("Failed to send metric datagram: {}", e)
+            return False
+
+    async def _warm_up(self) -> None:
+        """Connect to the server with a health request, ignoring the result."""
+        try:
+            await self._get_session().get(self._url_health)
+        except Exception as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+
+    def enable_buffering(self, auto_flush_interval: Optional[float] = None) -> None:
+        """
+        Enable metric buffering for offline scenarios.
 
-    def enable_buffering(self) -> None:
-        """Enable metric buffering for offline scenarios."""
+        Args:
+            auto_flush_interval: If set, a background task flushes the buffer
+                every this many seconds, or as soon as it is 80% full. Must be
+                called from a running event loop in that case.
+        """
         self.buffer_enabled = True
+        if auto_flush_interval is not None and self._flush_task is None:
+            self._flush_event = asyncio.Event()
+            self._flush_loop = asyncio.get_running_loop()
+            self._flush_task = self._flush_loop.create_task(
+                self._auto_flush_loop(self._flush_event, auto_flush_interval)
+            )
         logger.info("Metric buffering enabled")
 
     def disable_buffering(self) -> None:
         """Disable metric buffering."""
         self.buffer_enabled = False
+        self._stop_auto_flush()
         logger.info("Metric buffering disabled")
 
+    def _stop_auto_flush(self) -> None:
+        """Cancel the background flush task if one is running."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+            self._flush_event = None
+            self._flush_loop = None
+
+    async def _auto_flush_loop(self, flush_event: asyncio.Event, interval: float) -> None:
+        """Flush buffered metrics every interval, or early when the buffer fills up."""
+        while True:
+            try:
+                await asyncio.wait_for(flush_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            flush_event.clear()
+
+            if not self.get_buffer_size():
+                continue
+            try:
+                result = await self.flush_buffer()
+            except Exception as e:
+                logger.error(f"Background buffer flush failed: {e}")
+                continue
+            if result["failed"]:
+                # Likely offline; wait out the interval instead of letting the
+                # watermark retrigger a flush on every new metric
+                await asyncio.sleep(interval)
+                flush_event.clear()
+
+    def _buffer_metric(self, buffer: Deque, metric: Any) -> None:
+        """Append a metric to a buffer, waking the flush task once it is nearly full."""
+        buffer.append(metric)
+        flush_event, flush_loop = self._flush_event, self._flush_loop
+        if flush_event is None or flush_loop is None or len(buffer) < self._flush_threshold:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is flush_loop:
+            flush_event.set()
+            return
+        # Buffered from another thread, e.g. the decorators' background loop;
+        # asyncio.Event may only be set from its own loop
+        try:
+            flush_loop.call_soon_threadsafe(flush_event.set)
+        except RuntimeError:
+            pass  # The flush loop has closed
+
     def get_buffer_size(self) -> int:
         """Get current buffer size."""
-        return len(self.metric_buffer)
+        return len(self._inference_buffer) + len(self._drift_buffer)
 
     async def flush_buffer(self) -> Dict[str, int]:
-        """Flush all buffered metrics to the server."""
-        if not self.metric_buffer:
+        """
+        Flush all buffered metrics to the server.
+
+        Each buffer is drained in chunks, and each chunk goes out in one request
+        to the batch endpoint for its metric type. Metrics that fail to send are put back at the
+        front of their buffer so a later flush can retry them, while metrics the
+        server rejects as invalid are dropped.
+
+        Only one flush runs at a time; a call made while another flush is in
+        flight returns at once with "skipped" set, since that flush already
+        drains whatever it finds buffered.
+        """
+        if self._flush_inflight:
+            return {"flushed": 0, "failed": 0, "skipped": True}
+        if not self.get_buffer_size():
             return {"flushed": 0, "failed": 0}
 
+        # No await between the check and the set, so this can't race on the loop
+        self._flush_inflight = True
         flushed = 0
         failed = 0
+        try:
+            for buffer, send in (
+                (self._inference_buffer, self._send_inference_chunk),
+                (self._drift_buffer, self._send_drift_chunk),
+            ):
+                sent, not_sent = await self._drain_buffer(buffer, send)
+                flushed += sent
+                failed += not_sent
+        finally:
+            self._flush_inflight = False
 
-        # Temporarily disable buffering during flush
-        original_buffer_state = self.buffer_enabled
-        self.buffer_enabled = False
+        logger.info(f"Buffer flush complete: {flushed} flushed, {failed} failed")
+        return {"flushed": flushed, "failed": failed}
+
+    async def _drain_buffer(self, buffer: Deque, send: Callable) -> Tuple[int, int]:
+        """Send a buffer in chunks; returns (flushed, failed) counts."""
+        flushed = 0
+        rejected = 0
+        failed_metrics = []
+
+        # Take everything in one copy and clear, then work through slices of the
+        # snapshot rather than popping the buffer one metric at a time
+        pending = list(buffer)
+        buffer.clear()
 
+        start = 0
         try:
-            while self.metric_buffer:
-                metric_data = self.metric_buffer.popleft()
-                metric_type = metric_data.get("type")
-
-                try:
-                    if metric_type == "inference":
-                        metric = InferenceMetric(**metric_data["data"])
-                        if self.session:
-                            await self._collect_inference_metric_request(self.session, metric)
-                        else:
-                            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                                await self._collect_inference_metric_request(client, metric)
-                        flushed += 1
-                    elif metric_type == "drift":
-                        drift_metric = DriftMetric(**metric_data["data"])
-                        if self.session:
-                            await self._collect_drift_metric_request(self.session, drift_metric)
-                        else:
-                            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                                await self._collect_drift_metric_request(client, drift_metric)
-                        flushed += 1
-                except Exception as e:
-                    logger.error(f"Failed to flush metric: {e}")
-                    failed += 1
-
-            logger.info(f"Buffer flush complete: {flushed} flushed, {failed} failed")
+            while start < len(pending):
+                chunk = pending[start:start + FLUSH_CHUNK_SIZE]
+                sent, dropped, unsent = await send(chunk)
+                start += len(chunk)
+                flushed += sent
+                rejected += dropped
+                failed_metrics.extend(unsent)
+                if len(unsent) == len(chunk):
+                    # Nothing got through; leave the rest for the next flush
+                    break
         finally:
-            # Restore original buffer state
-            self.buffer_enabled = original_buffer_state
+            # Keep unsent metrics, in their original order, ahead of anything
+            # buffered meanwhile. This also runs if the flush is cancelled mid-send
+            buffer.extendleft(reversed(failed_metrics + pending[start:]))
 
-        return {"flushed": flushed, "failed": failed}
+        return flushed, rejected + len(failed_metrics)
+
+    async def _send_inference_chunk(
+        self,
+        metrics: List[InferenceMetric]
+    ) -> Tuple[int, int, List[InferenceMetric]]:
+        """Send buffered inference metrics; returns (sent, rejected, unsent metrics)."""
+        if self.use_batch_endpoint:
+            payload = {"metrics": [self._inference_payload(metric) for metric in metrics]}
+            try:
+                result = await self._collect_inference_metrics_bulk_request(
+                    self._get_session(), payload
+                )
+            except Exception as e:
+                logger.error(f"Failed to flush inference metric batch: {e}")
+                return 0, 0, metrics
+
+            if result is not None:
+                return result["success"], result["failed"], []
+
+            logger.warning("Server has no batch endpoint, sending metrics individually")
+            self.use_batch_endpoint = False
+
+        unsent = await self._send_individually(self._collect_inference_metric_request, metrics)
+        return len(metrics) - len(unsent), 0, unsent
+
+    async def _send_drift_chunk(
+        self,
+        metrics: List[DriftMetric]
+    ) -> Tuple[int, int, List[DriftMetric]]:
+        """Send buffered drift metrics; returns (sent, rejected, unsent metrics)."""
+        if self.use_batch_endpoint and self._drift_batch_endpoint:
+            payload = {"metrics": [self._drift_payload(metric) for metric in metrics]}
+            try:
+                result = await self._collect_drift_metrics_bulk_request(
+                    self._get_session(), payload
+                )
+            except Exception as e:
+                logger.error(f"Failed to flush drift metric batch: {e}")
+                return 0, 0, metrics
+
+            if result is not None:
+                return result["success"], result["failed"], []
+
+            logger.warning("Server has no drift batch endpoint, sending metrics individually")
+            self._drift_batch_endpoint = False
+
+        unsent = await self._send_individually(self._collect_drift_metric_request, metrics)
+        return len(metrics) - len(unsent), 0, unsent
+
+    async def _send_individually(self, request: Callable, metrics: List[Any]) -> List[Any]:
+        """Send metrics concurrently, one request each; returns the ones that failed."""
+        session = self._get_session()
+        results = await asyncio.gather(
+            *(self._bounded(request, session, metric) for metric in metrics),
+            return_exceptions=True
+        )
+        return [metric for metric, sent in zip(metrics, results) if sent is not True]
+
+    async def _bounded(self, request: Callable, *args) -> Any:
+        """Run a request once fewer than max_concurrency are in flight."""
+        loop = asyncio.get_running_loop()
+        slots = self._request_slots.get(loop)
+        if slots is None:
+            slots = self._request_slots[loop] = asyncio.Semaphore(self.max_concurrency)
+        async with slots:
+            return await request(*args)
 
     async def _retry_with_backoff(
         self,
@@ -205,24 +497,34 @@ class MonitorXClient:
         *args,
         **kwargs
     ) -> Any:
-        """Execute function with exponential backoff retry logic."""
+        """Execute function with retries and jittered exponential backoff."""
+        breaker = self.circuit_breaker
         last_exception = None
+        backoff_time = self.retry_backoff
 
         for attempt in range(self.max_retries):
+            # A closed breaker only needs to hear about failures, so the common
+            # case calls func directly instead of going through call_async
+            guarded = breaker is not None and breaker._state != CLOSED
             try:
-                if self.circuit_breaker:
-                    return await self.circuit_breaker.call_async(func, *args, **kwargs)
-                else:
-                    return await func(*args, **kwargs)
+                if guarded:
+                    return await breaker.call_async(func, *args, **kwargs)
+                return await func(*args, **kwargs)
 
             except Exception as e:
                 last_exception = e
+                if breaker is not None and not guarded and isinstance(e, breaker.expected_exception):
+                    breaker.record_failure()
                 if attempt < self.max_retries - 1:
-                    # Calculate backoff time with exponential increase
-                    backoff_time = self.retry_backoff * (2 ** attempt)
+                    # Decorrelated jitter: grows like exponential backoff on
+                    # average, but clients that failed together retry apart
+                    backoff_time = min(
+                        self.max_backoff,
+                        random.uniform(self.retry_backoff, max(self.retry_backoff, backoff_time * 3))
+                    )
                     logger.warning(
                         f"Attempt {attempt + 1}/{self.max_retries} failed: {e}. "
-                        f"Retrying in {backoff_time}s..."
+                        f"Retrying in {backoff_time:.2f}s..."
                     )
                     await asyncio.sleep(backoff_time)
                 else:
@@ -246,39 +548,60 @@ class MonitorXClient:
         if not metrics:
             return {"success": 0, "failed": 0}
 
-        # If buffering is enabled and we're offline, buffer the metrics
-        if self.buffer_enabled:
-            for metric_data in metrics:
-                self.metric_buffer.append({"type": "inference", "data": metric_data})
-            logger.debug(f"Buffered {len(metrics)} inference metrics")
-            return {"success": len(metrics), "failed": 0}
-
-        success = 0
-        failed = 0
-
-        # Process metrics in parallel for better performance
-        tasks = []
+        inference_metrics = []
         for metric_data in metrics:
             # Fill in defaults
             if "request_id" not in metric_data:
-                metric_data["request_id"] = str(uuid.uuid4())
+                metric_data["request_id"] = new_request_id()
             if "tags" not in metric_data:
                 metric_data["tags"] = {}
 
-            metric = InferenceMetric(**metric_data)
-            if self.session:
-                task = self._collect_inference_metric_request_with_retry(self.session, metric)
-            else:
-                task = self._collect_single_metric_no_session(metric, "inference")
-            tasks.append(task)
+            inference_metrics.append(InferenceMetric(**metric_data))
 
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # If buffering is enabled and we're offline, buffer the metrics
+        if self.buffer_enabled:
+            for metric in inference_metrics:
+                self._buffer_metric(self._inference_buffer, metric)
+            logger.debug("Buffered {} inference metrics", len(metrics))
+            return {"success": len(metrics), "failed": 0}
 
-        for result in results:
-            if isinstance(result, Exception):
-                failed += 1
-            elif result:
+        if self.use_batch_endpoint:
+            payload = {"metrics": [self._inference_payload(metric) for metric in inference_metrics]}
+            try:
+                result = await self._retry_with_backoff(
+                    self._collect_inference_metrics_bulk_request,
+                    self._get_session(),
+                    payload
+                )
+            except Exception as e:
+                logger.error(f"Failed to collect inference metric batch after retries: {e}")
+                return {"success": 0, "failed": len(inference_metrics)}
+
+            if result is not None:
+                logger.info(
+                    f"Batch collection complete: {result['success']} succeeded, {result['failed']} failed"
+                )
+                return result
+
+            logger.warning("Server has no batch endpoint, sending metrics individually")
+            self.use_batch_endpoint = False
+
+        success = 0
+        failed = 0
+
+        # Send in parallel, at most max_concurrency at a time, counting results as they finish
+        session = self._get_session()
+        requests = [
+            self._bounded(self._collect_inference_metric_request_with_retry, session, metric)
+            for metric in inference_metrics
+        ]
+        for request in asyncio.as_completed(requests):
+            try:
+                sent = await request
+            except Exception:
+                sent = False
+
+            if sent:
                 success += 1
             else:
                 failed += 1
@@ -286,17 +609,118 @@ class MonitorXClient:
         logger.info(f"Batch collection complete: {success} succeeded, {failed} failed")
         return {"success": success, "failed": failed}
 
-    async def _collect_single_metric_no_session(
+    async def _collect_inference_metrics_bulk_request(
         self,
-        metric: InferenceMetric,
-        metric_type: str
-    ) -> bool:
-        """Helper to collect a single metric without persistent session."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            if metric_type == "inference":
-                return await self._collect_inference_metric_request_with_retry(client, metric)
-            else:
-                return await self._collect_drift_metric_request_with_retry(client, metric)
+        client: httpx.AsyncClient,
+        payload: Dict[str, Any]
+    ) -> Optional[Dict[str, int]]:
+        """
+        Post a batch of inference metrics in one request.
+
+        Returns None if the server has no batch endpoint. Other failures raise
+        so the caller's retry logic applies.
+        """
+        return await self._post_metric_batch(client, self._url_inference_batch, payload)
+
+    async def _collect_drift_metrics_bulk_request(
+        self,
+        client: httpx.AsyncClient,
+        payload: Dict[str, Any]
+    ) -> Optional[Dict[str, int]]:
+        """
+        Post a batch of drift metrics in one request.
+
+        Returns None if the server has no drift batch endpoint. Other failures
+        raise so the caller's retry logic applies.
+        """
+        return await self._post_metric_batch(client, self._url_drift_batch, payload)
+
+    async def _post_metric_batch(
+        self,
+        client: httpx.AsyncClient,
+        url: httpx.URL,
+        payload: Dict[str, Any]
+    ) -> Optional[Dict[str, int]]:
+        """Post a {"metrics": [...]} payload to a batch endpoint; None on 404."""
+        metrics = payload["metrics"]
+        if len(metrics) >= STREAM_MIN_METRICS:
+            # Upload while the rest of the batch is still being encoded
+            content = _encode_batch(metrics)
+        else:
+            content = orjson.dumps(payload, option=JSON_OPTIONS)
+
+        response = await client.post(url, content=content)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        return {"success": data.get("accepted", 0), "failed": data.get("rejected", 0)}
+
+    async def collect_drift_metrics_batch(
+        self,
+        metrics: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Collect multiple drift metrics in a single batch request.
+
+        Args:
+            metrics: List of drift metric dictionaries with required fields
+
+        Returns:
+            Dictionary with success and failure counts
+        """
+        if not metrics:
+            return {"success": 0, "failed": 0}
+
+        drift_metrics = []
+        for metric_data in metrics:
+            if "tags" not in metric_data:
+                metric_data["tags"] = {}
+
+            drift_metrics.append(DriftMetric(**metric_data))
+
+        if self.buffer_enabled:
+            for metric in drift_metrics:
+                self._buffer_metric(self._drift_buffer, metric)
+            logger.debug("Buffered {} drift metrics", len(metrics))
+            return {"success": len(metrics), "failed": 0}
+
+        if self.use_batch_endpoint and self._drift_batch_endpoint:
+            payload = {"metrics": [self._drift_payload(metric) for metric in drift_metrics]}
+            try:
+                result = await self._retry_with_backoff(
+                    self._collect_drift_metrics_bulk_request,
+                    self._get_session(),
+                    payload
+                )
+            except Exception as e:
+                logger.error(f"Failed to collect drift metric batch after retries: {e}")
+                return {"success": 0, "failed": len(drift_metrics)}
+
+            if result is not None:
+                logger.info(
+                    f"Drift batch collection complete: {result['success']} succeeded, "
+                    f"{result['failed']} failed"
+                )
+                return result
+
+            logger.warning("Server has no drift batch endpoint, sending metrics individually")
+            self._drift_batch_endpoint = False
+
+        session = self._get_session()
+        results = await asyncio.gather(
+            *(
+                self._bounded(self._collect_drift_metric_request_with_retry, session, metric)
+                for metric in drift_metrics
+            ),
+            return_exceptions=True
+        )
+        success = sum(1 for sent in results if sent is True)
+        failed = len(drift_metrics) - success
+
+        logger.info(f"Drift batch collection complete: {success} succeeded, {failed} failed")
+        return {"success": success, "failed": failed}
 
     async def _collect_inference_metric_request_with_retry(
         self,
@@ -314,10 +738,7 @@ class MonitorXClient:
             logger.error(f"Failed to collect inference metric after retries: {e}")
             # If buffering is enabled, add to buffer
             if self.buffer_enabled:
-                self.metric_buffer.append({
-                    "type": "inference",
-                    "data": asdict(metric)
-                })
+                self._buffer_metric(self._inference_buffer, metric)
             return False
 
     async def _collect_drift_metric_request_with_retry(
@@ -336,44 +757,37 @@ class MonitorXClient:
             logger.error(f"Failed to collect drift metric after retries: {e}")
             # If buffering is enabled, add to buffer
             if self.buffer_enabled:
-                self.metric_buffer.append({
-                    "type": "drift",
-                    "data": asdict(drift_metric)
-                })
+                self._buffer_metric(self._drift_buffer, drift_metric)
             return False
 
+    async def _post(
+        self, client: httpx.AsyncClient, url: httpx.URL, payload: Any
+    ) -> httpx.Response:
+        """POST a JSON payload (a dict or dataclass); raises on an error status."""
+        response = await client.post(url, content=orjson.dumps(payload, option=JSON_OPTIONS))
+        response.raise_for_status()
+        return response
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: httpx.URL,
+        params: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """GET a resource; raises on an error status."""
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        return response
+
     async def register_model(self, config: ModelConfig) -> bool:
         """Register a model configuration."""
-        if not self.session:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                return await self._register_model_request(client, config)
-        else:
-            return await self._register_model_request(self.session, config)
+        return await self._register_model_request(self._get_session(), config)
 
     async def _register_model_request(self, client: httpx.AsyncClient, config: ModelConfig) -> bool:
         """Internal method to make register model request."""
         try:
-            payload = {
-                "id": config.id,
-                "name": config.name,
-                "model_type": config.model_type,
-                "version": config.version,
-                "environment": config.environment,
-                "thresholds": {
-                    "latency": config.thresholds.latency,
-                    "error_rate": config.thresholds.error_rate,
-                    "gpu_memory": config.thresholds.gpu_memory,
-                    "cpu_usage": config.thresholds.cpu_usage,
-                    "memory_usage": config.thresholds.memory_usage,
-                }
-            }
-
-            response = await client.post(
-                f"{self.base_url}/api/v1/models",
-                json=payload,
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
+            # The dataclass fields match the request body, so orjson encodes it directly
+            await self._post(client, self._url_models, config)
             logger.info(f"Successfully registered model: {config.name}")
             return True
 
@@ -381,25 +795,25 @@ class MonitorXClient:
             logger.error(f"Failed to register model {config.name}: {e}")
             return False
 
-    async def collect_inference_metric(
+    def _build_inference_metric(
         self,
         model_id: str,
         model_type: str,
         latency: float,
-        request_id: Optional[str] = None,
-        throughput: Optional[float] = None,
-        error_rate: Optional[float] = None,
-        resource_usage: Optional[ResourceUsage] = None,
-        tags: Optional[Dict[str, str]] = None
-    ) -> bool:
-        """Collect an inference metric with automatic retry."""
+        request_id: Optional[str],
+        throughput: Optional[float],
+        error_rate: Optional[float],
+        resource_usage: Optional[ResourceUsage],
+        tags: Optional[Dict[str, str]]
+    ) -> InferenceMetric:
+        """Build an inference metric, filling in request ID and tags defaults."""
         if not request_id:
-            request_id = str(uuid.uuid4())
+            request_id = new_request_id()
 
         if not tags:
             tags = {}
 
-        metric = InferenceMetric(
+        return InferenceMetric(
             model_id=model_id,
             model_type=model_type,  # type: ignore
             request_id=request_id,
@@ -410,54 +824,92 @@ class MonitorXClient:
             tags=tags
         )
 
+    def buffer_inference_metric(
+        self,
+        model_id: str,
+        model_type: str,
+        latency: float,
+        request_id: Optional[str] = None,
+        throughput: Optional[float] = None,
+        error_rate: Optional[float] = None,
+        resource_usage: Optional[ResourceUsage] = None,
+        tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Append an inference metric to the local buffer without sending it."""
+        metric = self._build_inference_metric(
+            model_id, model_type, latency, request_id,
+            throughput, error_rate, resource_usage, tags
+        )
+        self._buffer_metric(self._inference_buffer, metric)
+        logger.debug("Buffered inference metric for model {}", model_id)
+
+    async def collect_inference_metric(
+        self,
+        model_id: str,
+        model_type: str,
+        latency: float,
+        request_id: Optional[str] = None,
+        throughput: Optional[float] = None,
+        error_rate: Optional[float] = None,
+        resource_usage: Optional[ResourceUsage] = None,
+        tags: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """
+        Collect an inference metric with automatic retry.
+
+        With a sink_url the metric is sent as a single datagram instead, with no
+        retry, buffering or response.
+        """
+        if self._sink is not None:
+            return self._send_to_sink(self._build_inference_metric(
+                model_id, model_type, latency, request_id,
+                throughput, error_rate, resource_usage, tags
+            ))
+
         # If buffering is enabled, buffer immediately
         if self.buffer_enabled:
-            self.metric_buffer.append({
-                "type": "inference",
-                "data": asdict(metric)
-            })
-            logger.debug(f"Buffered inference metric for model {model_id}")
+            self.buffer_inference_metric(
+                model_id, model_type, latency, request_id,
+                throughput, error_rate, resource_usage, tags
+            )
             return True
 
-        if not self.session:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                return await self._collect_inference_metric_request_with_retry(client, metric)
-        else:
-            return await self._collect_inference_metric_request_with_retry(self.session, metric)
+        metric = self._build_inference_metric(
+            model_id, model_type, latency, request_id,
+            throughput, error_rate, resource_usage, tags
+        )
+
+        return await self._collect_inference_metric_request_with_retry(self._get_session(), metric)
+
+    def _inference_payload(self, metric: InferenceMetric) -> Dict[str, Any]:
+        """Build the JSON payload for an inference metric."""
+        payload = {
+            "model_id": metric.model_id,
+            "model_type": metric.model_type,
+            "request_id": metric.request_id,
+            "latency": metric.latency,
+            "tags": metric.tags
+        }
+
+        if metric.throughput is not None:
+            payload["throughput"] = metric.throughput
+
+        if metric.error_rate is not None:
+            payload["error_rate"] = metric.error_rate
+
+        if metric.resource_usage:
+            # orjson encodes the ResourceUsage dataclass as-is
+            payload["resource_usage"] = metric.resource_usage
+
+        return payload
 
     async def _collect_inference_metric_request(
         self, client: httpx.AsyncClient, metric: InferenceMetric
     ) -> bool:
         """Internal method to make collect inference metric request."""
         try:
-            payload = {
-                "model_id": metric.model_id,
-                "model_type": metric.model_type,
-                "request_id": metric.request_id,
-                "latency": metric.latency,
-                "tags": metric.tags
-            }
-
-            if metric.throughput is not None:
-                payload["throughput"] = metric.throughput
-
-            if metric.error_rate is not None:
-                payload["error_rate"] = metric.error_rate
-
-            if metric.resource_usage:
-                payload["resource_usage"] = {
-                    "gpu_memory": metric.resource_usage.gpu_memory,
-                    "cpu_usage": metric.resource_usage.cpu_usage,
-                    "memory_usage": metric.resource_usage.memory_usage,
-                }
-
-            response = await client.post(
-                f"{self.base_url}/api/v1/metrics/inference",
-                json=payload,
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
-            logger.debug(f"Successfully collected metric for model {metric.model_id}")
+            await self._post(client, self._url_inference, self._inference_payload(metric))
+            logger.debug("Successfully collected metric for model {}", metric.model_id)
             return True
 
         except Exception as e:
@@ -484,31 +936,26 @@ class MonitorXClient:
             tags=tags
         )
 
-        if not self.session:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                return await self._collect_drift_metric_request_with_retry(client, drift_metric)
-        else:
-            return await self._collect_drift_metric_request_with_retry(self.session, drift_metric)
+        return await self._collect_drift_metric_request_with_retry(
+            self._get_session(), drift_metric
+        )
+
+    def _drift_payload(self, drift_metric: DriftMetric) -> Dict[str, Any]:
+        """Build the request body for a drift metric."""
+        return {
+            "model_id": drift_metric.model_id,
+            "drift_type": drift_metric.drift_type,
+            "severity": drift_metric.severity,
+            "confidence": drift_metric.confidence,
+            "tags": drift_metric.tags
+        }
 
     async def _collect_drift_metric_request(
         self, client: httpx.AsyncClient, drift_metric: DriftMetric
     ) -> bool:
         """Internal method to make collect drift metric request."""
         try:
-            payload = {
-                "model_id": drift_metric.model_id,
-                "drift_type": drift_metric.drift_type,
-                "severity": drift_metric.severity,
-                "confidence": drift_metric.confidence,
-                "tags": drift_metric.tags
-            }
-
-            response = await client.post(
-                f"{self.base_url}/api/v1/metrics/drift",
-                json=payload,
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
+            await self._post(client, self._url_drift, self._drift_payload(drift_metric))
             logger.info(f"Successfully collected drift metric for model {drift_metric.model_id}")
             return True
 
@@ -516,17 +963,85 @@ class MonitorXClient:
             logger.error(f"Failed to collect drift metric for model {drift_metric.model_id}: {e}")
             return False
 
+    async def _query(
+        self,
+        key: Tuple,
+        client: httpx.AsyncClient,
+        url: httpx.URL,
+        params: Dict[str, Any]
+    ) -> Any:
+        """
+        GET and decode a query result, reusing one fetched within cache_ttl.
+
+        The response body is what gets cached, so every caller decodes its own
+        copy and may modify it. Failed requests raise and are not cached.
+        """
+        if self.cache_ttl <= 0:
+            response = await self._get(client, url, params)
+            return orjson.loads(response.content)
+
+        loop = asyncio.get_running_loop()
+        with self._query_lock:
+            entry = self._query_cache.get(key)
+            if entry is not None:
+                fetched_at, result = entry
+                if time.monotonic() - fetched_at < self.cache_ttl:
+                    self._query_cache.move_to_end(key)
+                    self._cache_hits += 1
+                    return orjson.loads(result)
+                del self._query_cache[key]
+
+            # A task can only be awaited on its own loop
+            task = self._query_inflight.get((loop, key))
+            if task is None:
+                self._cache_misses += 1
+                task = loop.create_task(self._fetch_query(loop, key, client, url, params))
+                self._query_inflight[(loop, key)] = task
+            else:
+                self._cache_hits += 1
+        # A cancelled caller must not cancel the request other callers wait on
+        return orjson.loads(await asyncio.shield(task))
+
+    async def _fetch_query(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: Tuple,
+        client: httpx.AsyncClient,
+        url: httpx.URL,
+        params: Dict[str, Any]
+    ) -> bytes:
+        """Fetch a query result and store its JSON body in the cache."""
+        try:
+            response = await self._get(client, url, params)
+            result = response.content
+            # Only valid JSON is cached
+            orjson.loads(result)
+        finally:
+            with self._query_lock:
+                del self._query_inflight[(loop, key)]
+
+        with self._query_lock:
+            self._query_cache[key] = (time.monotonic(), result)
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return result
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get hit and miss counts and the current size of the query cache."""
+        with self._query_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._query_cache)
+            }
+
     async def get_summary_stats(
         self,
         model_id: Optional[str] = None,
         since_hours: int = 24
     ) -> Dict[str, Any]:
         """Get summary statistics."""
-        if not self.session:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                return await self._get_summary_stats_request(client, model_id, since_hours)
-        else:
-            return await self._get_summary_stats_request(self.session, model_id, since_hours)
+        return await self._get_summary_stats_request(self._get_session(), model_id, since_hours)
 
     async def _get_summary_stats_request(
         self, client: httpx.AsyncClient, model_id: Optional[str], since_hours: int
@@ -537,13 +1052,9 @@ class MonitorXClient:
             if model_id:
                 params["model_id"] = model_id
 
-            response = await client.get(
-                f"{self.base_url}/api/v1/summary",
-                params=params,
-                headers=self._get_headers()
+            return await self._query(
+                ("summary", model_id, since_hours), client, self._url_summary, params
             )
-            response.raise_for_status()
-            return response.json()
 
         except Exception as e:
             logger.error(f"Failed to get summary stats: {e}")
@@ -556,11 +1067,7 @@ class MonitorXClient:
         resolved: Optional[bool] = None
     ) -> List[Dict[str, Any]]:
         """Get alerts."""
-        if not self.session:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                return await self._get_alerts_request(client, model_id, since_hours, resolved)
-        else:
-            return await self._get_alerts_request(self.session, model_id, since_hours, resolved)
+        return await self._get_alerts_request(self._get_session(), model_id, since_hours, resolved)
 
     async def _get_alerts_request(
         self,
@@ -577,13 +1084,9 @@ class MonitorXClient:
             if resolved is not None:
                 params["resolved"] = resolved
 
-            response = await client.get(
-                f"{self.base_url}/api/v1/alerts",
-                params=params,
-                headers=self._get_headers()
+            return await self._query(
+                ("alerts", model_id, since_hours, resolved), client, self._url_alerts, params
             )
-            response.raise_for_status()
-            return response.json()
 
         except Exception as e:
             logger.error(f"Failed to get alerts: {e}")
@@ -591,23 +1094,16 @@ class MonitorXClient:
 
     async def resolve_alert(self, alert_id: str) -> bool:
         """Mark an alert as resolved."""
-        if not self.session:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                return await self._resolve_alert_request(client, alert_id)
-        else:
-            return await self._resolve_alert_request(self.session, alert_id)
+        return await self._resolve_alert_request(self._get_session(), alert_id)
 
     async def _resolve_alert_request(self, client: httpx.AsyncClient, alert_id: str) -> bool:
         """Internal method to resolve alert."""
         try:
-            payload = {"alert_id": alert_id}
-
-            response = await client.post(
-                f"{self.base_url}/api/v1/alerts/resolve",
-                json=payload,
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
+            await self._post(client, self._url_alerts_resolve, {"alert_id": alert_id})
+            # Cached alert lists may still show it unresolved
+            with self._query_lock:
+                for key in [key for key in self._query_cache if key[0] == "alerts"]:
+                    del self._query_cache[key]
             logger.info(f"Successfully resolved alert {alert_id}")
             return True
 
@@ -617,21 +1113,13 @@ class MonitorXClient:
 
     async def health_check(self) -> Dict[str, Any]:
         """Check API health."""
-        if not self.session:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                return await self._health_check_request(client)
-        else:
-            return await self._health_check_request(self.session)
+        return await self._health_check_request(self._get_session())
 
     async def _health_check_request(self, client: httpx.AsyncClient) -> Dict[str, Any]:
         """Internal method to check health."""
         try:
-            response = await client.get(
-                f"{self.base_url}/api/v1/health",
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
-            return response.json()
+            response = await self._get(client, self._url_health)
+            return orjson.loads(response.content)
 
         except Exception as e:
             logger.error(f"Health check failed: {e}")
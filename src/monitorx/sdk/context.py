@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import threading
 from typing import Optional
 from contextvars import ContextVar
 
@@ -23,6 +25,10 @@ class MonitorXContext:
 
     _client: ContextVar[Optional[MonitorXClient]] = ContextVar('monitorx_client', default=None)
 
+    # Event loop in a daemon thread that runs metric submissions from sync code
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_lock = threading.Lock()
+
     @classmethod
     def set_client(cls, client: MonitorXClient) -> None:
         """Set the MonitorX client in the current context."""
@@ -38,6 +44,18 @@ class MonitorXContext:
         """Clear the MonitorX client from the current context."""
         cls._client.set(None)
 
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting its thread on first use."""
+        with cls._loop_lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="monitorx-loop", daemon=True
+                ).start()
+                cls._loop = loop
+            return cls._loop
+
     def __init__(self, client: MonitorXClient):
         self.client = client
         self._token = None
@@ -12,16 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import functools
 import time
 import asyncio
 import inspect
-from typing import Callable, Optional, Dict, Any
-import uuid
+from concurrent.futures import Future, wait
+from typing import Callable, Coroutine, Optional, Dict, Any, Set, Union
 from loguru import logger
 
+from .client import new_request_id
 from .context import MonitorXContext
 
+# Strong references to submitted tasks so they are not garbage collected mid-send
+_pending_tasks: Set[asyncio.Task] = set()
+# Submissions running on the background loop, waited for at interpreter exit
+_pending_futures: Set[Future] = set()
+# Longest the interpreter waits at exit for background submissions to finish
+EXIT_DRAIN_TIMEOUT = 5.0
+
+# Monotonic integer clock for latency; bound once to skip the attribute lookup
+_now = time.perf_counter_ns
+
+# Result keys checked, in order, for a drift score
+_DRIFT_KEYS = ('drift_score', 'confidence', 'drift_confidence', 'anomaly_score')
+# Fixed severity floors, highest first
+_SEVERITY_FLOORS = (("critical", 0.9), ("high", 0.8))
+
 
 def monitor_inference(
     model_id: str,
@@ -105,8 +122,8 @@ def _monitor_sync_function(
     tags: Dict[str, str]
 ) -> Any:
     """Monitor synchronous function execution."""
-    request_id = str(uuid.uuid4())
-    start_time = time.time()
+    request_id = new_request_id()
+    start_time = _now()
     error_occurred = False
 
     try:
@@ -120,22 +137,13 @@ def _monitor_sync_function(
         raise
 
     finally:
-        end_time = time.time()
-        latency = (end_time - start_time) * 1000  # Convert to milliseconds
+        latency = (_now() - start_time) / 1_000_000.0  # Convert to milliseconds
 
         # Get client from context
         client = MonitorXContext.get_client()
         if client:
             try:
-                # Use asyncio to run the async method in sync context
-                loop = None
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                loop.run_until_complete(
+                _submit(
                     client.collect_inference_metric(
                         model_id=model_id,
                         model_type=model_type,
@@ -149,6 +157,40 @@ def _monitor_sync_function(
                 logger.error(f"Failed to collect inference metric: {e}")
 
 
+def _submit(coro: Coroutine) -> None:
+    """Start a metric submission from sync code without waiting for it."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop in this thread; the shared background loop sends it
+        future = asyncio.run_coroutine_threadsafe(coro, MonitorXContext.get_loop())
+        _pending_futures.add(future)
+        future.add_done_callback(_pending_futures.discard)
+        future.add_done_callback(_log_submission_error)
+    else:
+        # A sync function called from async code; send alongside the caller
+        task = loop.create_task(coro)
+        _pending_tasks.add(task)
+        task.add_done_callback(_pending_tasks.discard)
+        task.add_done_callback(_log_submission_error)
+
+
+@atexit.register
+def _drain_pending_submissions() -> None:
+    """Wait for background submissions; the loop thread is a daemon and dies at exit."""
+    pending = _pending_futures.copy()
+    if pending:
+        _, not_done = wait(pending, timeout=EXIT_DRAIN_TIMEOUT)
+        if not_done:
+            logger.warning(f"Dropped {len(not_done)} metric submissions still pending at exit")
+
+
+def _log_submission_error(future: Union[Future, asyncio.Future]) -> None:
+    """Log a metric submission that raised."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Failed to submit metric: {future.exception()}")
+
+
 async def _monitor_async_function(
     func: Callable,
     args: tuple,
@@ -159,8 +201,8 @@ async def _monitor_async_function(
     tags: Dict[str, str]
 ) -> Any:
     """Monitor asynchronous function execution."""
-    request_id = str(uuid.uuid4())
-    start_time = time.time()
+    request_id = new_request_id()
+    start_time = _now()
     error_occurred = False
 
     try:
@@ -174,8 +216,7 @@ async def _monitor_async_function(
         raise
 
     finally:
-        end_time = time.time()
-        latency = (end_time - start_time) * 1000  # Convert to milliseconds
+        latency = (_now() - start_time) / 1_000_000.0  # Convert to milliseconds
 
         # Get client from context
         client = MonitorXContext.get_client()
@@ -201,27 +242,18 @@ def _handle_drift_detection(
     tags: Dict[str, str]
 ) -> None:
     """Handle drift detection for synchronous functions."""
-    if not _should_report_drift(result, threshold):
+    confidence = _drift_confidence(result)
+    if confidence is None or confidence < threshold:
         return
 
     client = MonitorXContext.get_client()
     if client:
         try:
-            confidence, severity = _extract_drift_info(result, threshold)
-
-            # Use asyncio to run the async method in sync context
-            loop = None
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            loop.run_until_complete(
+            _submit(
                 client.collect_drift_metric(
                     model_id=model_id,
                     drift_type=drift_type,
-                    severity=severity,
+                    severity=_drift_severity(confidence, threshold),
                     confidence=confidence,
                     tags=tags
                 )
@@ -238,18 +270,17 @@ async def _handle_drift_detection_async(
     tags: Dict[str, str]
 ) -> None:
     """Handle drift detection for asynchronous functions."""
-    if not _should_report_drift(result, threshold):
+    confidence = _drift_confidence(result)
+    if confidence is None or confidence < threshold:
         return
 
     client = MonitorXContext.get_client()
     if client:
         try:
-            confidence, severity = _extract_drift_info(result, threshold)
-
             await client.collect_drift_metric(
                 model_id=model_id,
                 drift_type=drift_type,
-                severity=severity,
+                severity=_drift_severity(confidence, threshold),
                 confidence=confidence,
                 tags=tags
             )
@@ -257,49 +288,26 @@ async def _handle_drift_detection_async(
             logger.error(f"Failed to collect drift metric: {e}")
 
 
-def _should_report_drift(result: Any, threshold: float) -> bool:
-    """Determine if drift should be reported based on result."""
-    # Handle different result formats
+def _drift_confidence(result: Any) -> Optional[float]:
+    """Extract the drift score from a detection result, or None if it has none."""
     if isinstance(result, dict):
-        # Look for common drift score keys
-        drift_keys = ['drift_score', 'confidence', 'drift_confidence', 'anomaly_score']
-        for key in drift_keys:
+        # First of the common drift score keys present wins
+        for key in _DRIFT_KEYS:
             if key in result:
-                return result[key] >= threshold
+                return result[key]
     elif isinstance(result, (int, float)):
         # Direct score
-        return result >= threshold
+        return result
     elif hasattr(result, 'drift_score'):
         # Object with drift_score attribute
-        return result.drift_score >= threshold
-
-    return False
-
+        return result.drift_score
 
-def _extract_drift_info(result: Any, threshold: float) -> tuple[float, str]:
-    """Extract confidence and severity from drift detection result."""
-    confidence = 0.0
+    return None
 
-    # Extract confidence score
-    if isinstance(result, dict):
-        drift_keys = ['drift_score', 'confidence', 'drift_confidence', 'anomaly_score']
-        for key in drift_keys:
-            if key in result:
-                confidence = result[key]
-                break
-    elif isinstance(result, (int, float)):
-        confidence = result
-    elif hasattr(result, 'drift_score'):
-        confidence = result.drift_score
-
-    # Determine severity based on confidence
-    if confidence >= 0.9:
-        severity = "critical"
-    elif confidence >= 0.8:
-        severity = "high"
-    elif confidence >= threshold:
-        severity = "medium"
-    else:
-        severity = "low"
 
-    return confidence, severity
\ No newline at end of file
+def _drift_severity(confidence: float, threshold: float) -> str:
+    """Map a drift score to a severity; anything reaching threshold is at least medium."""
+    for severity, floor in _SEVERITY_FLOORS:
+        if confidence >= floor:
+            return severity
+    return "medium" if confidence >= threshold else "low"
@@ -0,0 +1,44 @@
+# Copyright 2025 MonitorX Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Optional uvloop event loop for applications that send many small requests."""
+import asyncio
+import sys
+
+from loguru import logger
+
+
+def install_event_loop_policy() -> bool:
+    """
+    Make new asyncio event loops use uvloop, if it is installed.
+
+    Call this before the event loop starts (e.g. before ``asyncio.run``); a
+    loop that is already running keeps its implementation. Does nothing on
+    Windows, which uvloop does not support.
+
+    Returns:
+        True if the uvloop policy was installed, False otherwise
+    """
+    if sys.platform == "win32":
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Installed uvloop event loop policy")
+    return True
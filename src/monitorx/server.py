@@ -13,22 +13,22 @@
 # limitations under the License.
 
 import asyncio
+import hashlib
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from loguru import logger
 
 from .api import router
-from .services.storage import InfluxDBStorage
+from .api.routes import metrics_collector, storage
+from .api.datagram import start_datagram_listeners
+from .api.responses import ORJSONResponse
+from .services.storage import StorageError
 from .config import config
 from .middleware import RateLimitMiddleware
 
 
-# Global storage instance
-storage = InfluxDBStorage()
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
@@ -40,10 +40,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to connect to InfluxDB: {e}")
 
+    datagram_transports = await start_datagram_listeners(
+        config.API_HOST, config.METRICS_UDP_PORT, config.METRICS_UNIX_SOCKET,
+        api_key_enabled=config.API_KEY_ENABLED
+    )
+
     yield
 
     # Shutdown
     logger.info("Shutting down MonitorX API server...")
+    for transport in datagram_transports:
+        transport.close()
+    await metrics_collector.close()
     await storage.disconnect()
 
 
@@ -52,7 +60,8 @@ app = FastAPI(
     title="MonitorX API",
     description="ML/AI Infrastructure Observability Platform",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -74,69 +83,90 @@ app.add_middleware(
 app.include_router(router)
 
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Root endpoint with basic information."""
-    return """
-    <html>
-        <head>
-            <title>MonitorX API</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 40px; }
-                .header { color: #333; }
-                .section { margin: 20px 0; }
-                .endpoint { background: #f5f5f5; padding: 10px; margin: 5px 0; }
-                code { background: #e8e8e8; padding: 2px 4px; }
-            </style>
-        </head>
-        <body>
-            <h1 class="header">🎯 MonitorX API</h1>
-            <p>ML/AI Infrastructure Observability Platform</p>
-
-            <div class="section">
-                <h2>Quick Start</h2>
-                <p>Visit <code>/docs</code> for interactive API documentation</p>
-                <p>Visit <code>/redoc</code> for alternative documentation</p>
-                <p>Check <code>/api/v1/health</code> for system status</p>
+@app.exception_handler(StorageError)
+async def storage_error_handler(request: Request, exc: StorageError):
+    """Report an unavailable time-series store as 503."""
+    return ORJSONResponse(status_code=503, content={"detail": f"Storage unavailable: {exc}"})
+
+
+@app.exception_handler(Exception)
+async def unhandled_error_handler(request: Request, exc: Exception):
+    """Log unexpected errors once and return a generic 500."""
+    logger.exception(f"Unhandled error on {request.method} {request.url.path}")
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+
+# The landing page is static, so it is encoded and hashed once at import
+_ROOT_HTML = """
+<html>
+    <head>
+        <title>MonitorX API</title>
+        <style>
+            body { font-family: Arial, sans-serif; margin: 40px; }
+            .header { color: #333; }
+            .section { margin: 20px 0; }
+            .endpoint { background: #f5f5f5; padding: 10px; margin: 5px 0; }
+            code { background: #e8e8e8; padding: 2px 4px; }
+        </style>
+    </head>
+    <body>
+        <h1 class="header">🎯 MonitorX API</h1>
+        <p>ML/AI Infrastructure Observability Platform</p>
+
+        <div class="section">
+            <h2>Quick Start</h2>
+            <p>Visit <code>/docs</code> for interactive API documentation</p>
+            <p>Visit <code>/redoc</code> for alternative documentation</p>
+            <p>Check <code>/api/v1/health</code> for system status</p>
+        </div>
+
+        <div class="section">
+            <h2>Main Endpoints</h2>
+            <div class="endpoint">
+                <strong>POST /api/v1/metrics/inference</strong> - Collect inference metrics
             </div>
-
-            <div class="section">
-                <h2>Main Endpoints</h2>
-                <div class="endpoint">
-                    <strong>POST /api/v1/metrics/inference</strong> - Collect inference metrics
-                </div>
-                <div class="endpoint">
-                    <strong>POST /api/v1/metrics/drift</strong> - Report drift detection
-                </div>
-                <div class="endpoint">
-                    <strong>POST /api/v1/models</strong> - Register model configuration
-                </div>
-                <div class="endpoint">
-                    <strong>GET /api/v1/alerts</strong> - Retrieve alerts
-                </div>
-                <div class="endpoint">
-                    <strong>GET /api/v1/summary</strong> - Get summary statistics
-                </div>
+            <div class="endpoint">
+                <strong>POST /api/v1/metrics/drift</strong> - Report drift detection
             </div>
-
-            <div class="section">
-                <h2>Features</h2>
-                <ul>
-                    <li>Real-time inference metrics collection</li>
-                    <li>Model drift detection and alerting</li>
-                    <li>Resource usage monitoring</li>
-                    <li>Configurable thresholds per model</li>
-                    <li>Time-series data storage with InfluxDB</li>
-                    <li>RESTful API with OpenAPI documentation</li>
-                </ul>
+            <div class="endpoint">
+                <strong>POST /api/v1/models</strong> - Register model configuration
+            </div>
+            <div class="endpoint">
+                <strong>GET /api/v1/alerts</strong> - Retrieve alerts
+            </div>
+            <div class="endpoint">
+                <strong>GET /api/v1/summary</strong> - Get summary statistics
             </div>
+        </div>
+
+        <div class="section">
+            <h2>Features</h2>
+            <ul>
+                <li>Real-time inference metrics collection</li>
+                <li>Model drift detection and alerting</li>
+                <li>Resource usage monitoring</li>
+                <li>Configurable thresholds per model</li>
+                <li>Time-series data storage with InfluxDB</li>
+                <li>RESTful API with OpenAPI documentation</li>
+            </ul>
+        </div>
+
+        <footer style="margin-top: 40px; color: #666; font-size: 14px;">
+            MonitorX v0.1.0 - The missing piece between ML model deployment and production reliability
+        </footer>
+    </body>
+</html>
+""".encode()
+_ROOT_ETAG = f'"{hashlib.blake2b(_ROOT_HTML, digest_size=8).hexdigest()}"'
+_ROOT_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=3600"}
 
-            <footer style="margin-top: 40px; color: #666; font-size: 14px;">
-                MonitorX v0.1.0 - The missing piece between ML model deployment and production reliability
-            </footer>
-        </body>
-    </html>
-    """
+
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request):
+    """Root endpoint with basic information."""
+    if request.headers.get("if-none-match") == _ROOT_ETAG:
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    return HTMLResponse(_ROOT_HTML, headers=_ROOT_HEADERS)
 
 
 if __name__ == "__main__":
@@ -13,12 +13,13 @@
 # limitations under the License.
 
 from .metrics_collector import MetricsCollector
-from .storage import InfluxDBStorage
+from .storage import InfluxDBStorage, StorageError
 from .alerting import AlertingService, EmailChannel, SlackChannel, WebhookChannel
 
 __all__ = [
     'MetricsCollector',
     'InfluxDBStorage',
+    'StorageError',
     'AlertingService',
     'EmailChannel',
     'SlackChannel',
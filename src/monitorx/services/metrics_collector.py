@@ -13,10 +13,12 @@
 # limitations under the License.
 
 import asyncio
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Awaitable, Union
 from datetime import datetime, timedelta
 from collections import deque
 import uuid
+import heapq
+import inspect
 import statistics
 
 from ..types import (
@@ -25,6 +27,14 @@ from ..types import (
 )
 from loguru import logger
 
+# Callbacks may be plain functions or coroutine functions; coroutines are run
+# by a background worker so collection never waits on them (e.g. alert delivery)
+AlertCallback = Callable[[Alert], Union[None, Awaitable[None]]]
+MetricCallback = Callable[[InferenceMetric], Union[None, Awaitable[None]]]
+
+# Most coroutine callbacks waiting to run; more are dropped with a warning
+CALLBACK_QUEUE_SIZE = 1000
+
 
 class MetricsCollector:
     def __init__(self, max_metrics: int = 10000):
@@ -32,31 +42,37 @@ class MetricsCollector:
         self.drift_metrics: deque = deque(maxlen=max_metrics)
         self.alerts: deque = deque(maxlen=1000)
         self.model_configs: Dict[str, ModelConfig] = {}
-        self.alert_callbacks: List[Callable[[Alert], None]] = []
-        self.metric_callbacks: List[Callable[[InferenceMetric], None]] = []
+        self.alert_callbacks: List[AlertCallback] = []
+        self.metric_callbacks: List[MetricCallback] = []
+        # Queue and worker for coroutine callbacks, bound to the loop that created them
+        self._callback_queue: Optional[asyncio.Queue] = None
+        self._callback_worker: Optional[asyncio.Task] = None
+        self._callback_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def register_model(self, config: ModelConfig) -> None:
         """Register a new model configuration."""
         self.model_configs[config.id] = config
         logger.info(f"Registered model: {config.name} ({config.id})")
 
-    def add_alert_callback(self, callback: Callable[[Alert], None]) -> None:
+    def add_alert_callback(self, callback: AlertCallback) -> None:
         """Add callback to be called when alerts are generated."""
         self.alert_callbacks.append(callback)
 
-    def add_metric_callback(self, callback: Callable[[InferenceMetric], None]) -> None:
+    def add_metric_callback(self, callback: MetricCallback) -> None:
         """Add callback to be called when metrics are collected."""
         self.metric_callbacks.append(callback)
 
     async def collect_inference_metric(self, metric: InferenceMetric) -> None:
         """Collect an inference metric and check thresholds."""
         self.metrics.append(metric)
-        logger.debug(f"Collected metric for model {metric.model_id}")
+        logger.debug("Collected metric for model {}", metric.model_id)
 
         # Call callbacks
         for callback in self.metric_callbacks:
             try:
-                callback(metric)
+                result = callback(metric)
+                if inspect.isawaitable(result):
+                    self._defer_callback("metric", result)
             except Exception as e:
                 logger.error(f"Error in metric callback: {e}")
 
@@ -149,10 +165,52 @@ class MetricsCollector:
         # Call alert callbacks
         for callback in self.alert_callbacks:
             try:
-                callback(alert)
+                result = callback(alert)
+                if inspect.isawaitable(result):
+                    self._defer_callback("alert", result)
             except Exception as e:
                 logger.error(f"Error in alert callback: {e}")
 
+    def _defer_callback(self, kind: str, awaitable: Awaitable[None]) -> None:
+        """Queue a coroutine callback's result for the background worker."""
+        loop = asyncio.get_running_loop()
+        queue = self._callback_queue
+        if queue is None or self._callback_loop is not loop:
+            queue = self._callback_queue = asyncio.Queue(maxsize=CALLBACK_QUEUE_SIZE)
+            self._callback_worker = loop.create_task(self._run_callbacks(queue))
+            self._callback_loop = loop
+        try:
+            queue.put_nowait((kind, awaitable))
+        except asyncio.QueueFull:
+            logger.warning(f"Callback queue full, dropping {kind} callback")
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+
+    async def _run_callbacks(self, queue: asyncio.Queue) -> None:
+        """Await queued callbacks one at a time, logging any that fail."""
+        while True:
+            kind, awaitable = await queue.get()
+            try:
+                await awaitable
+            except Exception as e:
+                logger.error(f"Error in {kind} callback: {e}")
+            finally:
+                queue.task_done()
+
+    async def drain_callbacks(self) -> None:
+        """Wait until every queued coroutine callback has finished."""
+        if self._callback_queue is not None and self._callback_loop is asyncio.get_running_loop():
+            await self._callback_queue.join()
+
+    async def close(self) -> None:
+        """Run the queued coroutine callbacks, then stop the worker."""
+        await self.drain_callbacks()
+        if self._callback_worker is not None:
+            self._callback_worker.cancel()
+        self._callback_queue = None
+        self._callback_worker = None
+        self._callback_loop = None
+
     def _calculate_severity(self, value: float, threshold: float) -> str:
         """Calculate alert severity based on how much value exceeds threshold."""
         ratio = value / threshold
@@ -165,8 +223,16 @@ class MetricsCollector:
         else:
             return "low"
 
+    @staticmethod
+    def _newest_first(items, limit: Optional[int]) -> list:
+        """Order items newest first, selecting only the newest `limit` when given."""
+        if limit is not None:
+            return heapq.nlargest(limit, items, key=lambda x: x.timestamp)
+        return sorted(items, key=lambda x: x.timestamp, reverse=True)
+
     def get_metrics(self, model_id: Optional[str] = None,
-                   since: Optional[datetime] = None) -> List[InferenceMetric]:
+                   since: Optional[datetime] = None,
+                   limit: Optional[int] = None) -> List[InferenceMetric]:
         """Get metrics with optional filtering."""
         filtered_metrics = list(self.metrics)
 
@@ -176,10 +242,11 @@ class MetricsCollector:
         if since:
             filtered_metrics = [m for m in filtered_metrics if m.timestamp >= since]
 
-        return sorted(filtered_metrics, key=lambda x: x.timestamp, reverse=True)
+        return self._newest_first(filtered_metrics, limit)
 
     def get_drift_metrics(self, model_id: Optional[str] = None,
-                         since: Optional[datetime] = None) -> List[DriftMetric]:
+                         since: Optional[datetime] = None,
+                         limit: Optional[int] = None) -> List[DriftMetric]:
         """Get drift metrics with optional filtering."""
         filtered_metrics = list(self.drift_metrics)
 
@@ -189,11 +256,12 @@ class MetricsCollector:
         if since:
             filtered_metrics = [m for m in filtered_metrics if m.timestamp >= since]
 
-        return sorted(filtered_metrics, key=lambda x: x.timestamp, reverse=True)
+        return self._newest_first(filtered_metrics, limit)
 
     def get_alerts(self, model_id: Optional[str] = None,
                   since: Optional[datetime] = None,
-                  resolved: Optional[bool] = None) -> List[Alert]:
+                  resolved: Optional[bool] = None,
+                  limit: Optional[int] = None) -> List[Alert]:
         """Get alerts with optional filtering."""
         filtered_alerts = list(self.alerts)
 
@@ -206,7 +274,7 @@ class MetricsCollector:
         if resolved is not None:
             filtered_alerts = [a for a in filtered_alerts if a.resolved == resolved]
 
-        return sorted(filtered_alerts, key=lambda x: x.timestamp, reverse=True)
+        return self._newest_first(filtered_alerts, limit)
 
     def get_model_configs(self) -> List[ModelConfig]:
         """Get all registered model configurations."""
@@ -215,7 +283,14 @@ class MetricsCollector:
     def get_summary_stats(self, model_id: Optional[str] = None,
                          since: Optional[datetime] = None) -> SummaryStats:
         """Get summary statistics for metrics."""
-        metrics = self.get_metrics(model_id, since)
+        # Filter without the newest-first sort get_metrics does; order is irrelevant here
+        metrics = list(self.metrics)
+
+        if model_id:
+            metrics = [m for m in metrics if m.model_id == model_id]
+
+        if since:
+            metrics = [m for m in metrics if m.timestamp >= since]
 
         if not metrics:
             return SummaryStats()
@@ -223,28 +298,28 @@ class MetricsCollector:
         # Calculate basic stats
         total_requests = len(metrics)
         latencies = [m.latency for m in metrics]
-        average_latency = statistics.mean(latencies) if latencies else 0.0
+        average_latency = statistics.mean(latencies)
 
         # Calculate error rate
-        error_metrics = [m for m in metrics if m.error_rate and m.error_rate > 0]
-        error_rate = (
-            statistics.mean([m.error_rate for m in error_metrics])
-            if error_metrics else 0.0
-        )
-
-        # Calculate percentiles
-        sorted_latencies = sorted(latencies)
-        p95_latency = (
-            sorted_latencies[int(len(sorted_latencies) * 0.95)]
-            if sorted_latencies else 0.0
-        )
-        p99_latency = (
-            sorted_latencies[int(len(sorted_latencies) * 0.99)]
-            if sorted_latencies else 0.0
-        )
+        error_rates = [m.error_rate for m in metrics if m.error_rate and m.error_rate > 0]
+        error_rate = statistics.mean(error_rates) if error_rates else 0.0
+
+        # Percentiles only need the top 5% of latencies, not a full sort.
+        # sorted(latencies)[i] is the (n - i)-th largest value.
+        n = total_requests
+        p95_index = int(n * 0.95)
+        p99_index = int(n * 0.99)
+        top = heapq.nlargest(n - p95_index, latencies)
+        p95_latency = top[n - 1 - p95_index]
+        p99_latency = top[n - 1 - p99_index]
 
         # Count active alerts
-        active_alerts = len([a for a in self.get_alerts(model_id, since) if not a.resolved])
+        active_alerts = sum(
+            1 for a in self.alerts
+            if not a.resolved
+            and (not model_id or a.model_id == model_id)
+            and (not since or a.timestamp >= since)
+        )
 
         return SummaryStats(
             total_requests=total_requests,
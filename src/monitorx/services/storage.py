@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 import asyncio
 from influxdb_client import InfluxDBClient, Point
@@ -22,6 +22,23 @@ from loguru import logger
 from ..types import InferenceMetric, DriftMetric, Alert
 from ..config import config
 
+class StorageError(RuntimeError):
+    """Raised when the time-series store is unavailable."""
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _flux_time(dt: datetime) -> str:
+    """Flux time literal from integer epoch nanoseconds.
+
+    Naive datetimes are taken as UTC, matching how the write API stores them.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return f"time(v: {(dt - _EPOCH) // _MICROSECOND * 1000})"
+
 
 class InfluxDBStorage:
     def __init__(self):
@@ -59,76 +76,116 @@ class InfluxDBStorage:
             self.client.close()
             logger.info("Disconnected from InfluxDB")
 
+    @staticmethod
+    def _inference_point(metric: InferenceMetric) -> Point:
+        """Build the InfluxDB point for an inference metric."""
+        point = (
+            Point("inference_metrics")
+            .tag("model_id", metric.model_id)
+            .tag("model_type", metric.model_type)
+            .tag("request_id", metric.request_id)
+            .field("latency", metric.latency)
+            .time(metric.timestamp)
+        )
+
+        # Add optional fields
+        if metric.throughput is not None:
+            point = point.field("throughput", metric.throughput)
+
+        if metric.error_rate is not None:
+            point = point.field("error_rate", metric.error_rate)
+
+        # Add resource usage fields
+        if metric.resource_usage:
+            if metric.resource_usage.gpu_memory is not None:
+                point = point.field("gpu_memory", metric.resource_usage.gpu_memory)
+            if metric.resource_usage.cpu_usage is not None:
+                point = point.field("cpu_usage", metric.resource_usage.cpu_usage)
+            if metric.resource_usage.memory_usage is not None:
+                point = point.field("memory_usage", metric.resource_usage.memory_usage)
+
+        # Add custom tags
+        for key, value in metric.tags.items():
+            point = point.tag(key, value)
+
+        return point
+
     async def write_inference_metric(self, metric: InferenceMetric) -> None:
         """Write inference metric to InfluxDB."""
         if not self.write_api:
-            raise RuntimeError("Not connected to InfluxDB")
+            raise StorageError("Not connected to InfluxDB")
 
         try:
-            point = (
-                Point("inference_metrics")
-                .tag("model_id", metric.model_id)
-                .tag("model_type", metric.model_type)
-                .tag("request_id", metric.request_id)
-                .field("latency", metric.latency)
-                .time(metric.timestamp)
-            )
-
-            # Add optional fields
-            if metric.throughput is not None:
-                point = point.field("throughput", metric.throughput)
+            self.write_api.write(bucket=self.bucket, record=self._inference_point(metric))
+            logger.debug("Wrote inference metric for model {}", metric.model_id)
 
-            if metric.error_rate is not None:
-                point = point.field("error_rate", metric.error_rate)
-
-            # Add resource usage fields
-            if metric.resource_usage:
-                if metric.resource_usage.gpu_memory is not None:
-                    point = point.field("gpu_memory", metric.resource_usage.gpu_memory)
-                if metric.resource_usage.cpu_usage is not None:
-                    point = point.field("cpu_usage", metric.resource_usage.cpu_usage)
-                if metric.resource_usage.memory_usage is not None:
-                    point = point.field("memory_usage", metric.resource_usage.memory_usage)
+        except Exception as e:
+            logger.error(f"Failed to write inference metric: {e}")
 
-            # Add custom tags
-            for key, value in metric.tags.items():
-                point = point.tag(key, value)
+    async def write_inference_metrics(self, metrics: List[InferenceMetric]) -> None:
+        """Write several inference metrics to InfluxDB in one write call."""
+        if not self.write_api:
+            raise StorageError("Not connected to InfluxDB")
 
-            self.write_api.write(bucket=self.bucket, record=point)
-            logger.debug(f"Wrote inference metric for model {metric.model_id}")
+        try:
+            self.write_api.write(
+                bucket=self.bucket,
+                record=[self._inference_point(metric) for metric in metrics]
+            )
+            logger.debug("Wrote {} inference metrics", len(metrics))
 
         except Exception as e:
-            logger.error(f"Failed to write inference metric: {e}")
+            logger.error(f"Failed to write inference metrics: {e}")
+
+    @staticmethod
+    def _drift_point(metric: DriftMetric) -> Point:
+        """Build the InfluxDB point for a drift metric."""
+        point = (
+            Point("drift_metrics")
+            .tag("model_id", metric.model_id)
+            .tag("drift_type", metric.drift_type)
+            .tag("severity", metric.severity)
+            .field("confidence", metric.confidence)
+            .time(metric.timestamp)
+        )
+
+        # Add custom tags
+        for key, value in metric.tags.items():
+            point = point.tag(key, value)
+
+        return point
 
     async def write_drift_metric(self, metric: DriftMetric) -> None:
         """Write drift metric to InfluxDB."""
         if not self.write_api:
-            raise RuntimeError("Not connected to InfluxDB")
+            raise StorageError("Not connected to InfluxDB")
 
         try:
-            point = (
-                Point("drift_metrics")
-                .tag("model_id", metric.model_id)
-                .tag("drift_type", metric.drift_type)
-                .tag("severity", metric.severity)
-                .field("confidence", metric.confidence)
-                .time(metric.timestamp)
-            )
+            self.write_api.write(bucket=self.bucket, record=self._drift_point(metric))
+            logger.debug("Wrote drift metric for model {}", metric.model_id)
 
-            # Add custom tags
-            for key, value in metric.tags.items():
-                point = point.tag(key, value)
+        except Exception as e:
+            logger.error(f"Failed to write drift metric: {e}")
 
-            self.write_api.write(bucket=self.bucket, record=point)
-            logger.debug(f"Wrote drift metric for model {metric.model_id}")
+    async def write_drift_metrics(self, metrics: List[DriftMetric]) -> None:
+        """Write several drift metrics to InfluxDB in one write call."""
+        if not self.write_api:
+            raise StorageError("Not connected to InfluxDB")
+
+        try:
+            self.write_api.write(
+                bucket=self.bucket,
+                record=[self._drift_point(metric) for metric in metrics]
+            )
+            logger.debug("Wrote {} drift metrics", len(metrics))
 
         except Exception as e:
-            logger.error(f"Failed to write drift metric: {e}")
+            logger.error(f"Failed to write drift metrics: {e}")
 
     async def write_alert(self, alert: Alert) -> None:
         """Write alert to InfluxDB."""
         if not self.write_api:
-            raise RuntimeError("Not connected to InfluxDB")
+            raise StorageError("Not connected to InfluxDB")
 
         try:
             point = (
@@ -160,7 +217,7 @@ class InfluxDBStorage:
     ) -> List[Dict[str, Any]]:
         """Query inference metrics from InfluxDB."""
         if not self.query_api:
-            raise RuntimeError("Not connected to InfluxDB")
+            raise StorageError("Not connected to InfluxDB")
 
         # Default to last 24 hours
         if not start_time:
@@ -170,7 +227,7 @@ class InfluxDBStorage:
 
         query = f'''
             from(bucket: "{self.bucket}")
-            |> range(start: {start_time.isoformat()}Z, stop: {end_time.isoformat()}Z)
+            |> range(start: {_flux_time(start_time)}, stop: {_flux_time(end_time)})
             |> filter(fn: (r) => r._measurement == "inference_metrics")
         '''
 
@@ -211,7 +268,7 @@ class InfluxDBStorage:
     ) -> List[Dict[str, Any]]:
         """Query drift metrics from InfluxDB."""
         if not self.query_api:
-            raise RuntimeError("Not connected to InfluxDB")
+            raise StorageError("Not connected to InfluxDB")
 
         # Default to last 7 days
         if not start_time:
@@ -221,7 +278,7 @@ class InfluxDBStorage:
 
         query = f'''
             from(bucket: "{self.bucket}")
-            |> range(start: {start_time.isoformat()}Z, stop: {end_time.isoformat()}Z)
+            |> range(start: {_flux_time(start_time)}, stop: {_flux_time(end_time)})
             |> filter(fn: (r) => r._measurement == "drift_metrics")
         '''
 
@@ -261,7 +318,7 @@ class InfluxDBStorage:
     ) -> List[Dict[str, Any]]:
         """Query alerts from InfluxDB."""
         if not self.query_api:
-            raise RuntimeError("Not connected to InfluxDB")
+            raise StorageError("Not connected to InfluxDB")
 
         # Default to last 7 days
         if not start_time:
@@ -271,7 +328,7 @@ class InfluxDBStorage:
 
         query = f'''
             from(bucket: "{self.bucket}")
-            |> range(start: {start_time.isoformat()}Z, stop: {end_time.isoformat()}Z)
+            |> range(start: {_flux_time(start_time)}, stop: {_flux_time(end_time)})
             |> filter(fn: (r) => r._measurement == "alerts")
         '''
 
@@ -313,10 +370,13 @@ class InfluxDBStorage:
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
         window: str = "5m"
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        """Get aggregated metrics (average, min, max) over time windows."""
+    ) -> Dict[str, Dict[str, List[Any]]]:
+        """Get aggregated metrics (average, min, max) over time windows.
+
+        Each metric maps to parallel "time" and "value" columns.
+        """
         if not self.query_api:
-            raise RuntimeError("Not connected to InfluxDB")
+            raise StorageError("Not connected to InfluxDB")
 
         # Default to last 6 hours
         if not start_time:
@@ -326,7 +386,7 @@ class InfluxDBStorage:
 
         base_query = f'''
             from(bucket: "{self.bucket}")
-            |> range(start: {start_time.isoformat()}Z, stop: {end_time.isoformat()}Z)
+            |> range(start: {_flux_time(start_time)}, stop: {_flux_time(end_time)})
             |> filter(fn: (r) => r._measurement == "inference_metrics")
         '''
 
@@ -347,19 +407,15 @@ class InfluxDBStorage:
 
             try:
                 tables = self.query_api.query(query)
-                metric_data = []
-
-                for table in tables:
-                    for record in table.records:
-                        metric_data.append({
-                            'time': record.get_time(),
-                            'value': record.get_value(),
-                        })
+                records = [record for table in tables for record in table.records]
 
-                results[metric] = metric_data
+                results[metric] = {
+                    'time': [record.get_time() for record in records],
+                    'value': [record.get_value() for record in records],
+                }
 
             except Exception as e:
                 logger.error(f"Failed to query aggregated {metric} metrics: {e}")
-                results[metric] = []
+                results[metric] = {'time': [], 'value': []}
 
         return results
\ No newline at end of file
@@ -14,12 +14,16 @@
 
 """Tests for API endpoints."""
 import pytest
+import asyncio
+import socket
 from fastapi.testclient import TestClient
 from datetime import datetime
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, Mock
 
 from monitorx.server import app
+from monitorx.api import routes
 from monitorx.api.routes import metrics_collector, storage
+from monitorx.api.datagram import MetricDatagramProtocol, start_datagram_listeners
 
 
 @pytest.fixture
@@ -42,15 +46,41 @@ def reset_metrics_collector():
 def mock_storage():
     """Mock storage operations."""
     with patch.object(storage, 'write_inference_metric', new_callable=AsyncMock) as mock_write_inference, \
+         patch.object(storage, 'write_inference_metrics', new_callable=AsyncMock) as mock_write_inference_batch, \
          patch.object(storage, 'write_drift_metric', new_callable=AsyncMock) as mock_write_drift, \
+         patch.object(storage, 'write_drift_metrics', new_callable=AsyncMock) as mock_write_drift_batch, \
          patch.object(storage, 'get_aggregated_metrics', new_callable=AsyncMock) as mock_get_aggregated:
 
         mock_write_inference.return_value = None
+        mock_write_inference_batch.return_value = None
         mock_write_drift.return_value = None
+        mock_write_drift_batch.return_value = None
         mock_get_aggregated.return_value = {}
         yield
 
 
+class TestRootEndpoint:
+    """Test the HTML landing page."""
+
+    def test_root_returns_html_with_etag(self, client):
+        """Test the landing page is served with caching headers."""
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "MonitorX API" in response.text
+        assert response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=3600"
+
+    def test_root_not_modified(self, client):
+        """Test a matching If-None-Match gets an empty 304."""
+        etag = client.get("/").headers["etag"]
+
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+
 class TestHealthEndpoint:
     """Test health check endpoint."""
 
@@ -65,6 +95,20 @@ class TestHealthEndpoint:
         assert "services" in data
         assert data["services"]["api"] == "healthy"
 
+    def test_health_check_caches_influxdb_probe(self, client):
+        """Test the InfluxDB probe is reused within the cache TTL."""
+        influx_client = Mock()
+        influx_client.health.return_value = Mock(status="pass")
+
+        with patch.object(storage, "client", influx_client), \
+             patch.object(routes, "_influxdb_health", (float("-inf"), "unknown")):
+            first = client.get("/api/v1/health").json()
+            second = client.get("/api/v1/health").json()
+
+        assert first["services"]["influxdb"] == "healthy"
+        assert second["services"]["influxdb"] == "healthy"
+        influx_client.health.assert_called_once()
+
 
 class TestModelEndpoints:
     """Test model registration endpoints."""
@@ -143,10 +187,25 @@ class TestMetricsEndpoints:
         }
 
         response = client.post("/api/v1/metrics/inference", json=metric_data)
-        assert response.status_code == 201
+        assert response.status_code == 202
 
         data = response.json()
         assert data["status"] == "success"
+        storage.write_inference_metric.assert_awaited_once()
+
+    def test_collect_inference_metric_storage_failure(self, client):
+        """Test storage errors don't fail an accepted metric."""
+        metric_data = {
+            "model_id": "test-model-1",
+            "model_type": "llm",
+            "request_id": "req-789",
+            "latency": 500.0
+        }
+
+        storage.write_inference_metric.side_effect = RuntimeError("Not connected to InfluxDB")
+        response = client.post("/api/v1/metrics/inference", json=metric_data)
+        assert response.status_code == 202
+        assert len(metrics_collector.metrics) == 1
 
     def test_collect_inference_metric_with_resource_usage(self, client):
         """Test collecting metric with resource usage."""
@@ -163,7 +222,7 @@ class TestMetricsEndpoints:
         }
 
         response = client.post("/api/v1/metrics/inference", json=metric_data)
-        assert response.status_code == 201
+        assert response.status_code == 202
 
     def test_collect_inference_metric_invalid_latency(self, client):
         """Test collecting metric with invalid latency."""
@@ -176,6 +235,62 @@ class TestMetricsEndpoints:
 
         response = client.post("/api/v1/metrics/inference", json=metric_data)
         assert response.status_code == 422
+        detail = response.json()["detail"]
+        assert detail[0]["loc"] == ["body", "latency"]
+        assert detail[0]["type"] == "value_error"
+
+    def test_collect_inference_metric_validation_errors(self, client):
+        """Test 422 details list the failing field in pydantic's {loc, msg, type} form."""
+        missing = client.post("/api/v1/metrics/inference", json={"model_type": "llm"})
+        nested = client.post("/api/v1/metrics/inference", json={
+            "model_id": "test-model-1",
+            "model_type": "llm",
+            "request_id": "req-123",
+            "latency": 100.0,
+            "resource_usage": {"gpu_memory": 2.0}
+        })
+        malformed = client.post(
+            "/api/v1/metrics/inference",
+            content=b"{not json",
+            headers={"Content-Type": "application/json"}
+        )
+
+        assert missing.json()["detail"] == [
+            {"loc": ["body", "model_id"], "msg": "Field required", "type": "missing"}
+        ]
+        assert nested.json()["detail"][0]["loc"] == ["body", "resource_usage", "gpu_memory"]
+        assert malformed.json()["detail"][0]["type"] == "json_invalid"
+
+    def test_collect_inference_metric_coerces_numeric_strings(self, client):
+        """Test numeric strings are accepted for number fields, as in pydantic's lax mode."""
+        metric_data = {
+            "model_id": "test-model-1",
+            "model_type": "llm",
+            "request_id": "req-123",
+            "latency": "12.5"
+        }
+
+        response = client.post("/api/v1/metrics/inference", json=metric_data)
+        assert response.status_code == 202
+
+    def test_collect_inference_metrics_batch(self, client):
+        """Test collecting a batch of inference metrics with one invalid entry."""
+        batch = {
+            "metrics": [
+                {"model_id": "model-1", "model_type": "llm", "request_id": "req-1", "latency": 100.0},
+                {"model_id": "model-2", "model_type": "cv", "request_id": "req-2", "latency": 200.0},
+                {"model_id": "model-3", "model_type": "llm", "request_id": "req-3", "latency": -1.0}
+            ]
+        }
+
+        response = client.post("/api/v1/metrics/inference/batch", json=batch)
+        assert response.status_code == 202
+
+        data = response.json()
+        assert data["accepted"] == 2
+        assert data["rejected"] == 1
+        assert len(metrics_collector.metrics) == 2
+        storage.write_inference_metrics.assert_awaited_once()
 
     def test_get_inference_metrics(self, client):
         """Test retrieving inference metrics."""
@@ -241,7 +356,26 @@ class TestMetricsEndpoints:
         }
 
         response = client.post("/api/v1/metrics/drift", json=drift_data)
-        assert response.status_code == 201
+        assert response.status_code == 202
+
+    def test_collect_drift_metrics_batch(self, client):
+        """Test collecting a batch of drift metrics with one invalid entry."""
+        batch = {
+            "metrics": [
+                {"model_id": "model-1", "drift_type": "data", "severity": "low", "confidence": 0.6},
+                {"model_id": "model-2", "drift_type": "concept", "severity": "medium", "confidence": 0.7},
+                {"model_id": "model-3", "drift_type": "data", "severity": "low", "confidence": 1.5}
+            ]
+        }
+
+        response = client.post("/api/v1/metrics/drift/batch", json=batch)
+        assert response.status_code == 202
+
+        data = response.json()
+        assert data["accepted"] == 2
+        assert data["rejected"] == 1
+        assert len(metrics_collector.drift_metrics) == 2
+        storage.write_drift_metrics.assert_awaited_once()
 
     def test_get_drift_metrics(self, client):
         """Test retrieving drift metrics."""
@@ -425,3 +559,72 @@ class TestAggregatedMetrics:
         """Test getting aggregated metrics with invalid window."""
         response = client.get("/api/v1/metrics/aggregated?window=invalid")
         assert response.status_code == 422
+
+
+class TestMetricDatagrams:
+    """Test fire-and-forget metric ingestion over datagrams."""
+
+    @pytest.mark.asyncio
+    async def test_datagram_metric_collected_and_stored(self):
+        """Test a valid datagram is collected and written to storage."""
+        protocol = MetricDatagramProtocol()
+        protocol.datagram_received(
+            b'{"model_id": "model-1", "model_type": "llm", "request_id": "req-1", "latency": 120.0}',
+            ("127.0.0.1", 50000)
+        )
+        await asyncio.gather(*protocol._tasks)
+
+        assert metrics_collector.metrics[-1].request_id == "req-1"
+        storage.write_inference_metric.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_datagram_dropped(self):
+        """Test an invalid datagram is dropped without scheduling any work."""
+        protocol = MetricDatagramProtocol()
+        protocol.datagram_received(b'{"model_id": "model-1", "latency": -1}', ("127.0.0.1", 50000))
+        protocol.datagram_received(b'not json', ("127.0.0.1", 50000))
+
+        assert not protocol._tasks
+        assert len(metrics_collector.metrics) == 0
+
+    @pytest.mark.asyncio
+    async def test_unix_listener_keeps_non_socket_file(self, tmp_path):
+        """Test a regular file at the socket path is left alone and no listener starts."""
+        path = tmp_path / "metrics.db"
+        path.write_bytes(b"important data")
+
+        transports = await start_datagram_listeners("127.0.0.1", 0, str(path))
+
+        assert transports == []
+        assert path.read_bytes() == b"important data"
+
+    @pytest.mark.asyncio
+    async def test_unix_listener_replaces_stale_socket(self, tmp_path):
+        """Test a socket file left by a previous run is replaced."""
+        path = str(tmp_path / "metrics.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as stale:
+            stale.bind(path)
+
+        transports = await start_datagram_listeners("127.0.0.1", 0, path)
+        try:
+            assert len(transports) == 1
+        finally:
+            for transport in transports:
+                transport.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("api_key_enabled,bound_host", [(False, "0.0.0.0"), (True, "127.0.0.1")])
+    async def test_udp_listener_loopback_only_with_api_keys(self, api_key_enabled, bound_host):
+        """Test the unauthenticated UDP listener is not exposed when API keys are enabled."""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        transports = await start_datagram_listeners(
+            "0.0.0.0", port, None, api_key_enabled=api_key_enabled
+        )
+        try:
+            assert transports[0].get_extra_info("sockname") == (bound_host, port)
+        finally:
+            for transport in transports:
+                transport.close()
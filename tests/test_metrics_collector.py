@@ -13,8 +13,10 @@
 # limitations under the License.
 
 """Tests for MetricsCollector."""
+import asyncio
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from monitorx.services.metrics_collector import MetricsCollector
 from monitorx.types import InferenceMetric, DriftMetric, ModelConfig, Alert
@@ -139,6 +141,22 @@ class TestMetricsCollector:
         assert len(filtered) == 1
         assert filtered[0].request_id == "req-2"
 
+    def test_get_metrics_with_limit(self, metrics_collector):
+        """Test limit returns only the newest metrics."""
+        now = datetime.now()
+        for i in range(5):
+            metrics_collector.metrics.append(InferenceMetric(
+                model_id="model-1",
+                model_type="llm",
+                request_id=f"req-{i}",
+                latency=100.0,
+                timestamp=now - timedelta(minutes=i)
+            ))
+
+        limited = metrics_collector.get_metrics(limit=2)
+        assert [m.request_id for m in limited] == ["req-0", "req-1"]
+        assert len(metrics_collector.get_metrics()) == 5
+
     def test_get_alerts_filtered_by_resolved_status(self, metrics_collector):
         """Test filtering alerts by resolved status."""
         alert1 = Alert(
@@ -253,6 +271,58 @@ class TestMetricsCollector:
 
         assert len(callback_called) >= 1
 
+    @pytest.mark.asyncio
+    async def test_async_alert_callbacks(self, metrics_collector, sample_model_config):
+        """Test that coroutine alert callbacks are awaited."""
+        callback_called = []
+
+        async def alert_callback(alert: Alert):
+            callback_called.append(alert)
+
+        metrics_collector.add_alert_callback(alert_callback)
+        metrics_collector.register_model(sample_model_config)
+
+        high_latency = InferenceMetric(
+            model_id="test-model-1",
+            model_type="llm",
+            request_id="req-999",
+            latency=3000.0
+        )
+
+        await metrics_collector.collect_inference_metric(high_latency)
+        await metrics_collector.drain_callbacks()
+
+        assert len(callback_called) >= 1
+
+    @pytest.mark.asyncio
+    async def test_async_callbacks_do_not_block_collection(
+        self, metrics_collector, sample_inference_metric
+    ):
+        """Test collection returns before coroutine callbacks finish; their errors are logged."""
+        release = asyncio.Event()
+        delivered = []
+
+        async def slow_callback(metric: InferenceMetric):
+            await release.wait()
+            delivered.append(metric)
+
+        async def failing_callback(metric: InferenceMetric):
+            raise RuntimeError("delivery failed")
+
+        metrics_collector.add_metric_callback(slow_callback)
+        metrics_collector.add_metric_callback(failing_callback)
+
+        await metrics_collector.collect_inference_metric(sample_inference_metric)
+        assert delivered == []
+
+        release.set()
+        with patch("monitorx.services.metrics_collector.logger") as mock_logger:
+            await metrics_collector.drain_callbacks()
+
+        assert delivered == [sample_inference_metric]
+        mock_logger.error.assert_called_once_with("Error in metric callback: delivery failed")
+        await metrics_collector.close()
+
     def test_metric_callbacks(self, metrics_collector, sample_inference_metric):
         """Test that metric callbacks are called."""
         callback_called = []
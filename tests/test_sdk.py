@@ -14,10 +14,21 @@
 
 """Tests for SDK client."""
 import pytest
+import asyncio
+import socket
+import sys
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, AsyncMock, patch
 import httpx
+import orjson
 
-from monitorx.sdk.client import MonitorXClient
+from monitorx.sdk import (
+    MonitorXContext, install_event_loop_policy, monitor_drift, monitor_inference
+)
+from monitorx.sdk.client import MonitorXClient, new_request_id
+from monitorx.sdk.decorators import _drain_pending_submissions
 from monitorx.types import ModelConfig, Thresholds, ResourceUsage
 
 
@@ -27,6 +38,59 @@ def client():
     return MonitorXClient(base_url="http://localhost:8000")
 
 
+class _HealthHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a healthy status over a kept-alive connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = orjson.dumps({"status": "healthy"})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Run a local keep-alive HTTP server and yield its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@contextmanager
+def _mock_transport_client(posted, expected):
+    """Yield a client whose pools answer from a MockTransport, each usable on one loop."""
+    done = threading.Event()
+
+    def create_session(self):
+        loops = set()
+
+        def handler(request):
+            loops.add(asyncio.get_running_loop())
+            assert len(loops) == 1, "pool used from two event loops"
+            if request.method == "GET":
+                return httpx.Response(200, json={"status": "healthy"})
+            posted.append(orjson.loads(request.content))
+            if len(posted) == expected:
+                done.set()
+            return httpx.Response(202, json={"status": "success"})
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with patch.object(MonitorXClient, '_create_session', create_session):
+        client = MonitorXClient()
+        yield client, done
+
+
 @pytest.fixture
 def sample_model_config():
     """Create sample model config."""
@@ -60,20 +124,55 @@ class TestMonitorXClient:
         client = MonitorXClient(base_url="http://api.example.com/")
         assert client.base_url == "http://api.example.com"
 
-    def test_get_headers_without_api_key(self, client):
+    def test_headers_without_api_key(self, client):
         """Test headers without API key."""
-        headers = client._get_headers()
+        headers = client._headers
         assert headers["Content-Type"] == "application/json"
         assert "Authorization" not in headers
 
-    def test_get_headers_with_api_key(self):
+    def test_headers_with_api_key(self):
         """Test headers with API key."""
         client = MonitorXClient(api_key="test-key")
-        headers = client._get_headers()
+        headers = client._headers
 
         assert "Authorization" in headers
         assert headers["Authorization"] == "Bearer test-key"
 
+    def test_session_uses_prebuilt_headers(self):
+        """Test the pooled session carries the headers built at construction."""
+        client = MonitorXClient(api_key="test-key")
+
+        assert client.session.headers["Authorization"] == "Bearer test-key"
+        with pytest.raises(TypeError):
+            client._headers["Authorization"] = "Bearer other"
+
+    def test_client_reused_across_event_loops(self, http_server):
+        """Test one client works under successive asyncio.run() calls."""
+        client = MonitorXClient(base_url=http_server)
+
+        first = asyncio.run(client.health_check())
+        second = asyncio.run(client.health_check())
+
+        assert first["status"] == "healthy"
+        assert second["status"] == "healthy"
+
+    def test_close_after_event_loop_change(self, http_server):
+        """Test closing from a new event loop a client whose pool was used on another."""
+        client = MonitorXClient(base_url=http_server)
+        asyncio.run(client.health_check())
+
+        asyncio.run(client.close())
+
+        assert client.session.is_closed
+
+    def test_http2_is_opt_in(self):
+        """Test the pooled session only negotiates HTTP/2 when asked to."""
+        with patch('httpx.AsyncClient') as mock_client_class:
+            MonitorXClient()
+            MonitorXClient(http2=True)
+
+        assert [call[1]["http2"] for call in mock_client_class.call_args_list] == [False, True]
+
     @pytest.mark.asyncio
     async def test_context_manager(self):
         """Test async context manager."""
@@ -85,6 +184,45 @@ class TestMonitorXClient:
 
         # Session should be closed after context
         assert client.session is not None  # Reference still exists
+        assert client.session.is_closed
+
+    @pytest.mark.asyncio
+    async def test_context_manager_warms_up_connection(self):
+        """Test entering the context pre-connects with a health request."""
+        client = MonitorXClient()
+
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            async with client:
+                await client._warmup_task
+
+        mock_get.assert_called_once_with("http://localhost:8000/api/v1/health")
+
+    @pytest.mark.asyncio
+    async def test_session_reopened_on_reentry(self):
+        """Test a client can be used in a second context after the first closes it."""
+        client = MonitorXClient()
+        first_session = client.session
+
+        async with client:
+            pass
+
+        async with client as c:
+            assert c.session is not first_session
+            assert not c.session.is_closed
+
+    @pytest.mark.asyncio
+    async def test_session_reopened_after_close(self, sample_model_config):
+        """Test a closed client reconnects on its next request instead of failing."""
+        client = MonitorXClient()
+        await client.close()
+
+        with patch('httpx.AsyncClient.post', new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = Mock(status_code=200, raise_for_status=Mock())
+            result = await client.register_model(sample_model_config)
+
+        assert result is True
+        assert not client.session.is_closed
+        await client.close()
 
     @pytest.mark.asyncio
     async def test_register_model_success(self, client, sample_model_config):
@@ -101,9 +239,16 @@ class TestMonitorXClient:
 
             # Check payload
             call_args = mock_post.call_args
-            payload = call_args[1]['json']
+            payload = orjson.loads(call_args[1]['content'])
             assert payload['id'] == "test-model"
             assert payload['name'] == "Test Model"
+            assert payload['thresholds'] == {
+                "latency": sample_model_config.thresholds.latency,
+                "error_rate": sample_model_config.thresholds.error_rate,
+                "gpu_memory": sample_model_config.thresholds.gpu_memory,
+                "cpu_usage": sample_model_config.thresholds.cpu_usage,
+                "memory_usage": sample_model_config.thresholds.memory_usage,
+            }
 
     @pytest.mark.asyncio
     async def test_register_model_failure(self, client, sample_model_config):
@@ -152,10 +297,18 @@ class TestMonitorXClient:
 
             # Check that request_id was generated
             call_args = mock_post.call_args
-            payload = call_args[1]['json']
+            payload = orjson.loads(call_args[1]['content'])
             assert 'request_id' in payload
             assert len(payload['request_id']) > 0
 
+    def test_new_request_ids_are_unique_hex(self):
+        """Test generated request IDs are 32 hex characters and do not repeat."""
+        ids = {new_request_id() for _ in range(1000)}
+
+        assert len(ids) == 1000
+        assert all(len(request_id) == 32 for request_id in ids)
+        assert all(int(request_id, 16) >= 0 for request_id in ids)
+
     @pytest.mark.asyncio
     async def test_collect_inference_metric_with_resource_usage(self, client):
         """Test collecting metric with resource usage."""
@@ -181,7 +334,7 @@ class TestMonitorXClient:
 
             # Check payload
             call_args = mock_post.call_args
-            payload = call_args[1]['json']
+            payload = orjson.loads(call_args[1]['content'])
             assert 'resource_usage' in payload
             assert payload['resource_usage']['gpu_memory'] == 0.7
 
@@ -210,11 +363,11 @@ class TestMonitorXClient:
         with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_response = Mock()
             mock_response.raise_for_status = Mock()
-            mock_response.json.return_value = {
+            mock_response.content = orjson.dumps({
                 "total_requests": 100,
                 "average_latency": 500.0,
                 "error_rate": 0.02
-            }
+            })
             mock_get.return_value = mock_response
 
             stats = await client.get_summary_stats(model_id="test-model", since_hours=24)
@@ -239,7 +392,7 @@ class TestMonitorXClient:
         with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_response = Mock()
             mock_response.raise_for_status = Mock()
-            mock_response.json.return_value = [
+            mock_response.content = orjson.dumps([
                 {
                     "id": "alert-1",
                     "model_id": "test-model",
@@ -248,7 +401,7 @@ class TestMonitorXClient:
                     "message": "High latency",
                     "resolved": False
                 }
-            ]
+            ])
             mock_get.return_value = mock_response
 
             alerts = await client.get_alerts(model_id="test-model", resolved=False)
@@ -263,7 +416,7 @@ class TestMonitorXClient:
         with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_response = Mock()
             mock_response.raise_for_status = Mock()
-            mock_response.json.return_value = []
+            mock_response.content = orjson.dumps([])
             mock_get.return_value = mock_response
 
             await client.get_alerts(
@@ -308,11 +461,11 @@ class TestMonitorXClient:
         with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_response = Mock()
             mock_response.raise_for_status = Mock()
-            mock_response.json.return_value = {
+            mock_response.content = orjson.dumps({
                 "status": "healthy",
                 "version": "0.1.0",
                 "services": {"api": "healthy"}
-            }
+            })
             mock_get.return_value = mock_response
 
             health = await client.health_check()
@@ -356,3 +509,344 @@ class TestMonitorXClient:
 
             # Both calls should use the session
             assert mock_post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_collect_inference_metric_via_udp_sink(self):
+        """Test a sink_url sends the metric as one datagram without any HTTP request."""
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(1.0)
+        port = receiver.getsockname()[1]
+
+        client = MonitorXClient(sink_url=f"udp://127.0.0.1:{port}")
+        try:
+            with patch('httpx.AsyncClient.post', new_callable=AsyncMock) as mock_post:
+                result = await client.collect_inference_metric(
+                    model_id="test-model",
+                    model_type="llm",
+                    latency=500.0
+                )
+
+            payload = orjson.loads(receiver.recv(65535))
+        finally:
+            receiver.close()
+            await client.close()
+
+        assert result is True
+        mock_post.assert_not_called()
+        assert payload["model_id"] == "test-model"
+        assert payload["latency"] == 500.0
+
+    def test_invalid_sink_url(self):
+        """Test an unsupported sink URL is rejected at construction."""
+        with pytest.raises(ValueError, match="Unsupported sink URL"):
+            MonitorXClient(sink_url="tcp://localhost:9000")
+
+
+class TestEventLoopPolicy:
+    """Test the optional uvloop event loop policy."""
+
+    def test_install_without_uvloop(self):
+        """Test the helper leaves the policy alone when uvloop is unavailable."""
+        policy = asyncio.get_event_loop_policy()
+
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert install_event_loop_policy() is False
+
+        assert asyncio.get_event_loop_policy() is policy
+
+    def test_install_with_uvloop(self):
+        """Test the helper installs the uvloop policy when uvloop is importable."""
+        policy = asyncio.get_event_loop_policy()
+        uvloop_policy = asyncio.DefaultEventLoopPolicy()
+        fake_uvloop = Mock(EventLoopPolicy=Mock(return_value=uvloop_policy))
+
+        try:
+            with patch.dict(sys.modules, {"uvloop": fake_uvloop}), \
+                 patch.object(sys, "platform", "linux"):
+                assert install_event_loop_policy() is True
+            assert asyncio.get_event_loop_policy() is uvloop_policy
+        finally:
+            asyncio.set_event_loop_policy(policy)
+
+
+class TestSyncDecorators:
+    """Test metric submission from decorated sync functions."""
+
+    def test_sync_function_submits_in_background(self):
+        """Test a sync function without an event loop hands its metric to the background loop."""
+        client = MonitorXClient()
+        sent = threading.Event()
+
+        async def collect(**kwargs):
+            sent.set()
+            return True
+
+        @monitor_inference(model_id="test-model", model_type="llm")
+        def predict(x):
+            return x * 2
+
+        with patch.object(client, 'collect_inference_metric', side_effect=collect) as mock_collect:
+            with MonitorXContext(client):
+                assert predict(21) == 42
+            assert sent.wait(timeout=5)
+
+        assert mock_collect.call_args[1]["model_id"] == "test-model"
+        assert mock_collect.call_args[1]["tags"]["function_name"] == "predict"
+
+    @pytest.mark.asyncio
+    async def test_sync_function_called_from_async_code(self):
+        """Test a sync function called inside a running loop schedules its metric there."""
+        client = MonitorXClient()
+
+        @monitor_inference(model_id="test-model", model_type="llm")
+        def predict(x):
+            return x * 2
+
+        with patch.object(client, 'collect_inference_metric',
+                         new_callable=AsyncMock) as mock_collect:
+            with MonitorXContext(client):
+                assert predict(21) == 42
+            await asyncio.sleep(0)
+
+        mock_collect.assert_awaited_once()
+        await client.close()
+
+
+    def test_background_sends_between_event_loops(self):
+        """Test sync metrics sent between two asyncio.run() calls all reach the server."""
+        posted = []
+
+        @monitor_inference(model_id="test-model", model_type="llm")
+        def predict(x):
+            return x * 2
+
+        with _mock_transport_client(posted, expected=3) as (client, done):
+            assert asyncio.run(client.health_check())["status"] == "healthy"
+            with MonitorXContext(client):
+                for x in range(3):
+                    predict(x)
+            assert done.wait(timeout=5)
+            assert asyncio.run(client.health_check())["status"] == "healthy"
+
+        assert [metric["model_id"] for metric in posted] == ["test-model"] * 3
+
+    @pytest.mark.asyncio
+    async def test_background_sends_keep_the_app_pool(self):
+        """Test sends on the background loop don't take over the pool of a running loop."""
+        posted = []
+
+        @monitor_inference(model_id="test-model", model_type="llm")
+        def predict(x):
+            return x * 2
+
+        with _mock_transport_client(posted, expected=1) as (client, done):
+            assert (await client.health_check())["status"] == "healthy"
+            app_session = client.session
+            with MonitorXContext(client):
+                # No event loop in the worker thread, so the background loop sends it
+                await asyncio.to_thread(predict, 21)
+            assert await asyncio.to_thread(done.wait, 5)
+
+            assert client.session is app_session
+            assert (await client.health_check())["status"] == "healthy"
+            await client.close()
+
+    def test_pending_submissions_drained_at_exit(self):
+        """Test the exit hook waits for sends still running on the background loop."""
+        client = MonitorXClient()
+        sent = []
+
+        async def slow_collect(**kwargs):
+            await asyncio.sleep(0.1)
+            sent.append(kwargs["model_id"])
+            return True
+
+        @monitor_inference(model_id="test-model", model_type="llm")
+        def predict(x):
+            return x * 2
+
+        with patch.object(client, 'collect_inference_metric', side_effect=slow_collect):
+            with MonitorXContext(client):
+                predict(21)
+            _drain_pending_submissions()
+
+        assert sent == ["test-model"]
+
+    @pytest.mark.asyncio
+    async def test_latency_from_monotonic_clock(self):
+        """Test latency is the nanosecond clock delta converted to milliseconds."""
+        client = MonitorXClient()
+
+        @monitor_inference(model_id="test-model", model_type="llm")
+        def predict(x):
+            return x * 2
+
+        with patch('monitorx.sdk.decorators._now', side_effect=[1_000_000, 3_500_000]), \
+             patch.object(client, 'collect_inference_metric',
+                          new_callable=AsyncMock) as mock_collect:
+            with MonitorXContext(client):
+                predict(21)
+            await asyncio.sleep(0)
+
+        assert mock_collect.call_args[1]["latency"] == 2.5
+        await client.close()
+
+
+class TestDriftDecorator:
+    """Test drift reporting from decorated functions."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("result,severity", [
+        ({"drift_score": 0.95, "confidence": 0.1}, "critical"),
+        ({"anomaly_score": 0.85}, "high"),
+        (0.75, "medium"),
+    ])
+    async def test_reports_score_at_or_above_threshold(self, result, severity):
+        """Test the first drift score found decides both reporting and severity."""
+        client = MonitorXClient()
+
+        @monitor_drift(model_id="test-model", threshold=0.7)
+        async def detect():
+            return result
+
+        with patch.object(client, 'collect_drift_metric',
+                         new_callable=AsyncMock) as mock_collect:
+            with MonitorXContext(client):
+                await detect()
+
+        assert mock_collect.call_args[1]["severity"] == severity
+        await client.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("result", [{"drift_score": 0.5}, {"other": 0.99}, "drift"])
+    async def test_skips_low_or_missing_score(self, result):
+        """Test results below threshold or without a score are not reported."""
+        client = MonitorXClient()
+
+        @monitor_drift(model_id="test-model", threshold=0.7)
+        async def detect():
+            return result
+
+        with patch.object(client, 'collect_drift_metric',
+                         new_callable=AsyncMock) as mock_collect:
+            with MonitorXContext(client):
+                await detect()
+
+        mock_collect.assert_not_awaited()
+        await client.close()
+
+
+class TestQueryCache:
+    """Test the client-side cache for summary stats and alerts."""
+
+    @staticmethod
+    def _response(body):
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.content = orjson.dumps(body)
+        return response
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_is_cached(self, client):
+        """Test a second identical query within the TTL makes no request."""
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = self._response({"total_requests": 100})
+
+            first = await client.get_summary_stats(model_id="test-model")
+            second = await client.get_summary_stats(model_id="test-model")
+            await client.get_summary_stats(model_id="other-model")
+
+        assert first == second == {"total_requests": 100}
+        assert mock_get.call_count == 2
+        assert client.cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_a_copy(self, client):
+        """Test changing a returned result doesn't change what later calls get."""
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = self._response([{"id": "a1"}, {"id": "a2"}])
+
+            first = await client.get_alerts(model_id="m")
+            first.pop()
+            first[0]["id"] = "changed"
+            second = await client.get_alerts(model_id="m")
+
+        assert second == [{"id": "a1"}, {"id": "a2"}]
+        assert mock_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_request(self, client):
+        """Test identical queries in flight at the same time share one request."""
+        async def slow_get(url, params=None):
+            await asyncio.sleep(0.01)
+            return self._response([])
+
+        with patch('httpx.AsyncClient.get', side_effect=slow_get) as mock_get:
+            results = await asyncio.gather(*(client.get_alerts(model_id="m") for _ in range(5)))
+
+        assert results == [[]] * 5
+        assert mock_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_queries_on_another_event_loop_make_their_own_request(self, client):
+        """Test a query in flight on one loop isn't awaited from another loop."""
+        release = threading.Event()
+
+        async def slow_get(url, params=None):
+            if threading.current_thread() is threading.main_thread():
+                await asyncio.to_thread(release.wait, 5)
+            return self._response([])
+
+        with patch('httpx.AsyncClient.get', side_effect=slow_get) as mock_get:
+            in_flight = asyncio.ensure_future(client.get_alerts(model_id="m"))
+            await asyncio.sleep(0)
+            other_loop = await asyncio.to_thread(asyncio.run, client.get_alerts(model_id="m"))
+            release.set()
+            this_loop = await in_flight
+
+        assert this_loop == other_loop == []
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_query_is_not_cached(self, client):
+        """Test a failed request is retried by the next call."""
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = [
+                httpx.HTTPError("Network error"),
+                self._response({"total_requests": 1})
+            ]
+
+            assert await client.get_summary_stats() == {}
+            assert await client.get_summary_stats() == {"total_requests": 1}
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resolve_alert_invalidates_cached_alerts(self, client):
+        """Test resolving an alert drops cached alert lists."""
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get, \
+             patch('httpx.AsyncClient.post', new_callable=AsyncMock) as mock_post:
+            mock_get.return_value = self._response([])
+            mock_post.return_value = self._response({"status": "success"})
+
+            await client.get_alerts()
+            await client.resolve_alert("alert-1")
+            await client.get_alerts()
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self):
+        """Test cache_ttl=0 sends every query."""
+        client = MonitorXClient(cache_ttl=0)
+
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = self._response({})
+
+            await client.get_summary_stats()
+            await client.get_summary_stats()
+
+        assert mock_get.call_count == 2
+        assert client.cache_stats()["size"] == 0
+        await client.close()
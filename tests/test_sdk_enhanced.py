@@ -16,10 +16,12 @@
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import httpx
+import orjson
 import asyncio
+from loguru import logger
 
 from monitorx.sdk.client import MonitorXClient, CircuitBreaker
-from monitorx.types import InferenceMetric, DriftMetric
+from monitorx.types import InferenceMetric, DriftMetric, ResourceUsage
 
 
 @pytest.fixture
@@ -103,29 +105,72 @@ class TestCircuitBreaker:
         assert result == "success"
         assert cb.state == "closed"
 
+    @pytest.mark.asyncio
+    async def test_closed_circuit_breaker_skips_clock(self):
+        """Test a successful call through a closed breaker never reads the clock."""
+        cb = CircuitBreaker()
+
+        async def success_func():
+            return "success"
+
+        with patch('monitorx.sdk.circuit_breaker.time.monotonic') as mock_monotonic:
+            assert await cb.call_async(success_func) == "success"
+
+        mock_monotonic.assert_not_called()
+
 
 class TestBatchCollection:
     """Test batch metric collection."""
 
     @pytest.mark.asyncio
     async def test_batch_inference_metrics_success(self, client):
-        """Test successful batch metric collection."""
+        """Test a batch is sent as a single request to the batch endpoint."""
         metrics = [
             {"model_id": "model-1", "model_type": "llm", "latency": 100.0},
             {"model_id": "model-2", "model_type": "cv", "latency": 50.0},
             {"model_id": "model-3", "model_type": "tabular", "latency": 25.0},
         ]
 
-        with patch.object(client, '_collect_inference_metric_request_with_retry',
-                         new_callable=AsyncMock) as mock_collect:
-            mock_collect.return_value = True
+        with patch('httpx.AsyncClient.post', new_callable=AsyncMock) as mock_post:
+            mock_response = Mock()
+            mock_response.status_code = 202
+            mock_response.raise_for_status = Mock()
+            mock_response.content = orjson.dumps({"status": "success", "accepted": 3, "rejected": 0})
+            mock_post.return_value = mock_response
 
             async with client:
                 result = await client.collect_inference_metrics_batch(metrics)
 
             assert result["success"] == 3
             assert result["failed"] == 0
-            assert mock_collect.call_count == 3
+            mock_post.assert_called_once()
+            assert mock_post.call_args[0][0] == "http://localhost:8000/api/v1/metrics/inference/batch"
+            assert len(orjson.loads(mock_post.call_args[1]['content'])["metrics"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_large_batch_is_streamed(self, client):
+        """Test a large batch body is streamed in chunks that form valid JSON."""
+        metrics = [
+            {"model_id": f"model-{i}", "model_type": "llm", "latency": 100.0}
+            for i in range(150)
+        ]
+        chunks = []
+
+        async def fake_post(url, content):
+            async for chunk in content:
+                chunks.append(chunk)
+            response = Mock()
+            response.status_code = 202
+            response.content = orjson.dumps({"status": "success", "accepted": 150, "rejected": 0})
+            return response
+
+        with patch.object(client.session, 'post', side_effect=fake_post):
+            result = await client.collect_inference_metrics_batch(metrics)
+
+        assert result == {"success": 150, "failed": 0}
+        assert len(chunks) > 3
+        body = orjson.loads(b"".join(chunks))
+        assert [m["model_id"] for m in body["metrics"]] == [f"model-{i}" for i in range(150)]
 
     @pytest.mark.asyncio
     async def test_batch_empty_list(self, client):
@@ -136,8 +181,49 @@ class TestBatchCollection:
         assert result["failed"] == 0
 
     @pytest.mark.asyncio
-    async def test_batch_with_failures(self, client):
-        """Test batch collection with some failures."""
+    async def test_batch_with_rejections(self, client):
+        """Test metrics rejected by the server are counted as failed."""
+        metrics = [
+            {"model_id": "model-1", "model_type": "llm", "latency": 100.0},
+            {"model_id": "model-2", "model_type": "cv", "latency": 50.0},
+        ]
+
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.return_value = {"success": 1, "failed": 1}
+
+            async with client:
+                result = await client.collect_inference_metrics_batch(metrics)
+
+            assert result["success"] == 1
+            assert result["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_without_batch_endpoint(self, client):
+        """Test a server without the batch endpoint gets one request per metric."""
+        metrics = [
+            {"model_id": "model-1", "model_type": "llm", "latency": 100.0},
+            {"model_id": "model-2", "model_type": "cv", "latency": 50.0},
+        ]
+
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk, \
+             patch.object(client, '_collect_inference_metric_request_with_retry',
+                         new_callable=AsyncMock) as mock_collect:
+            mock_bulk.return_value = None
+            mock_collect.return_value = True
+
+            async with client:
+                result = await client.collect_inference_metrics_batch(metrics)
+
+            assert result["success"] == 2
+            assert mock_collect.call_count == 2
+            assert client.use_batch_endpoint is False
+
+    @pytest.mark.asyncio
+    async def test_batch_with_failures(self):
+        """Test per-metric batch collection with some failures."""
+        client = MonitorXClient(base_url="http://localhost:8000", use_batch_endpoint=False)
         metrics = [
             {"model_id": "model-1", "model_type": "llm", "latency": 100.0},
             {"model_id": "model-2", "model_type": "cv", "latency": 50.0},
@@ -154,6 +240,51 @@ class TestBatchCollection:
             assert result["success"] == 1
             assert result["failed"] == 1
 
+    @pytest.mark.asyncio
+    async def test_batch_fanout_concurrency_is_bounded(self):
+        """Test per-metric requests never exceed max_concurrency in flight."""
+        client = MonitorXClient(use_batch_endpoint=False, max_concurrency=4)
+        metrics = [
+            {"model_id": f"model-{i}", "model_type": "llm", "latency": 100.0}
+            for i in range(20)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def slow_collect(session, metric):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        with patch.object(client, '_collect_inference_metric_request_with_retry',
+                         side_effect=slow_collect):
+            result = await client.collect_inference_metrics_batch(metrics)
+
+        assert result == {"success": 20, "failed": 0}
+        assert peak == 4
+
+    def test_batch_fanout_across_event_loops(self):
+        """Test the concurrency cap works under successive asyncio.run() calls."""
+        client = MonitorXClient(use_batch_endpoint=False, max_concurrency=1)
+        metrics = [
+            {"model_id": f"model-{i}", "model_type": "llm", "latency": 100.0}
+            for i in range(3)
+        ]
+
+        async def slow_collect(session, metric):
+            await asyncio.sleep(0.01)
+            return True
+
+        with patch.object(client, '_collect_inference_metric_request_with_retry',
+                         side_effect=slow_collect):
+            first = asyncio.run(client.collect_inference_metrics_batch(metrics))
+            second = asyncio.run(client.collect_inference_metrics_batch(metrics))
+
+        assert first == second == {"success": 3, "failed": 0}
+
     @pytest.mark.asyncio
     async def test_batch_generates_request_ids(self, client):
         """Test batch collection auto-generates request IDs."""
@@ -161,17 +292,59 @@ class TestBatchCollection:
             {"model_id": "model-1", "model_type": "llm", "latency": 100.0},
         ]
 
-        with patch.object(client, '_collect_inference_metric_request_with_retry',
-                         new_callable=AsyncMock) as mock_collect:
-            mock_collect.return_value = True
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.return_value = {"success": 1, "failed": 0}
 
             async with client:
                 await client.collect_inference_metrics_batch(metrics)
 
             # Check that metric has request_id
-            call_args = mock_collect.call_args[0]
-            metric = call_args[1]  # Second argument is the metric
-            assert metric.request_id is not None
+            payload = mock_bulk.call_args[0][1]  # Second argument is the payload
+            assert payload["metrics"][0]["request_id"]
+
+    @pytest.mark.asyncio
+    async def test_drift_batch_uses_batch_endpoint(self, client):
+        """Test a drift batch goes out as one request."""
+        metrics = [
+            {"model_id": "model-1", "drift_type": "data", "severity": "low", "confidence": 0.6},
+            {"model_id": "model-2", "drift_type": "concept", "severity": "high", "confidence": 0.9},
+        ]
+
+        with patch.object(client, '_collect_drift_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.return_value = {"success": 2, "failed": 0}
+
+            async with client:
+                result = await client.collect_drift_metrics_batch(metrics)
+
+            assert result == {"success": 2, "failed": 0}
+            payload = mock_bulk.call_args[0][1]
+            assert payload["metrics"][1]["severity"] == "high"
+            assert payload["metrics"][0]["tags"] == {}
+
+    @pytest.mark.asyncio
+    async def test_drift_batch_falls_back_without_batch_endpoint(self, client):
+        """Test a server without the drift batch endpoint gets one request per metric."""
+        metrics = [
+            {"model_id": "model-1", "drift_type": "data", "severity": "low", "confidence": 0.6},
+            {"model_id": "model-2", "drift_type": "concept", "severity": "high", "confidence": 0.9},
+        ]
+
+        with patch.object(client, '_collect_drift_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk, \
+             patch.object(client, '_collect_drift_metric_request_with_retry',
+                         new_callable=AsyncMock) as mock_collect:
+            mock_bulk.return_value = None
+            mock_collect.side_effect = [True, False]
+
+            async with client:
+                result = await client.collect_drift_metrics_batch(metrics)
+
+            assert result == {"success": 1, "failed": 1}
+            assert client._drift_batch_endpoint is False
+            # Inference batches still use their own endpoint
+            assert client.use_batch_endpoint is True
 
 
 class TestRetryWithBackoff:
@@ -235,6 +408,35 @@ class TestRetryWithBackoff:
             assert success is False
             assert mock_collect.call_count == client.max_retries
 
+    @pytest.mark.asyncio
+    async def test_retry_backoff_is_jittered_and_capped(self):
+        """Test backoffs stay between retry_backoff and max_backoff."""
+        client = MonitorXClient(
+            max_retries=6, retry_backoff=1.0, max_backoff=5.0, enable_circuit_breaker=False
+        )
+        failing_func = AsyncMock(side_effect=Exception("Network error"))
+
+        with patch('monitorx.sdk.client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(Exception, match="Network error"):
+                await client._retry_with_backoff(failing_func)
+
+        backoffs = [call[0][0] for call in mock_sleep.call_args_list]
+        assert len(backoffs) == 5
+        assert all(1.0 <= backoff <= 5.0 for backoff in backoffs)
+        assert backoffs[0] <= 3.0
+
+    @pytest.mark.asyncio
+    async def test_retry_failures_open_circuit_breaker(self, client):
+        """Test failures on the closed-breaker fast path still open the breaker."""
+        client.circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+        failing_func = AsyncMock(side_effect=Exception("Network error"))
+
+        with pytest.raises(Exception, match="Circuit breaker is OPEN"):
+            await client._retry_with_backoff(failing_func)
+
+        assert client.circuit_breaker.state == "open"
+        assert failing_func.call_count == 2
+
 
 class TestBuffering:
     """Test metric buffering for offline scenarios."""
@@ -250,6 +452,17 @@ class TestBuffering:
         client.disable_buffering()
         assert client.buffer_enabled is False
 
+    def test_buffer_debug_log_formats_lazily(self, client):
+        """Test deferred-format debug messages still render with their arguments."""
+        messages = []
+        handler_id = logger.add(messages.append, level="DEBUG", format="{message}")
+        try:
+            client.buffer_inference_metric(model_id="test-model", model_type="llm", latency=100.0)
+        finally:
+            logger.remove(handler_id)
+
+        assert "Buffered inference metric for model test-model\n" in messages
+
     @pytest.mark.asyncio
     async def test_metrics_buffered_when_enabled(self, client):
         """Test metrics are buffered when buffering is enabled."""
@@ -296,6 +509,7 @@ class TestBuffering:
         assert client.get_buffer_size() == 1
 
         # Mock the collection to succeed
+        client.use_batch_endpoint = False
         with patch.object(client, '_collect_inference_metric_request',
                          new_callable=AsyncMock) as mock_collect:
             mock_collect.return_value = True
@@ -325,6 +539,307 @@ class TestBuffering:
         # Should only keep last 5
         assert client.get_buffer_size() == 5
 
+    @pytest.mark.asyncio
+    async def test_buffer_inference_metric_is_sync(self, client):
+        """Test metrics can be appended to the buffer without awaiting."""
+        client.buffer_inference_metric(
+            model_id="test-model",
+            model_type="llm",
+            latency=100.0,
+            resource_usage=ResourceUsage(gpu_memory=0.5)
+        )
+
+        assert client.get_buffer_size() == 1
+        assert client._inference_buffer[0].request_id
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_failed_metrics(self, client):
+        """Test metrics that fail to send stay buffered in order."""
+        for i in range(3):
+            client.buffer_inference_metric(
+                model_id=f"model-{i}",
+                model_type="llm",
+                latency=100.0
+            )
+
+        client.use_batch_endpoint = False
+        with patch.object(client, '_collect_inference_metric_request',
+                         new_callable=AsyncMock) as mock_collect:
+            mock_collect.side_effect = [False, True, False]
+
+            result = await client.flush_buffer()
+
+        assert result == {"flushed": 1, "failed": 2}
+        assert [m.model_id for m in client._inference_buffer] == ["model-0", "model-2"]
+
+    @pytest.mark.asyncio
+    async def test_flush_restores_resource_usage(self, client):
+        """Test buffered metrics keep their resource usage object until sent."""
+        client.buffer_inference_metric(
+            model_id="test-model",
+            model_type="llm",
+            latency=100.0,
+            resource_usage=ResourceUsage(gpu_memory=0.5)
+        )
+
+        client.use_batch_endpoint = False
+        with patch.object(client, '_collect_inference_metric_request',
+                         new_callable=AsyncMock) as mock_collect:
+            mock_collect.return_value = True
+
+            await client.flush_buffer()
+
+        metric = mock_collect.call_args[0][1]
+        assert isinstance(metric.resource_usage, ResourceUsage)
+        assert metric.resource_usage.gpu_memory == 0.5
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_buffered_drift_metrics(self, client):
+        """Test drift metrics are buffered apart from inference metrics and flushed."""
+        client.enable_buffering()
+        client.use_batch_endpoint = False
+
+        with patch.object(client, '_collect_drift_metric_request',
+                         new_callable=AsyncMock) as mock_collect:
+            mock_collect.side_effect = Exception("Network error")
+            await client.collect_drift_metric(
+                model_id="test-model",
+                drift_type="data",
+                severity="high",
+                confidence=0.9
+            )
+
+        assert len(client._drift_buffer) == 1
+        assert client.get_buffer_size() == 1
+
+        with patch.object(client, '_collect_drift_metric_request',
+                         new_callable=AsyncMock) as mock_collect:
+            mock_collect.return_value = True
+            result = await client.flush_buffer()
+
+        assert result == {"flushed": 1, "failed": 0}
+        assert isinstance(mock_collect.call_args[0][1], DriftMetric)
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_drift_metrics_to_batch_endpoint(self, client):
+        """Test buffered drift metrics are flushed through the drift batch endpoint."""
+        client.enable_buffering()
+        await client.collect_drift_metrics_batch([
+            {"model_id": "model-1", "drift_type": "data", "severity": "low", "confidence": 0.6},
+            {"model_id": "model-2", "drift_type": "concept", "severity": "high", "confidence": 0.9},
+        ])
+        assert len(client._drift_buffer) == 2
+
+        with patch.object(client, '_collect_drift_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.return_value = {"success": 2, "failed": 0}
+            result = await client.flush_buffer()
+
+        assert result == {"flushed": 2, "failed": 0}
+        payload = mock_bulk.call_args[0][1]
+        assert [m["model_id"] for m in payload["metrics"]] == ["model-1", "model-2"]
+        assert client.get_buffer_size() == 0
+
+    @pytest.mark.asyncio
+    async def test_auto_flush_in_background(self, client):
+        """Test buffered metrics are flushed by the background task."""
+        client.enable_buffering(auto_flush_interval=0.05)
+        client.use_batch_endpoint = False
+
+        with patch.object(client, '_collect_inference_metric_request',
+                         new_callable=AsyncMock) as mock_collect:
+            mock_collect.return_value = True
+
+            client.buffer_inference_metric(
+                model_id="test-model",
+                model_type="llm",
+                latency=100.0
+            )
+            await asyncio.sleep(0.2)
+
+        client.disable_buffering()
+
+        assert client.get_buffer_size() == 0
+        assert mock_collect.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_chunks_to_batch_endpoint(self):
+        """Test buffered inference metrics are flushed in chunked batch requests."""
+        client = MonitorXClient(buffer_size=1000)
+        for i in range(300):
+            client.buffer_inference_metric(
+                model_id=f"model-{i}",
+                model_type="llm",
+                latency=100.0
+            )
+
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.side_effect = [
+                {"success": 256, "failed": 0},
+                {"success": 43, "failed": 1},
+            ]
+
+            result = await client.flush_buffer()
+
+        assert result == {"flushed": 299, "failed": 1}
+        assert [len(call[0][1]["metrics"]) for call in mock_bulk.call_args_list] == [256, 44]
+        assert client.get_buffer_size() == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_stops_when_batch_request_fails(self):
+        """Test an unreachable server leaves the whole buffer in place."""
+        client = MonitorXClient(buffer_size=1000)
+        for i in range(300):
+            client.buffer_inference_metric(
+                model_id=f"model-{i}",
+                model_type="llm",
+                latency=100.0
+            )
+
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.side_effect = httpx.ConnectError("Connection refused")
+
+            result = await client.flush_buffer()
+
+        assert mock_bulk.call_count == 1
+        assert result == {"flushed": 0, "failed": 256}
+        assert client.get_buffer_size() == 300
+        assert client._inference_buffer[0].model_id == "model-0"
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_keeps_metrics_ahead_of_new_ones(self):
+        """Test unsent metrics go back in order ahead of metrics buffered mid-flush."""
+        client = MonitorXClient(buffer_size=1000)
+        for i in range(300):
+            client.buffer_inference_metric(
+                model_id=f"model-{i}",
+                model_type="llm",
+                latency=100.0
+            )
+
+        async def failing_bulk(session, payload):
+            # The buffer is already empty while the chunk is in flight
+            assert client.get_buffer_size() == 0
+            client.buffer_inference_metric(model_id="late", model_type="llm", latency=100.0)
+            raise httpx.ConnectError("Connection refused")
+
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         side_effect=failing_bulk):
+            result = await client.flush_buffer()
+
+        assert result == {"flushed": 0, "failed": 256}
+        assert [m.model_id for m in client._inference_buffer] == (
+            [f"model-{i}" for i in range(300)] + ["late"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_buffered_metrics(self, client):
+        """Test leaving the context sends metrics still in the buffer."""
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.return_value = {"success": 2, "failed": 0}
+
+            async with client:
+                client.enable_buffering(auto_flush_interval=60.0)
+                for i in range(2):
+                    client.buffer_inference_metric(
+                        model_id=f"model-{i}",
+                        model_type="llm",
+                        latency=100.0
+                    )
+
+        assert mock_bulk.call_count == 1
+        assert client.get_buffer_size() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_puts_metrics_back(self, client):
+        """Test cancelling a flush mid-send leaves its metrics in the buffer."""
+        for i in range(3):
+            client.buffer_inference_metric(model_id=f"model-{i}", model_type="llm", latency=100.0)
+
+        async def hanging_bulk(session, payload):
+            await asyncio.sleep(60)
+
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         side_effect=hanging_bulk):
+            task = asyncio.create_task(client.flush_buffer())
+            await asyncio.sleep(0.01)
+            assert client.get_buffer_size() == 0
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert [m.model_id for m in client._inference_buffer] == ["model-0", "model-1", "model-2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_flush_is_skipped(self, client):
+        """Test a flush started while another is in flight does not send anything."""
+        client.buffer_inference_metric(
+            model_id="test-model",
+            model_type="llm",
+            latency=100.0
+        )
+
+        async def slow_bulk(session, payload):
+            await asyncio.sleep(0.05)
+            return {"success": len(payload["metrics"]), "failed": 0}
+
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         side_effect=slow_bulk) as mock_bulk:
+            first, second = await asyncio.gather(client.flush_buffer(), client.flush_buffer())
+
+        assert first == {"flushed": 1, "failed": 0}
+        assert second == {"flushed": 0, "failed": 0, "skipped": True}
+        assert mock_bulk.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_auto_flush_at_high_watermark(self):
+        """Test the background task flushes early once the buffer is 80% full."""
+        client = MonitorXClient(buffer_size=10)
+        client.enable_buffering(auto_flush_interval=60.0)
+
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.return_value = {"success": 8, "failed": 0}
+
+            for i in range(8):
+                client.buffer_inference_metric(
+                    model_id=f"model-{i}",
+                    model_type="llm",
+                    latency=100.0
+                )
+            await asyncio.sleep(0.05)
+
+        await client.close()
+
+        assert mock_bulk.call_count == 1
+        assert client.get_buffer_size() == 0
+
+    @pytest.mark.asyncio
+    async def test_high_watermark_from_another_thread(self):
+        """Test metrics buffered on another thread wake the flush task thread-safely."""
+        # Debug mode makes non-thread-safe calls into the loop raise
+        asyncio.get_running_loop().set_debug(True)
+        client = MonitorXClient(buffer_size=10)
+        client.enable_buffering(auto_flush_interval=60.0)
+
+        def buffer_from_thread():
+            for i in range(8):
+                client.buffer_inference_metric(model_id=f"model-{i}", model_type="llm", latency=100.0)
+
+        with patch.object(client, '_collect_inference_metrics_bulk_request',
+                         new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.return_value = {"success": 8, "failed": 0}
+
+            await asyncio.to_thread(buffer_from_thread)
+            await asyncio.sleep(0.05)
+
+        await client.close()
+
+        assert mock_bulk.call_count == 1
+        assert client.get_buffer_size() == 0
+
     @pytest.mark.asyncio
     async def test_failed_request_auto_buffers(self, client):
         """Test failed requests are auto-buffered when buffering enabled."""
@@ -346,6 +861,28 @@ class TestBuffering:
         # Failed metric should be in buffer
         assert client.get_buffer_size() > 0
 
+    @pytest.mark.asyncio
+    async def test_retry_failure_buffers_metric_object(self, client):
+        """Test a metric that exhausts its retries is buffered as-is, without copying."""
+        client.enable_buffering()
+        metric = InferenceMetric(
+            model_id="test-model",
+            model_type="llm",
+            request_id="req-1",
+            latency=100.0,
+            resource_usage=ResourceUsage(gpu_memory=0.5)
+        )
+
+        with patch.object(client, '_collect_inference_metric_request',
+                         new_callable=AsyncMock) as mock_collect, \
+             patch('monitorx.sdk.client.asyncio.sleep', new_callable=AsyncMock):
+            mock_collect.side_effect = Exception("Network error")
+
+            sent = await client._collect_inference_metric_request_with_retry(client.session, metric)
+
+        assert sent is False
+        assert client._inference_buffer[-1] is metric
+
 
 class TestEnhancedClientIntegration:
     """Integration tests for enhanced client features."""